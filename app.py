@@ -4,9 +4,17 @@ from src.scrapers.website_one_scraper import WebsiteOneScraper
 from src.scrapers.website_two_scraper import WebsiteTwoScraper
 from src.scrapers.website_three_scraper import WebsiteThreeScraper
 from src.scrapers.website_four_scraper import WebsiteFourScraper
-from src.summarizer.openai_summarizer import OpenAISummarizer
+from src.scrapers.scraper_base import Scraper
+from src.scrapers.crawl_cache import get_crawl_cache
+from src.summarizer.pipeline import get_summary_pipeline
+from src.summarizer.summarizer_base import ERROR_PREFIX
 import concurrent.futures
-from src.utils.email_service import send_email_report
+import queue
+import time
+from src.utils.email_service import email_job_status, queue_email_report
+from src.utils.article_store import get_article_store
+from src.utils.keyword_matcher import get_matcher
+from src.utils.text_processing import deduplicate_articles
 
 st.set_page_config(
     page_title="Noticias Mineras México",
@@ -31,6 +39,15 @@ DEFAULT_KEYWORDS = "oro, cobre, plata, zinc, litio, abrir, acero, aluminio, ceme
 # Define keyword tags to display (can be the same as DEFAULT_KEYWORDS but split into a list)
 KEYWORD_TAGS = ["minería", "oro", "plata", "cobre", "proyecto", "exploración", "inversión"]
 
+# Artículos por página; solo se resumen los de la página visible
+PAGE_SIZE = 10
+
+# Segundos entre actualizaciones de las tarjetas cuyo resumen se está generando
+SUMMARY_POLL_INTERVAL = 1
+
+# Segundos entre consultas del estado de un envío por correo en curso
+EMAIL_POLL_INTERVAL = 2
+
 # Custom CSS to style the application with professional colors
 st.markdown("""
 <style>
@@ -252,32 +269,287 @@ st.markdown("""
 # Función para restaurar los keywords predeterminados
 def reset_keywords():
     st.session_state.keywords = DEFAULT_KEYWORDS
+    st.session_state.keywords_changed = True
+
+# Editor de palabras clave aislado en un fragmento
+@st.fragment
+def keyword_editor():
+    # Keyword input with session state
+    if 'keywords' not in st.session_state:
+        st.session_state.keywords = DEFAULT_KEYWORDS
+
+    # Create two columns for the text area and reset button
+    kw_col1, kw_col2 = st.columns([5, 1])
+
+    # Text area in the first column
+    with kw_col1:
+        keywords = st.text_area("", value=st.session_state.keywords, height=80,
+                            placeholder="Ejemplo: minería, oro, plata, cobre, proyecto")
+        
+        # Update session state if user changes the input
+        if keywords != st.session_state.keywords:
+            st.session_state.keywords = keywords
+            st.session_state.keywords_changed = True
+
+    # Reset button in the second column
+    with kw_col2:
+        st.markdown("<div style='margin-top: 25px;'></div>", unsafe_allow_html=True)
+        reset_button = st.button("⭮ Restaurar", help="Restaurar palabras clave predeterminadas", on_click=reset_keywords)
+
+    # Con artículos en pantalla, la lista se vuelve a filtrar con las nuevas palabras clave
+    if st.session_state.pop('keywords_changed', False) and st.session_state.get('search_performed'):
+        st.rerun()
+
+# Cambiar de página en la lista de artículos
+def go_to_page(page):
+    st.session_state.page = page
+
+# Encolar en segundo plano los resúmenes de todos los artículos encontrados
+def summarize_all():
+    pipeline = get_summary_pipeline()
+    # Primero los de la página visible, que son los que se están esperando
+    first = st.session_state.get('page', 0) * PAGE_SIZE
+    articles = st.session_state.articles[first:first + PAGE_SIZE] + st.session_state.articles[:first] + st.session_state.articles[first + PAGE_SIZE:]
+    stored_summaries = get_article_store().summaries([article['link'] for article in articles])
+    futures = st.session_state.setdefault('summary_futures', {})
+    finished = st.session_state.setdefault('finished_summaries', {})
+    for article in articles:
+        link = article['link']
+        if not stored_summaries.get(link) and not pipeline.pending(link):
+            # Se vuelven a pedir también los que terminaron con error en esta sesión
+            futures[link] = pipeline.submit(dict(article, summary=None))
+            finished.pop(link, None)
+
+# Resumen de un artículo que no lo tenía al pintar la página: el guardado si
+# ya está, el resultado del pipeline si terminó (aunque sea un error o esté
+# vacío), o None si sigue en curso
+def current_summary(article):
+    link = article['link']
+    # Los ya terminados se recuerdan por sesión: las tarjetas no los vuelven a consultar
+    finished = st.session_state.setdefault('finished_summaries', {})
+    if link in finished:
+        return finished[link]
+    summary = get_article_store().summaries([link]).get(link)
+    if not summary:
+        # El Future se guarda por sesión para no volver a pedir los que fallaron
+        futures = st.session_state.setdefault('summary_futures', {})
+        future = futures.get(link)
+        if future is None:
+            pipeline = get_summary_pipeline()
+            future = futures[link] = pipeline.pending(link) or pipeline.submit(dict(article, summary=None))
+        if future is not None and not future.done():
+            return None
+        try:
+            summary = future.result() if future is not None else ""
+        except Exception as e:
+            print(f"Error en el pipeline de resúmenes: {str(e)}")
+            summary = ERROR_PREFIX
+    finished[link] = summary
+    return summary
+
+# Tarjeta de un artículo. Se pinta como fragmento: las que esperan su resumen
+# se vuelven a ejecutar solas cada pocos segundos sin recargar la página. Al
+# terminar, el resumen se pinta dentro del propio fragmento y las ejecuciones
+# que queden hasta la siguiente recarga solo lo leen de session_state
+def article_card(i, article, summary=None):
+    with st.expander(f"{i+1}. {article['title']}"):
+
+        fecha_display = article.get('formatted_date', article.get('date', ''))
+        if not fecha_display and 'link' in article:
+            # Fallback: si no hay fecha, mostrar solo la fuente
+            source_display = f"Fuente: {article['link'].split('/')[2]}" if '/' in article['link'] else "Fuente: Desconocida"
+            st.markdown(f"""
+            <div style="display: flex; justify-content: space-between; margin-bottom: 0.5rem; font-size: 0.8rem; color: {MEDIUM};">
+                <div>Artículo #{i+1}</div>
+                <div>{source_display}</div>
+            </div>
+            """, unsafe_allow_html=True)
+        else:
+            # Si hay fecha, mostrar fecha y fuente
+            source_display = f"Fuente: {article['link'].split('/')[2]}" if '/' in article['link'] else "Fuente: Desconocida"
+            st.markdown(f"""
+            <div style="display: flex; justify-content: space-between; margin-bottom: 0.5rem; font-size: 0.8rem; color: {MEDIUM};">
+                <div>Artículo #{i+1}</div>
+                <div>
+                    <span style="font-weight: bold; color: {PRIMARY};">{fecha_display}</span> | {source_display}
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+
+        # Display image if available
+        if article.get('image') and article['image'].get('url'):
+            try:
+                if article['image']['url'] and article['image']['url'].strip():
+                    img_url = article['image']['url']
+                    img_alt = article['image'].get('alt', article['title'])
+
+                    st.markdown(f'''
+                    <div class="image-container">
+                        <img src="{img_url}" alt="{img_alt}" />
+                    </div>
+                    ''', unsafe_allow_html=True)
+            except Exception as e:
+                st.markdown('<div class="image-fallback">No se pudo cargar la imagen del artículo.</div>', unsafe_allow_html=True)
+                print(f"Error cargando imagen: {str(e)}")
+
+        # Source link with custom styling
+        st.markdown(f"""
+        <div style="margin: 0.8rem 0;">
+            <span class="label">Enlace original:</span> 
+            <a href="{article['link']}" target="_blank" class="source-link">{article['link']}</a>
+        </div>
+        """, unsafe_allow_html=True)
+
+        # Add a separator line
+        st.markdown('<hr style="margin: 1rem 0; border-color: #eaeaea;">', unsafe_allow_html=True)
+
+        # Display summary with custom styling
+        st.markdown(f"""
+        <div style="margin: 0.8rem 0;">
+            <div class="label" style="color: {PRIMARY}; display: flex; align-items: center;">
+                <svg xmlns="http://www.w3.org/2000/svg" width="16" height="16" fill="currentColor" class="bi bi-file-text" viewBox="0 0 16 16" style="margin-right: 0.5rem;">
+                    <path d="M5 4a.5.5 0 0 0 0 1h6a.5.5 0 0 0 0-1zm-.5 2.5A.5.5 0 0 1 5 6h6a.5.5 0 0 1 0 1H5a.5.5 0 0 1-.5-.5M5 8a.5.5 0 0 0 0 1h6a.5.5 0 0 0 0-1zm0 2a.5.5 0 0 0 0 1h3a.5.5 0 0 0 0-1z"/>
+                    <path d="M2 2a2 2 0 0 1 2-2h8a2 2 0 0 1 2 2v12a2 2 0 0 1-2 2H4a2 2 0 0 1-2-2zm10-1H4a1 1 0 0 0-1 1v12a1 1 0 0 0 1 1h8a1 1 0 0 0 1-1V2a1 1 0 0 0-1-1"/>
+                </svg>
+                RESUMEN EJECUTIVO
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+        if summary is None:
+            summary = current_summary(article)
+        if summary is not None:
+            # Terminado: un resultado vacío se muestra como error, no como pendiente
+            st.markdown(f'<div class="summary-section">{summary or ERROR_PREFIX}</div>', unsafe_allow_html=True)
+        else:
+            # Aún en preparación: el fragmento se vuelve a ejecutar y va mostrando
+            # el texto que el pipeline recibe en streaming
+            partial = get_summary_pipeline().partial(article['link'])
+            st.markdown(f'<div class="summary-section">{partial + " ▌" if partial else "Analizando contenido con IA..."}</div>', unsafe_allow_html=True)
+
+# Encolar el informe al pulsar "Enviar". Como callback se ejecuta antes de
+# volver a pintar la sección, así el estado del envío ya se consulta en esa pasada
+def send_report(articles):
+    email_recipients = st.session_state.email_recipients_input
+    if not email_recipients:
+        st.session_state.email_status = (False, "Por favor, ingrese al menos una dirección de correo electrónico.")
+        return
+
+    # Parse email addresses
+    email_list = [email.strip() for email in email_recipients.split(",")]
+
+    # El informe (resúmenes incluidos) se prepara y envía en segundo plano:
+    # aquí solo se encola
+    try:
+        success, message, job_id = queue_email_report(email_list, articles, st.session_state.keywords)
+        st.session_state.email_status = (success, message)
+        st.session_state.email_job = job_id
+    except Exception as e:
+        st.session_state.email_status = (False, f"Error al enviar el correo: {str(e)}")
+        print(f"Error en el envío de correo: {str(e)}")
+
+# Mensaje del último envío. Mientras hay un trabajo en la cola se pinta como
+# fragmento con run_every, que consulta su estado hasta que termina
+def email_status():
+    if st.session_state.email_job:
+        job_status = email_job_status(st.session_state.email_job)
+        if job_status and job_status['status'] == 'sent':
+            st.session_state.email_status = (True, f"Informe enviado correctamente a {job_status['sent']} destinatarios.")
+            st.session_state.email_job = None
+        elif job_status and job_status['status'] == 'failed':
+            st.session_state.email_status = (False, f"Error al enviar correo: {job_status['error']}")
+            st.session_state.email_job = None
+    if st.session_state.email_status:
+        success, message = st.session_state.email_status
+        if success:
+            icon = "📨" if st.session_state.email_job else "✅"
+            st.markdown(f'<div class="success-box">{icon} {message}</div>', unsafe_allow_html=True)
+        else:
+            st.markdown(f'<div class="warning-box">⚠️ {message}</div>', unsafe_allow_html=True)
+
+# Formulario de envío por correo. Como fragmento, escribir destinatarios o
+# pulsar "Enviar" solo vuelve a ejecutar esta sección
+@st.fragment
+def email_section(articles):
+    # Add a divider before email section
+    st.markdown('<div class="divider"></div>', unsafe_allow_html=True)
+    st.markdown('<div class="subtitle">Enviar Informe por Correo</div>', unsafe_allow_html=True)
+
+    # Email distribution section
+    st.markdown("""
+    <div style="margin-bottom: 1rem; color: """+MEDIUM+""";">
+        Envíe un informe con estos artículos a uno o varios destinatarios.
+        Ingrese las direcciones de correo electrónico separadas por comas.
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Mensajes del envío (con el estado actual del trabajo en segundo plano)
+    status = st.fragment(email_status, run_every=EMAIL_POLL_INTERVAL if st.session_state.email_job else None)
+    status()
+
+    # Email input - usar key para evitar conflictos
+    st.text_area("Destinatarios",
+                 key="email_recipients_input",
+                 placeholder="ejemplo@empresa.com, gerente@minera.mx",
+                 help="Ingrese una o varias direcciones de correo separadas por comas")
 
-# Función para eliminar artículos duplicados
-def deduplicate_articles(articles_list):
+    # Columnas para el botón
+    send_col1, send_col2 = st.columns([3, 1])
+    with send_col2:
+        # Send button con key única
+        st.button("📧 Enviar Informe", key="send_email_button", on_click=send_report, args=(articles,))
+
+# Artículos que se muestran mientras sigue el rastreo
+class LiveResults:
     """
-    Elimina artículos duplicados basados en el título
-    Preserva el primer artículo encontrado con cada título
+    Recibe los artículos que coinciden con las palabras clave desde los hilos
+    de los scrapers y los pinta en el hilo de Streamlit, sin duplicados
+    (mismo criterio que deduplicate_articles: el título)
     """
-    unique_articles = []
-    seen_titles = set()
-    
-    # Itera por la lista de artículos
-    for article in articles_list:
-        # Normaliza el título (minúsculas, sin espacios extra)
-        title = article['title'].lower().strip()
-        
-        # Si este título no ha sido visto antes, agrégalo
-        if title not in seen_titles:
-            seen_titles.add(title)
-            unique_articles.append(article)
-            
-    # Reporta cuántos duplicados se eliminaron
-    duplicates_removed = len(articles_list) - len(unique_articles)
-    if duplicates_removed > 0:
-        print(f"Se eliminaron {duplicates_removed} artículos duplicados")
-        
-    return unique_articles
+
+    def __init__(self, keywords, container):
+        self.matcher = get_matcher(keywords)
+        self.container = container
+        self.found = queue.Queue()
+        self.seen_titles = set()
+        self.count = 0
+
+    def listener(self, article):
+        if self.matches(article):
+            self.found.put(article)
+
+    def matches(self, article):
+        return self.matcher.search(article.get('title')) or self.matcher.search(article.get('text'))
+
+    def add(self, articles):
+        """Para rastreos reutilizados, cuyos artículos no pasan por el listener"""
+        for article in articles:
+            self.listener(article)
+
+    def render_pending(self):
+        while True:
+            try:
+                article = self.found.get_nowait()
+            except queue.Empty:
+                return
+            title = article['title'].lower().strip()
+            if title in self.seen_titles:
+                continue
+            self.seen_titles.add(title)
+            self.count += 1
+            with self.container.expander(f"{self.count}. {article['title']}"):
+                fecha_display = article.get('formatted_date', article.get('date', ''))
+                source_display = f"Fuente: {article['link'].split('/')[2]}" if '/' in article['link'] else "Fuente: Desconocida"
+                st.markdown(f"""
+                <div style="display: flex; justify-content: space-between; margin-bottom: 0.5rem; font-size: 0.8rem; color: {MEDIUM};">
+                    <div><span style="font-weight: bold; color: {PRIMARY};">{fecha_display}</span></div>
+                    <div>{source_display}</div>
+                </div>
+                <div style="margin: 0.8rem 0;">
+                    <span class="label">Enlace original:</span> 
+                    <a href="{article['link']}" target="_blank" class="source-link">{article['link']}</a>
+                </div>
+                """, unsafe_allow_html=True)
 
 def main():
     # Variables de estado para mantener la aplicación entre recargas
@@ -287,8 +559,8 @@ def main():
         st.session_state.search_performed = False  # Para saber si se realizó una búsqueda
     if 'email_status' not in st.session_state:
         st.session_state.email_status = None  # Para mostrar estado del envío de correo
-    if 'summarizer' not in st.session_state:
-        st.session_state.summarizer = OpenAISummarizer()  # Inicializar el summarizer una sola vez
+    if 'email_job' not in st.session_state:
+        st.session_state.email_job = None  # Trabajo de envío en segundo plano
 
     # Custom title with HTML
     st.markdown('<div class="main-title">Noticias Mineras México</div>', unsafe_allow_html=True)
@@ -320,27 +592,10 @@ def main():
         {keyword_tags_html}
     """, unsafe_allow_html=True)
     
-    # Keyword input with session state
-    if 'keywords' not in st.session_state:
-        st.session_state.keywords = DEFAULT_KEYWORDS
-
-    # Create two columns for the text area and reset button
-    kw_col1, kw_col2 = st.columns([5, 1])
-
-    # Text area in the first column
-    with kw_col1:
-        keywords = st.text_area("", value=st.session_state.keywords, height=80,
-                            placeholder="Ejemplo: minería, oro, plata, cobre, proyecto")
-        
-        # Update session state if user changes the input
-        if keywords != st.session_state.keywords:
-            st.session_state.keywords = keywords
+    # Editor de palabras clave: escribir en él solo vuelve a ejecutar el fragmento
+    keyword_editor()
+    keywords = st.session_state.keywords
 
-    # Reset button in the second column
-    with kw_col2:
-        st.markdown("<div style='margin-top: 25px;'></div>", unsafe_allow_html=True)
-        reset_button = st.button("⭮ Restaurar", help="Restaurar palabras clave predeterminadas", on_click=reset_keywords)
-    
     # Add a divider
     st.markdown('<div class="divider"></div>', unsafe_allow_html=True)
     
@@ -366,51 +621,84 @@ def main():
                 
                 # Execute scrapers concurrently
                 scrapers = [website_one_scraper, website_two_scraper, website_three_scraper, website_four_scraper]
-                scraper_names = ["Minería en Línea", "Mundo Minero", "Cluster Minero", "Rumbo Minero"]
+                scraper_names = [scraper.source_name for scraper in scrapers]
                 
                 # Dictionary to store results
                 articles_dict = {}
                 
-                # Execute scraping concurrently
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    # Submit all scraping tasks
-                    future_to_scraper = {
-                        executor.submit(scraper.scrape): (scraper, name) 
-                        for scraper, name in zip(scrapers, scraper_names)
-                    }
-                    
-                    # Process results as they complete
-                    for future in concurrent.futures.as_completed(future_to_scraper):
-                        scraper, name = future_to_scraper[future]
-                        try:
-                            articles = future.result()
-                            articles_dict[name] = articles
-                            status_container.markdown(
-                                f'<div class="info-box">✅ {name}: {len(articles)} artículos encontrados</div>', 
-                                unsafe_allow_html=True
-                            )
-                        except Exception as exc:
-                            print(f"{name} generó una excepción: {exc}")
-                            articles_dict[name] = []
-                            status_container.markdown(
-                                f'<div class="warning-box">⚠️ Error al procesar {name}: {exc}</div>', 
-                                unsafe_allow_html=True
-                            )
+                # Momento de inicio: la búsqueda local se limita a lo visto en este rastreo
+                search_started = time.time()
+                crawl_starts = []
+                crawl_cache = get_crawl_cache()
+                
+                # Los artículos que coinciden se muestran en cuanto se descargan
+                live_placeholder = st.empty()
+                live_results = LiveResults(keywords, live_placeholder.container())
                 
-                # Combine all articles
-                all_articles = []
-                for name, articles in articles_dict.items():
-                    all_articles.extend(articles)
+                Scraper.add_article_listener(live_results.listener)
+                try:
+                    # Execute scraping concurrently
+                    with concurrent.futures.ThreadPoolExecutor() as executor:
+                        # Rastrear todos los artículos de cada listado (sin filtrar por palabras clave);
+                        # un rastreo reciente o en curso de otra sesión se reutiliza
+                        future_to_scraper = {
+                            executor.submit(crawl_cache.crawl, scraper): (scraper, name) 
+                            for scraper, name in zip(scrapers, scraper_names)
+                        }
+                        pending_crawls = set(future_to_scraper)
                     
+                        # Pintar los artículos nuevos y procesar los rastreos según terminan
+                        while pending_crawls:
+                            done, pending_crawls = concurrent.futures.wait(
+                                pending_crawls, timeout=0.2, return_when=concurrent.futures.FIRST_COMPLETED
+                            )
+                            for future in done:
+                                scraper, name = future_to_scraper[future]
+                                try:
+                                    started, articles = future.result()
+                                    articles_dict[name] = articles
+                                    crawl_starts.append(started)
+                                    live_results.add(articles)
+                                    cached_note = " (rastreo reciente reutilizado)" if started < search_started else ""
+                                    status_container.markdown(
+                                        f'<div class="info-box">✅ {name}: {len(articles)} artículos revisados{cached_note}</div>', 
+                                        unsafe_allow_html=True
+                                    )
+                                except Exception as exc:
+                                    print(f"{name} generó una excepción: {exc}")
+                                    articles_dict[name] = []
+                                    status_container.markdown(
+                                        f'<div class="warning-box">⚠️ Error al procesar {name}: {exc}</div>', 
+                                        unsafe_allow_html=True
+                                    )
+                            live_results.render_pending()
+                finally:
+                    Scraper.remove_article_listener(live_results.listener)
+
+                # La lista completa (ordenada por fecha) reemplaza la vista previa
+                live_placeholder.empty()
+
+                # Con rastreos reutilizados, la búsqueda empieza en el más antiguo
+                crawl_started = min(crawl_starts, default=search_started)
+
                 # Remove status container
                 status_container.empty()
 
-                # Deduplicate articles
-                articles = deduplicate_articles(all_articles)
+                # Reutilización de conexiones del cliente HTTP compartido
+                for host, stats in Scraper.connection_stats().items():
+                    print(f"{host}: {stats['requests']} peticiones, {stats['connections']} conexiones, {stats['reused']} reutilizadas")
+
+                # Filtrar localmente por palabras clave (título y texto) y eliminar duplicados
+                articles = deduplicate_articles(get_article_store().search(keywords, seen_since=crawl_started))
                 
                 # Guardar en session_state
                 st.session_state.articles = articles
                 st.session_state.search_performed = True
+                st.session_state.crawl_started = crawl_started
+                st.session_state.searched_keywords = keywords
+                st.session_state.page = 0
+                st.session_state.summary_futures = {}
+                st.session_state.finished_summaries = {}
                 
                 # Display articles count
                 if len(articles) > 0:
@@ -434,11 +722,30 @@ def main():
         else:
             st.markdown('<div class="warning-box">⚠️ Por favor ingresa al menos una palabra clave para iniciar la búsqueda.</div>', unsafe_allow_html=True)
 
+    # Si cambian las palabras clave después de una búsqueda, volver a filtrar
+    # los artículos ya rastreados sin tocar la red
+    if st.session_state.search_performed and keywords and keywords != st.session_state.get('searched_keywords'):
+        st.session_state.articles = deduplicate_articles(
+            get_article_store().search(keywords, seen_since=st.session_state.crawl_started)
+        )
+        st.session_state.searched_keywords = keywords
+        st.session_state.page = 0
+
     # MOSTRAR ARTÍCULOS (ya sea después de buscar o si ya tenemos artículos en session_state)
     if st.session_state.search_performed and st.session_state.articles:
         # Recuperar artículos de session_state
         articles = st.session_state.articles
-        summarizer = st.session_state.summarizer
+
+        # Solo se leen resúmenes ya generados; los que faltan se piden al pipeline
+        # únicamente para la página visible
+        pipeline = get_summary_pipeline()
+        stored_summaries = get_article_store().summaries([article['link'] for article in articles])
+
+        # Página actual (se vuelve a la primera en cada búsqueda)
+        page_count = (len(articles) + PAGE_SIZE - 1) // PAGE_SIZE
+        page = min(st.session_state.get('page', 0), page_count - 1)
+        first = page * PAGE_SIZE
+        page_articles = articles[first:first + PAGE_SIZE]
         
         # Add a divider before articles
         st.markdown('<div class="divider"></div>', unsafe_allow_html=True)
@@ -447,151 +754,52 @@ def main():
         # Display total articles count
         st.markdown(f"""
         <div style="margin-bottom: 1rem; text-align: right; color: {MEDIUM};">
-            Mostrando {len(articles)} artículos | Ordenados por relevancia
+            Mostrando {first + 1}-{first + len(page_articles)} de {len(articles)} artículos | Ordenados por fecha
         </div>
         """, unsafe_allow_html=True)
 
+        # Navegación entre páginas y resumen de todos los artículos en segundo plano
+        if page_count > 1:
+            nav_col1, nav_col2, nav_col3 = st.columns([1, 2, 1])
+            with nav_col1:
+                st.button("← Anterior", key="previous_page", disabled=page == 0,
+                          on_click=go_to_page, args=(page - 1,))
+            with nav_col2:
+                st.markdown(f'<div style="text-align: center; margin-top: 0.5rem; color: {MEDIUM};">Página {page + 1} de {page_count}</div>', unsafe_allow_html=True)
+            with nav_col3:
+                st.button("Siguiente →", key="next_page", disabled=page >= page_count - 1,
+                          on_click=go_to_page, args=(page + 1,))
+
+        missing_summaries = sum(1 for article in articles if not stored_summaries.get(article['link']))
+        if missing_summaries:
+            sum_col1, sum_col2 = st.columns([3, 1])
+            with sum_col1:
+                in_progress = pipeline.pending_count()
+                progress_note = f" ({in_progress} en preparación)" if in_progress else ""
+                st.markdown(f'<div style="margin-top: 0.5rem; color: {MEDIUM};">{missing_summaries} artículos sin resumen{progress_note}</div>', unsafe_allow_html=True)
+            with sum_col2:
+                st.button("Resumir todos", key="summarize_all", on_click=summarize_all,
+                          help="Genera en segundo plano los resúmenes de todas las páginas")
+
 
         # Diagnóstico de fechas
         print("Diagnóstico de fechas en artículos:")
-        for i, article in enumerate(articles[:3]):  # Revisar solo los primeros 3 para no llenar la consola
+        for i, article in enumerate(page_articles[:3]):  # Revisar solo los primeros 3 para no llenar la consola
             print(f"Artículo #{i+1}: {article['title']}")
             print(f"  - date: {article.get('date', 'NO EXISTE')}")
             print(f"  - formatted_date: {article.get('formatted_date', 'NO EXISTE')}")
             print(f"  - Claves disponibles: {list(article.keys())}")
             
         # Display summaries
-        for i, article in enumerate(articles):
-            with st.expander(f"{i+1}. {article['title']}"):
-                
-                fecha_display = article.get('formatted_date', article.get('date', ''))
-                if not fecha_display and 'link' in article:
-                    # Fallback: si no hay fecha, mostrar solo la fuente
-                    source_display = f"Fuente: {article['link'].split('/')[2]}" if '/' in article['link'] else "Fuente: Desconocida"
-                    st.markdown(f"""
-                    <div style="display: flex; justify-content: space-between; margin-bottom: 0.5rem; font-size: 0.8rem; color: {MEDIUM};">
-                        <div>Artículo #{i+1}</div>
-                        <div>{source_display}</div>
-                    </div>
-                    """, unsafe_allow_html=True)
-                else:
-                    # Si hay fecha, mostrar fecha y fuente
-                    source_display = f"Fuente: {article['link'].split('/')[2]}" if '/' in article['link'] else "Fuente: Desconocida"
-                    st.markdown(f"""
-                    <div style="display: flex; justify-content: space-between; margin-bottom: 0.5rem; font-size: 0.8rem; color: {MEDIUM};">
-                        <div>Artículo #{i+1}</div>
-                        <div>
-                            <span style="font-weight: bold; color: {PRIMARY};">{fecha_display}</span> | {source_display}
-                        </div>
-                    </div>
-                    """, unsafe_allow_html=True)
-                
-                # Display image if available
-                if article.get('image') and article['image'].get('url'):
-                    try:
-                        if article['image']['url'] and article['image']['url'].strip():
-                            img_url = article['image']['url']
-                            img_alt = article['image'].get('alt', article['title'])
-                            
-                            st.markdown(f'''
-                            <div class="image-container">
-                                <img src="{img_url}" alt="{img_alt}" />
-                            </div>
-                            ''', unsafe_allow_html=True)
-                    except Exception as e:
-                        st.markdown('<div class="image-fallback">No se pudo cargar la imagen del artículo.</div>', unsafe_allow_html=True)
-                        print(f"Error cargando imagen: {str(e)}")
-                
-                # Source link with custom styling
-                st.markdown(f"""
-                <div style="margin: 0.8rem 0;">
-                    <span class="label">Enlace original:</span> 
-                    <a href="{article['link']}" target="_blank" class="source-link">{article['link']}</a>
-                </div>
-                """, unsafe_allow_html=True)
-                
-                # Add a separator line
-                st.markdown('<hr style="margin: 1rem 0; border-color: #eaeaea;">', unsafe_allow_html=True)
-                
-                # Generate summary with spinner
-                with st.spinner("Analizando contenido con IA..."):
-                    summary = summarizer.summarize(article['text'])
-                
-                # Display summary with custom styling
-                st.markdown(f"""
-                <div style="margin: 0.8rem 0;">
-                    <div class="label" style="color: {PRIMARY}; display: flex; align-items: center;">
-                        <svg xmlns="http://www.w3.org/2000/svg" width="16" height="16" fill="currentColor" class="bi bi-file-text" viewBox="0 0 16 16" style="margin-right: 0.5rem;">
-                            <path d="M5 4a.5.5 0 0 0 0 1h6a.5.5 0 0 0 0-1zm-.5 2.5A.5.5 0 0 1 5 6h6a.5.5 0 0 1 0 1H5a.5.5 0 0 1-.5-.5M5 8a.5.5 0 0 0 0 1h6a.5.5 0 0 0 0-1zm0 2a.5.5 0 0 0 0 1h3a.5.5 0 0 0 0-1z"/>
-                            <path d="M2 2a2 2 0 0 1 2-2h8a2 2 0 0 1 2 2v12a2 2 0 0 1-2 2H4a2 2 0 0 1-2-2zm10-1H4a1 1 0 0 0-1 1v12a1 1 0 0 0 1 1h8a1 1 0 0 0 1-1V2a1 1 0 0 0-1-1"/>
-                        </svg>
-                        RESUMEN EJECUTIVO
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
-                
-                st.markdown(f'<div class="summary-section">{summary}</div>', unsafe_allow_html=True)
+        for i, article in enumerate(page_articles, start=first):
+            # Cada tarjeta es un fragmento; solo las que esperan su resumen se actualizan solas
+            summary = stored_summaries.get(article['link']) or current_summary(article)
+            card = st.fragment(article_card, run_every=SUMMARY_POLL_INTERVAL if summary is None else None)
+            card(i, article, summary)
 
         # SECCIÓN DE ENVÍO DE CORREO
-        # Add a divider before email section
-        st.markdown('<div class="divider"></div>', unsafe_allow_html=True)
-        st.markdown('<div class="subtitle">Enviar Informe por Correo</div>', unsafe_allow_html=True)
-
-        # Email distribution section
-        st.markdown("""
-        <div style="margin-bottom: 1rem; color: """+MEDIUM+""";">
-            Envíe un informe con estos artículos a uno o varios destinatarios.
-            Ingrese las direcciones de correo electrónico separadas por comas.
-        </div>
-        """, unsafe_allow_html=True)
+        email_section(articles)
 
-        # Feedback container para mensajes
-        email_status_container = st.empty()
-        
-        # Mostrar mensaje anterior si existe
-        if st.session_state.email_status:
-            success, message = st.session_state.email_status
-            if success:
-                email_status_container.markdown(f'<div class="success-box">✅ {message}</div>', unsafe_allow_html=True)
-            else:
-                email_status_container.markdown(f'<div class="warning-box">⚠️ {message}</div>', unsafe_allow_html=True)
-
-        # Email input - usar key para evitar conflictos
-        email_recipients = st.text_area("Destinatarios", 
-                                key="email_recipients_input",
-                                placeholder="ejemplo@empresa.com, gerente@minera.mx", 
-                                help="Ingrese una o varias direcciones de correo separadas por comas")
-
-        # Columnas para el botón
-        send_col1, send_col2 = st.columns([3, 1])
-        with send_col2:
-            # Send button con key única
-            send_email_button = st.button("📧 Enviar Informe", key="send_email_button")
-
-        if send_email_button:
-            if not email_recipients:
-                st.session_state.email_status = (False, "Por favor, ingrese al menos una dirección de correo electrónico.")
-                email_status_container.markdown('<div class="warning-box">⚠️ Por favor, ingrese al menos una dirección de correo electrónico.</div>', unsafe_allow_html=True)
-            else:
-                # Parse email addresses
-                email_list = [email.strip() for email in email_recipients.split(",")]
-                
-                # Send email with progress indicator
-                with st.spinner("Enviando informe por correo electrónico..."):
-                    try:
-                        success, message = send_email_report(email_list, articles, st.session_state.keywords)
-                        st.session_state.email_status = (success, message)
-                        
-                        if success:
-                            email_status_container.markdown(f'<div class="success-box">✅ {message}</div>', unsafe_allow_html=True)
-                        else:
-                            email_status_container.markdown(f'<div class="warning-box">⚠️ {message}</div>', unsafe_allow_html=True)
-                    except Exception as e:
-                        error_msg = f"Error al enviar el correo: {str(e)}"
-                        st.session_state.email_status = (False, error_msg)
-                        email_status_container.markdown(f'<div class="warning-box">⚠️ {error_msg}</div>', unsafe_allow_html=True)
-                        print(f"Error en el envío de correo: {str(e)}")
-        
         # Add footer
         st.markdown("""
         <div class="footer">
@@ -0,0 +1,99 @@
+"""
+Memoria pico de ascrape() (lista completa) contra aiter_articles() consumido
+artículo a artículo, con un servidor HTTP local que sirve páginas grandes.
+
+    python benchmarks/bench_article_stream.py [--articles 40] [--page-kb 100]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_async_scrape import make_scraper
+from src.scrapers.scraper_base import Scraper
+
+
+def make_handler(num_articles, page_kb):
+    paragraph = '<p>La minera anunció una inversión en el proyecto de oro del norte del país.</p>'
+    content = paragraph * (page_kb * 1024 // len(paragraph))
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            base = f"http://{self.headers['Host']}"
+            if self.path == '/':
+                items = ''.join(
+                    f'<article><h2 class="entry-title"><a href="{base}/nota/{i}">Nueva mina de oro {i}</a></h2></article>'
+                    for i in range(num_articles)
+                )
+                body = f"<html><head><title>Listado</title></head><body>{items}</body></html>"
+            else:
+                body = (
+                    '<html><body><time class="entry-date published" datetime="2025-04-14T10:00:00Z">14 abril</time>'
+                    f'<div class="entry-content">{content}</div></body></html>'
+                )
+            data = body.encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+async def consume_stream(scraper):
+    count = 0
+    async for article in scraper.aiter_articles(maxsize=4):
+        # Consumidor lento: guardar, resumir... y soltar el artículo
+        await asyncio.sleep(0.005)
+        count += 1
+    return count
+
+
+def measure(fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak / 1024 / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--articles', type=int, default=40)
+    parser.add_argument('--page-kb', type=int, default=100)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), make_handler(args.articles, args.page_kb))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/"
+
+    Scraper.configure_rate_limit(rate=1000, burst=1000, respect_robots=False)
+    Scraper.configure_http_cache(enabled=False)
+
+    articles, list_time, list_peak = measure(
+        lambda: asyncio.run(make_scraper(base_url, args.articles).ascrape()))
+    count, stream_time, stream_peak = measure(
+        lambda: asyncio.run(consume_stream(make_scraper(base_url, args.articles))))
+
+    server.shutdown()
+
+    assert count == len(articles) == args.articles
+    print(f"\n{args.articles} artículos de ~{args.page_kb} KB")
+    print(f"ascrape() (lista):       {list_time:.2f}s, pico {list_peak:.1f} MB")
+    print(f"aiter_articles() (cola): {stream_time:.2f}s, pico {stream_peak:.1f} MB")
+
+
+if __name__ == '__main__':
+    main()
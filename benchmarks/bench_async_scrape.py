@@ -0,0 +1,94 @@
+"""
+Compara scrape() (secuencial) contra ascrape() (paralelo por host) usando
+un servidor HTTP local que simula un sitio de noticias con latencia.
+
+    python benchmarks/bench_async_scrape.py [--articles 15] [--latency 0.3]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.scrapers.scraper_base import Scraper
+from src.scrapers.website_one_scraper import WebsiteOneScraper
+
+
+def make_handler(num_articles, latency):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            base = f"http://{self.headers['Host']}"
+            if self.path == '/':
+                items = ''.join(
+                    f'<article><h2 class="entry-title"><a href="{base}/nota/{i}">Nueva mina de oro {i}</a></h2></article>'
+                    for i in range(num_articles)
+                )
+                body = f"<html><head><title>Listado</title></head><body>{items}</body></html>"
+            else:
+                time.sleep(latency)
+                body = (
+                    '<html><body><time class="entry-date published" datetime="2025-04-14T10:00:00Z">14 abril</time>'
+                    '<div class="entry-content"><p>La minera anunció una inversión en el proyecto de oro.</p></div>'
+                    '</body></html>'
+                )
+            data = body.encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+def make_scraper(base_url, limit):
+    scraper = WebsiteOneScraper.__new__(WebsiteOneScraper)
+    scraper.keywords = ['oro']
+    scraper.base_url = base_url
+    scraper.article_limit = limit
+    scraper.use_article_store = False
+    return scraper
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--articles', type=int, default=15)
+    parser.add_argument('--latency', type=float, default=0.3)
+    parser.add_argument('--max-per-host', type=int, default=4)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), make_handler(args.articles, args.latency))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/"
+
+    # Sin límite de ritmo ni caché para medir solo el efecto de la concurrencia
+    Scraper.configure_rate_limit(rate=1000, burst=1000, respect_robots=False)
+    Scraper.configure_http_cache(enabled=False)
+    scraper = make_scraper(base_url, args.articles)
+
+    start = time.perf_counter()
+    sequential = scraper.scrape()
+    sequential_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    concurrent = asyncio.run(scraper.ascrape(max_per_host=args.max_per_host))
+    async_time = time.perf_counter() - start
+
+    server.shutdown()
+
+    assert sequential == concurrent, "ascrape() devolvió artículos distintos a scrape()"
+    print(f"\n{len(sequential)} artículos, latencia {args.latency}s por página")
+    print(f"scrape():  {sequential_time:.2f}s")
+    print(f"ascrape(): {async_time:.2f}s (max {args.max_per_host} por host)")
+    print(f"Mejora:    {sequential_time / async_time:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
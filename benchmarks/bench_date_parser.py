@@ -0,0 +1,86 @@
+"""
+Costo de extraer y normalizar la fecha de un artículo.
+
+Mide parse_date() en frío (sin caché) y en caliente (LRU), y extract_date()
+completo de cada scraper sobre una página de artículo de ejemplo.
+
+    python benchmarks/bench_date_parser.py [--articles 2000]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.scrapers.parsers import parse
+from src.scrapers.website_two_scraper import WebsiteTwoScraper
+from src.scrapers.website_three_scraper import WebsiteThreeScraper
+from src.scrapers.website_four_scraper import WebsiteFourScraper
+from src.utils import date_parser
+
+MONTHS = ['enero', 'febrero', 'marzo', 'abril', 'mayo', 'junio', 'julio',
+          'agosto', 'septiembre', 'octubre', 'noviembre', 'diciembre']
+
+FILLER = '<div class="bloque"><p>Texto de relleno del artículo sobre minería.</p></div>' * 40
+
+PAGES = {
+    WebsiteTwoScraper: '<html><body>' + FILLER + '<div class="tt-post-label"><span class="tt-post-date">abril 14, 2025</span></div></body></html>',
+    WebsiteThreeScraper: '<html><body>' + FILLER + '<div class="info"><a href="#">Redacción</a> 14 de abril de 2025</div></body></html>',
+    WebsiteFourScraper: '<html><body>' + FILLER + '<span class="td-post-date"><time datetime="2025-04-14T10:00:00+00:00">14 abril, 2025</time></span></body></html>',
+}
+
+
+def random_dates(rng, count):
+    dates = []
+    for _ in range(count):
+        day, month, year = rng.randint(1, 28), rng.randint(1, 12), rng.randint(2020, 2025)
+        dates.append(rng.choice([
+            f"{year}-{month:02d}-{day:02d}T10:00:00+00:00",
+            f"{day} de {MONTHS[month - 1]} de {year}",
+            f"{MONTHS[month - 1]} {day}, {year}",
+            f"{day:02d}/{month:02d}/{year}",
+        ]))
+    return dates
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--articles', type=int, default=2000)
+    args = parser.parse_args()
+
+    dates = random_dates(random.Random(7), args.articles)
+
+    date_parser._parse.cache_clear()
+    start = time.perf_counter()
+    for raw in dates:
+        date_parser.parse_date(raw)
+    cold = (time.perf_counter() - start) / len(dates)
+
+    start = time.perf_counter()
+    for raw in dates:
+        date_parser.parse_date(raw)
+    warm = (time.perf_counter() - start) / len(dates)
+
+    print(f"parse_date() sin caché: {cold * 1e6:.1f} µs por fecha")
+    print(f"parse_date() con caché: {warm * 1e6:.1f} µs por fecha")
+
+    stdout = sys.stdout
+    for scraper_class, page in PAGES.items():
+        scraper = scraper_class.__new__(scraper_class)
+        soup = parse(page)
+        sys.stdout = open(os.devnull, 'w')  # extract_date imprime diagnóstico
+        try:
+            start = time.perf_counter()
+            for _ in range(200):
+                result = scraper.extract_date(soup)
+            elapsed = (time.perf_counter() - start) / 200
+        finally:
+            sys.stdout.close()
+            sys.stdout = stdout
+        print(f"{scraper_class.__name__}.extract_date(): {elapsed * 1e6:.0f} µs por artículo -> {result['formatted']}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+"""
+Compara una conexión SMTP nueva por informe (como antes) contra la conexión
+persistente del outbox, usando un servidor SMTP local (aiosmtpd) que simula
+el coste del saludo/login con una latencia fija. Requiere `pip install aiosmtpd`.
+
+    python benchmarks/bench_email_delivery.py [--reports 20] [--recipients 120] [--handshake 0.1]
+"""
+import argparse
+import asyncio
+import os
+import smtplib
+import socket
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aiosmtpd.controller import Controller
+
+from src.utils.email_delivery import EmailOutbox, SmtpConnection, build_message
+
+SENDER = 'informes@example.com'
+
+
+class CountingHandler:
+    def __init__(self, handshake):
+        self.handshake = handshake
+        self.sessions = 0
+        self.messages = 0
+        self.recipients = 0
+
+    async def handle_EHLO(self, server, session, envelope, hostname, responses):
+        # Coste de establecer la sesión (TLS + login en un servidor real)
+        self.sessions += 1
+        await asyncio.sleep(self.handshake)
+        session.host_name = hostname
+        return responses
+
+    async def handle_DATA(self, server, session, envelope):
+        self.messages += 1
+        self.recipients += len(envelope.rcpt_tos)
+        return '250 OK'
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--reports', type=int, default=20)
+    parser.add_argument('--recipients', type=int, default=120)
+    parser.add_argument('--handshake', type=float, default=0.1)
+    args = parser.parse_args()
+
+    handler = CountingHandler(args.handshake)
+    port = free_port()
+    controller = Controller(handler, hostname='127.0.0.1', port=port)
+    controller.start()
+
+    recipients = [f'usuario{i}@example.com' for i in range(args.recipients)]
+    html_content = '<html><body>' + '<p>Resumen de la nota.</p>' * 200 + '</body></html>'
+
+    # Antes: conexión nueva por informe, todos los destinatarios en un mensaje
+    start = time.perf_counter()
+    for _ in range(args.reports):
+        with smtplib.SMTP('127.0.0.1', port) as server:
+            server.send_message(build_message(SENDER, recipients, 'Informe', html_content))
+    per_call_time = time.perf_counter() - start
+    per_call_sessions = handler.sessions
+
+    # Ahora: outbox con conexión persistente y tandas de destinatarios
+    handler.sessions = handler.messages = handler.recipients = 0
+    outbox = EmailOutbox(SmtpConnection('127.0.0.1', port, SENDER, use_tls=False))
+    start = time.perf_counter()
+    job_ids = [outbox.enqueue(recipients, 'Informe', html_content) for _ in range(args.reports)]
+    enqueue_time = time.perf_counter() - start
+    statuses = [outbox.wait(job_id, timeout=60) for job_id in job_ids]
+    outbox_time = time.perf_counter() - start
+
+    controller.stop()
+
+    assert all(status['status'] == 'sent' for status in statuses), statuses
+    assert handler.recipients == args.reports * args.recipients
+    print(f"\n{args.reports} informes a {args.recipients} destinatarios, {args.handshake}s por saludo")
+    print(f"Conexión por informe: {per_call_time:.2f}s ({per_call_sessions} sesiones SMTP)")
+    print(f"Outbox persistente:   {outbox_time:.2f}s ({handler.sessions} sesiones, {handler.messages} mensajes)")
+    print(f"Encolar (lo que espera la interfaz): {1000 * enqueue_time / args.reports:.2f} ms por informe")
+
+
+if __name__ == '__main__':
+    main()
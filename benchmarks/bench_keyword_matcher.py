@@ -0,0 +1,56 @@
+"""
+Compara el filtro original (any(keyword in title) por cada palabra clave)
+contra el autómata Aho-Corasick compilado.
+
+    python benchmarks/bench_keyword_matcher.py [--keywords 1000] [--titles 10000]
+"""
+import argparse
+import os
+import random
+import string
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.keyword_matcher import KeywordMatcher
+
+
+def random_word(rng, min_len=4, max_len=10):
+    return ''.join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(min_len, max_len)))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--keywords', type=int, default=1000)
+    parser.add_argument('--titles', type=int, default=10000)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    keywords = [random_word(rng) for _ in range(args.keywords)]
+    vocabulary = [random_word(rng) for _ in range(5000)] + keywords[:50]
+    titles = [' '.join(rng.choice(vocabulary) for _ in range(10)).capitalize() for _ in range(args.titles)]
+
+    # Filtro original: baja el título por cada palabra clave y lo recorre una vez por palabra
+    start = time.perf_counter()
+    naive = [[keyword for keyword in keywords if keyword.lower() in title.lower()] for title in titles]
+    naive_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    matcher = KeywordMatcher(keywords)
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    compiled = [matcher.find(title) for title in titles]
+    compiled_time = time.perf_counter() - start
+
+    assert [set(found) for found in naive] == [set(found) for found in compiled]
+    matched = sum(1 for found in compiled if found)
+    print(f"{args.keywords} palabras clave x {args.titles} títulos ({matched} con coincidencias)")
+    print(f"any(keyword in title): {naive_time * 1000:.0f} ms")
+    print(f"Aho-Corasick:          {compiled_time * 1000:.0f} ms (+{build_time * 1000:.0f} ms de compilación)")
+    print(f"Mejora:                {naive_time / compiled_time:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
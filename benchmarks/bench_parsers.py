@@ -0,0 +1,126 @@
+"""
+Tiempo de parseo por página con cada backend, usando páginas guardadas
+de los cuatro sitios. Primero se guardan los fixtures (listado + algunos
+artículos) leyendo las URLs de las variables de entorno WEBSITE_*_URL:
+
+    python benchmarks/bench_parsers.py --save
+    python benchmarks/bench_parsers.py [--repeat 5]
+
+Cada fixture se procesa completo: listing_candidates() sobre el listado y
+parse_article() sobre cada artículo, con los selectores reales de cada scraper.
+"""
+import argparse
+import glob
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.scrapers.parsers import PARSER_BACKENDS, backend_available
+from src.scrapers.scraper_base import Scraper
+from src.scrapers.website_one_scraper import WebsiteOneScraper
+from src.scrapers.website_two_scraper import WebsiteTwoScraper
+from src.scrapers.website_three_scraper import WebsiteThreeScraper
+from src.scrapers.website_four_scraper import WebsiteFourScraper
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+SITES = {
+    'one': (WebsiteOneScraper, 'WEBSITE_ONE_URL'),
+    'two': (WebsiteTwoScraper, 'WEBSITE_TWO_URL'),
+    'three': (WebsiteThreeScraper, 'WEBSITE_THREE_URL'),
+    'four': (WebsiteFourScraper, 'WEBSITE_FOUR_URL'),
+}
+
+
+def make_scraper(scraper_class, base_url, backend='auto'):
+    scraper = scraper_class.__new__(scraper_class)
+    scraper.keywords = []
+    scraper.base_url = base_url
+    scraper.article_limit = 5
+    scraper.use_article_store = False
+    scraper.parser_backend = backend
+    return scraper
+
+
+def save_fixtures():
+    for site, (scraper_class, env_name) in SITES.items():
+        base_url = os.getenv(env_name)
+        if not base_url:
+            print(f"{env_name} no está definida, se omite {site}")
+            continue
+        scraper = make_scraper(scraper_class, base_url)
+        listing_html = scraper.fetch_html(base_url)
+        if not listing_html:
+            continue
+        site_dir = os.path.join(FIXTURES_DIR, site)
+        os.makedirs(site_dir, exist_ok=True)
+        with open(os.path.join(site_dir, 'listing.html'), 'w', encoding='utf-8') as f:
+            f.write(base_url + '\n' + listing_html)
+        for i, candidate in enumerate(scraper.listing_candidates(listing_html)):
+            article_html = scraper.fetch_html(candidate['link'])
+            if article_html:
+                with open(os.path.join(site_dir, f'article_{i}.html'), 'w', encoding='utf-8') as f:
+                    f.write(candidate['link'] + '\n' + article_html)
+
+
+def load_page(path):
+    with open(path, encoding='utf-8') as f:
+        url, _, body = f.read().partition('\n')
+    return url, body
+
+
+def bench_site(site, backend, repeat):
+    scraper_class, _ = SITES[site]
+    site_dir = os.path.join(FIXTURES_DIR, site)
+    base_url, listing_html = load_page(os.path.join(site_dir, 'listing.html'))
+    articles = [load_page(path) for path in sorted(glob.glob(os.path.join(site_dir, 'article_*.html')))]
+
+    scraper = make_scraper(scraper_class, base_url, backend)
+    pages = 0
+    start = time.perf_counter()
+    for _ in range(repeat):
+        Scraper._candidates_memo.clear()
+        scraper.listing_candidates(listing_html)
+        pages += 1
+        for url, article_html in articles:
+            scraper.parse_article({'title': '', 'link': url}, scraper.parse_html(article_html))
+            pages += 1
+    return (time.perf_counter() - start) / pages
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--save', action='store_true', help='descargar los fixtures')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    if args.save:
+        save_fixtures()
+        return
+
+    sites = [site for site in SITES if os.path.exists(os.path.join(FIXTURES_DIR, site, 'listing.html'))]
+    if not sites:
+        print("No hay fixtures; ejecute primero con --save")
+        return
+
+    backends = [backend for backend in PARSER_BACKENDS if backend_available(backend)]
+    results = {}
+    stdout = sys.stdout
+    for site in sites:
+        for backend in backends:
+            sys.stdout = open(os.devnull, 'w')  # Los scrapers imprimen mucho diagnóstico
+            try:
+                results[(site, backend)] = bench_site(site, backend, args.repeat)
+            finally:
+                sys.stdout.close()
+                sys.stdout = stdout
+
+    print(f"{'sitio':<8}" + ''.join(f"{backend:>14}" for backend in backends))
+    for site in sites:
+        print(f"{site:<8}" + ''.join(f"{results[(site, backend)] * 1000:>11.1f} ms" for backend in backends))
+
+
+if __name__ == '__main__':
+    main()
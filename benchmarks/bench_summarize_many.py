@@ -0,0 +1,88 @@
+"""
+Compara summarize() uno a uno contra summarize_many() usando un servidor
+local compatible con la API de OpenAI que responde con latencia fija.
+
+    python benchmarks/bench_summarize_many.py [--articles 20] [--latency 0.5] [--max-in-flight 8]
+"""
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.summarizer.openai_summarizer import OpenAISummarizer
+
+
+def make_handler(latency):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_POST(self):
+            request = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+            time.sleep(latency)
+            # El "resumen" es el final del prompt, así se puede comprobar el orden
+            content = request['messages'][-1]['content'].splitlines()[-1]
+            body = json.dumps({
+                'id': 'chatcmpl-stub',
+                'object': 'chat.completion',
+                'created': int(time.time()),
+                'model': request['model'],
+                'choices': [{
+                    'index': 0,
+                    'finish_reason': 'stop',
+                    'message': {'role': 'assistant', 'content': content},
+                }],
+                'usage': {'prompt_tokens': 0, 'completion_tokens': 0, 'total_tokens': 0},
+            }).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--articles', type=int, default=20)
+    parser.add_argument('--latency', type=float, default=0.5)
+    parser.add_argument('--max-in-flight', type=int, default=8)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), make_handler(args.latency))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/v1"
+
+    # Sin caché para que cada llamada llegue al servidor
+    summarizer = OpenAISummarizer(use_cache=False, max_in_flight=args.max_in_flight,
+                                  api_key='stub', base_url=base_url)
+    texts = [f"La minera anunció una nueva inversión en su proyecto de oro.\nNota {i}" for i in range(args.articles)]
+
+    start = time.perf_counter()
+    sequential = [summarizer.summarize(text) for text in texts]
+    sequential_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batched = summarizer.summarize_many(texts)
+    batched_time = time.perf_counter() - start
+
+    server.shutdown()
+
+    assert sequential == batched == [f"Nota {i}" for i in range(args.articles)], \
+        "summarize_many() devolvió resúmenes distintos o desordenados"
+    print(f"\n{len(texts)} artículos, latencia {args.latency}s por petición")
+    print(f"summarize():      {sequential_time:.2f}s")
+    print(f"summarize_many(): {batched_time:.2f}s (max {args.max_in_flight} en curso)")
+    print(f"Mejora:           {sequential_time / batched_time:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
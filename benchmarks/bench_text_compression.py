@@ -0,0 +1,86 @@
+"""
+Tokens de prompt por artículo antes (recorte fijo a 15000 caracteres) y después
+de compress_text(). Usa los artículos guardados en el almacén local
+(.cache/articles.db) o, si está vacío, artículos sintéticos con boilerplate.
+
+    python benchmarks/bench_text_compression.py [--limit 40] [--budget 1200]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.summarizer.text_compression import PROMPT_TOKEN_BUDGET, compress_text, count_tokens, tiktoken
+from src.utils.article_store import get_article_store
+
+OLD_MAX_CHARS = 15000
+
+SENTENCES = [
+    "La minera anunció una inversión de 500 millones de dólares en su proyecto de cobre en Sonora.",
+    "El proyecto contempla la construcción de una planta de flotación y un nuevo depósito de jales.",
+    "Según la empresa, la producción comenzará en el segundo semestre del próximo año.",
+    "Las autoridades estatales destacaron la generación de más de mil empleos directos en la región.",
+    "Especialistas del sector señalaron que el precio del cobre favorece nuevas inversiones en México.",
+    "La compañía también informó avances en sus programas de exploración de oro y plata en Zacatecas.",
+    "Representantes de las comunidades pidieron mayor transparencia en el manejo del agua.",
+]
+BOILERPLATE = [
+    "Compartir en Facebook Twitter LinkedIn.",
+    "Lee también: Las diez minas más grandes del país.",
+    "Suscríbete a nuestro newsletter.",
+    "Publicidad",
+    "© 2025 Todos los derechos reservados.",
+]
+
+
+def synthetic_articles(count):
+    rng = random.Random(42)
+    articles = []
+    for _ in range(count):
+        parts = []
+        for index in range(rng.randint(10, 160)):
+            # Frases distintas entre sí para no medir solo la eliminación de repetidas
+            parts.append(rng.choice(SENTENCES)[:-1] + f", de acuerdo con el reporte {index + 1}.")
+            if rng.random() < 0.15:
+                parts.append(rng.choice(BOILERPLATE))
+        articles.append(' '.join(parts))
+    return articles
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--limit', type=int, default=40)
+    parser.add_argument('--budget', type=int, default=PROMPT_TOKEN_BUDGET)
+    args = parser.parse_args()
+
+    texts = [article['text'] for article in get_article_store().search([], limit=args.limit) if article.get('text')]
+    source = "almacén local"
+    if not texts:
+        texts = synthetic_articles(args.limit)
+        source = "sintéticos"
+
+    before_total = after_total = 0
+    elapsed = 0.0
+    for text in texts:
+        before = count_tokens(text[:OLD_MAX_CHARS])
+        start = time.perf_counter()
+        compressed = compress_text(text, args.budget)
+        elapsed += time.perf_counter() - start
+        after = count_tokens(compressed)
+        before_total += before
+        after_total += after
+
+    tokenizer = "tiktoken" if tiktoken else "estimación por caracteres"
+    print(f"\n{len(texts)} artículos ({source}), presupuesto {args.budget} tokens, conteo con {tokenizer}")
+    print(f"Tokens por artículo antes:   {before_total / len(texts):.0f}")
+    print(f"Tokens por artículo después: {after_total / len(texts):.0f}")
+    print(f"Ahorro:                      {before_total - after_total} tokens "
+          f"({100 * (1 - after_total / before_total):.0f}%), {(before_total - after_total) / len(texts):.0f} por artículo")
+    print(f"Tiempo de compresión:        {1000 * elapsed / len(texts):.2f} ms por artículo")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,36 +1,185 @@
-import streamlit as st
-from scrapers.website_one_scraper import WebsiteOneScraper
-from scrapers.website_two_scraper import WebsiteTwoScraper
-from summarizer.openai_summarizer import OpenAISummarizer
+"""
+Informes programados sin Streamlit: rastrea las cuatro fuentes, filtra por las
+palabras clave de cada perfil, resume los artículos y envía el informe por correo.
 
-def main():
-    st.title("Noticias Mineras México")
-    
-    keywords = st.text_input("Introduce palabras clave, separadas por coma:")
-    
-    if st.button("Scrape News"):
-        if keywords:
-            keywords_list = [keyword.strip() for keyword in keywords.split(",")]
-            articles = []
-
-            # Scrape articles from both websites
-            website_one_scraper = WebsiteOneScraper()
-            website_two_scraper = WebsiteTwoScraper()
-
-            articles.extend(website_one_scraper.scrape(keywords_list))
-            articles.extend(website_two_scraper.scrape(keywords_list))
-
-            if articles:
-                summarizer = OpenAISummarizer()
-                summaries = [summarizer.summarize(article) for article in articles]
-
-                st.subheader("Notas resumidas:")
-                for summary in summaries:
-                    st.write(summary)
-            else:
-                st.write("No se encontraron noticias para las palabras clave proporcionadas.")
+    python -m src.main --keywords "oro, cobre" --to gerente@minera.mx
+    python -m src.main --config digest.toml                # todos los perfiles, una vez
+    python -m src.main --config digest.toml --daemon       # cada día a la hora de cada perfil
+    python -m src.main --config digest.toml --dry-run      # guarda el HTML en vez de enviarlo
+
+Los perfiles se leen de un archivo TOML o JSON (por defecto DIGEST_CONFIG):
+
+    [[profiles]]
+    name = "Metales preciosos"
+    keywords = ["oro", "plata"]
+    recipients = ["direccion@minera.mx"]
+    time = "07:00"
+
+URLs de las fuentes, clave de OpenAI y datos SMTP se leen de variables de
+entorno (o de un .env): WEBSITE_*_URL, OPENAI_API_KEY, EMAIL_SERVER, EMAIL_PORT,
+EMAIL_SENDER, EMAIL_PASSWORD.
+"""
+import argparse
+import asyncio
+import json
+import os
+import time
+from datetime import datetime, timedelta
+
+from src.scrapers.article_stream import stream_articles
+from src.scrapers.website_one_scraper import WebsiteOneScraper
+from src.scrapers.website_two_scraper import WebsiteTwoScraper
+from src.scrapers.website_three_scraper import WebsiteThreeScraper
+from src.scrapers.website_four_scraper import WebsiteFourScraper
+from src.summarizer.pipeline import get_summary_pipeline
+from src.utils.article_store import get_article_store
+from src.utils.email_service import MAX_REPORT_ARTICLES, render_report, report_summaries, send_email_report
+from src.utils.keyword_matcher import normalize_keywords
+from src.utils.settings import get_setting
+from src.utils.text_processing import deduplicate_articles
+
+SCRAPER_CLASSES = (WebsiteOneScraper, WebsiteTwoScraper, WebsiteThreeScraper, WebsiteFourScraper)
+DEFAULT_RUN_TIME = "07:00"
+
+
+def load_profiles(path):
+    """Perfiles (nombre, palabras clave, destinatarios, hora) de un archivo TOML o JSON"""
+    with open(path, 'rb') as f:
+        if path.endswith('.json'):
+            config = json.load(f)
         else:
-            st.write("Por favor, introduzca palabras clave para buscar noticias.")
+            import tomllib
+            config = tomllib.load(f)
+
+    profiles = []
+    for index, profile in enumerate(config.get('profiles', [])):
+        recipients = profile.get('recipients', [])
+        if isinstance(recipients, str):
+            recipients = recipients.split(',')
+        profiles.append({
+            'name': profile.get('name') or f"perfil-{index + 1}",
+            'keywords': list(normalize_keywords(profile.get('keywords', []))),
+            'recipients': [email.strip() for email in recipients if email.strip()],
+            'time': profile.get('time', DEFAULT_RUN_TIME),
+        })
+    return profiles
+
+
+async def crawl_sources():
+    """
+    Rastrea las cuatro fuentes a la vez y guarda sus artículos en el almacén
+    local; se consumen uno a uno por una cola acotada, sin acumularlos
+    """
+    scrapers = [scraper_class([]) for scraper_class in SCRAPER_CLASSES]
+    scrapers = [scraper for scraper in scrapers if scraper.base_url]
+    counts = {scraper.source_name: 0 for scraper in scrapers}
+    async for scraper, article in stream_articles(scrapers, crawl=True):
+        counts[scraper.source_name] += 1
+    for name, count in counts.items():
+        print(f"{name}: {count} artículos revisados")
+
+
+def crawl():
+    """Un rastreo completo; devuelve el momento de inicio para filtrar lo visto en él"""
+    crawl_started = time.time()
+    asyncio.run(crawl_sources())
+    return crawl_started
+
+
+def run_profile(profile, crawl_started, dry_run=False, output_dir='.'):
+    keywords = profile['keywords']
+    articles = deduplicate_articles(get_article_store().search(keywords, seen_since=crawl_started))
+    print(f"[{profile['name']}] {len(articles)} artículos para: {', '.join(keywords)}")
+    if not articles:
+        return
+
+    # Resumir con el mismo pipeline que la app: quedan guardados para el informe y la interfaz
+    pipeline = get_summary_pipeline()
+    futures = [pipeline.submit(article) for article in articles[:MAX_REPORT_ARTICLES]]
+    for future in futures:
+        if future is not None:
+            future.result()
+
+    if dry_run:
+        report_articles = articles[:MAX_REPORT_ARTICLES]
+        html_content = render_report(report_articles, report_summaries(report_articles),
+                                     datetime.now().strftime("%d/%m/%Y"), total_articles=len(articles))
+        path = os.path.join(output_dir, f"informe-{profile['name']}-{datetime.now():%Y%m%d}.html".replace(' ', '_'))
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(html_content)
+        print(f"[{profile['name']}] Informe guardado en {path}")
+        return
+
+    if not profile['recipients']:
+        print(f"[{profile['name']}] Sin destinatarios, no se envía el informe")
+        return
+    success, message = send_email_report(profile['recipients'], articles, ', '.join(keywords))
+    print(f"[{profile['name']}] {message}")
+
+
+def run_once(profiles, dry_run=False, output_dir='.'):
+    """Un solo rastreo compartido por todos los perfiles (no depende de las palabras clave)"""
+    crawl_started = crawl()
+    for profile in profiles:
+        try:
+            run_profile(profile, crawl_started, dry_run, output_dir)
+        except Exception as e:
+            print(f"[{profile['name']}] Error al generar el informe: {e}")
+
+
+def next_run(profile, now):
+    hour, minute = (int(part) for part in profile['time'].split(':'))
+    run_at = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    return run_at if run_at > now else run_at + timedelta(days=1)
+
+
+def run_daemon(profiles, dry_run=False, output_dir='.'):
+    """Ejecuta cada perfil todos los días a su hora; los que coinciden comparten rastreo"""
+    now = datetime.now()
+    schedule = {profile['name']: next_run(profile, now) for profile in profiles}
+    while True:
+        run_at = min(schedule.values())
+        print(f"Próximo informe: {run_at:%Y-%m-%d %H:%M}")
+        time.sleep(max(0, (run_at - datetime.now()).total_seconds()))
+
+        now = datetime.now()
+        due = [profile for profile in profiles if schedule[profile['name']] <= now]
+        run_once(due, dry_run, output_dir)
+        for profile in due:
+            schedule[profile['name']] = next_run(profile, datetime.now())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Informes de noticias mineras sin interfaz")
+    parser.add_argument('--config', default=get_setting('DIGEST_CONFIG'),
+                        help="Archivo TOML/JSON con los perfiles (por defecto DIGEST_CONFIG)")
+    parser.add_argument('--keywords', help="Palabras clave separadas por comas (perfil único)")
+    parser.add_argument('--to', help="Destinatarios separados por comas (perfil único)")
+    parser.add_argument('--daemon', action='store_true', help="Repetir cada día a la hora de cada perfil")
+    parser.add_argument('--dry-run', action='store_true', help="Guardar el HTML del informe en lugar de enviarlo")
+    parser.add_argument('--output-dir', default='.', help="Carpeta para los informes de --dry-run")
+    args = parser.parse_args()
+
+    if args.keywords:
+        profiles = [{
+            'name': 'cli',
+            'keywords': list(normalize_keywords(args.keywords)),
+            'recipients': [email.strip() for email in (args.to or '').split(',') if email.strip()],
+            'time': DEFAULT_RUN_TIME,
+        }]
+    elif args.config:
+        profiles = load_profiles(args.config)
+    else:
+        parser.error("Indique --keywords o un archivo de perfiles con --config / DIGEST_CONFIG")
+
+    if not profiles:
+        parser.error("No hay perfiles configurados")
+
+    if args.daemon:
+        run_daemon(profiles, args.dry_run, args.output_dir)
+    else:
+        run_once(profiles, args.dry_run, args.output_dir)
+
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
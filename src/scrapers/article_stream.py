@@ -0,0 +1,41 @@
+import asyncio
+
+
+STREAM_QUEUE_SIZE = 16  # Artículos que pueden esperar a que el consumidor los procese
+
+
+async def stream_articles(scrapers, maxsize=STREAM_QUEUE_SIZE, crawl=False, max_per_host=None):
+    """
+    Junta los artículos de varios scrapers en una sola cola acotada y genera
+    (scraper, artículo) según van llegando. Si el consumidor (deduplicación,
+    almacén, cola de resúmenes...) va más lento que las descargas, la cola se
+    llena y los scrapers esperan, así la memoria no crece con el número de artículos.
+    Con `crawl=True` se usa aiter_crawl() (todo el listado, sin palabras clave).
+    """
+    results = asyncio.Queue(maxsize)
+    done = object()
+
+    async def produce(scraper):
+        if crawl:
+            articles = scraper.aiter_crawl(max_per_host, maxsize)
+        else:
+            articles = scraper.aiter_articles(max_per_host, maxsize)
+        try:
+            async for article in articles:
+                await results.put((scraper, article))
+        except Exception as e:
+            print(f"{scraper.source_name} generó una excepción: {str(e)}")
+        await results.put((scraper, done))
+
+    tasks = [asyncio.create_task(produce(scraper)) for scraper in scrapers]
+    try:
+        remaining = len(tasks)
+        while remaining:
+            scraper, article = await results.get()
+            if article is done:
+                remaining -= 1
+            else:
+                yield scraper, article
+    finally:
+        for task in tasks:
+            task.cancel()
@@ -0,0 +1,29 @@
+import asyncio
+from urllib.parse import urlsplit
+
+
+DEFAULT_MAX_PER_HOST = 4  # Peticiones simultáneas permitidas por host
+
+
+class AsyncFetchEngine:
+    """
+    Descarga varias páginas en paralelo con asyncio, limitando las
+    peticiones simultáneas a cada host con un semáforo.
+    La descarga en sí la hace la función bloqueante `fetch` (el cliente
+    HTTP compartido) en un hilo, para reutilizar su pool de conexiones.
+    """
+
+    def __init__(self, fetch, max_per_host=DEFAULT_MAX_PER_HOST):
+        self.fetch = fetch
+        self.max_per_host = max_per_host
+        self._semaphores = {}
+
+    def _semaphore(self, url):
+        host = urlsplit(url).netloc
+        if host not in self._semaphores:
+            self._semaphores[host] = asyncio.Semaphore(self.max_per_host)
+        return self._semaphores[host]
+
+    async def fetch_one(self, url):
+        async with self._semaphore(url):
+            return await asyncio.to_thread(self.fetch, url)
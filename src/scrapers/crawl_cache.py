@@ -0,0 +1,85 @@
+import asyncio
+import threading
+import time
+
+from src.utils.settings import get_setting
+from src.utils.single_flight import SingleFlight
+
+
+CRAWL_TTL = 600  # Segundos que se reutiliza el rastreo de una fuente
+
+
+class CrawlCache:
+    """
+    Rastreos recientes compartidos por todas las sesiones del proceso: si otra
+    búsqueda ya rastreó la fuente hace menos de `ttl` segundos se reutiliza, y
+    las búsquedas simultáneas de la misma fuente esperan al mismo rastreo.
+
+    El rastreo no depende de las palabras clave (se ingiere todo el listado en
+    el almacén), así que la clave es solo la fuente; el filtro por palabras
+    clave es la búsqueda local de ArticleStore.search().
+    """
+
+    def __init__(self, ttl=CRAWL_TTL):
+        self.ttl = ttl
+        self._entries = {}
+        self._lock = threading.Lock()
+        self._in_flight = SingleFlight()
+
+    @staticmethod
+    def key(scraper):
+        return (type(scraper).__name__, scraper.base_url)
+
+    def cached(self, scraper):
+        """(inicio, artículos) del último rastreo si sigue vigente, o None"""
+        with self._lock:
+            entry = self._entries.get(self.key(scraper))
+        if entry and time.time() - entry[0] < self.ttl:
+            return entry
+        return None
+
+    def crawl(self, scraper):
+        """
+        Devuelve (inicio, artículos) del rastreo de esta fuente: el guardado si
+        está vigente, el que ya está en curso o uno nuevo. `inicio` sirve como
+        `seen_since` para la búsqueda local
+        """
+        entry = self.cached(scraper)
+        if entry:
+            return entry
+        return self._in_flight.do(self.key(scraper), lambda: self._crawl(scraper))
+
+    def _crawl(self, scraper):
+        # Otro líder pudo terminar justo antes de adquirir el turno
+        entry = self.cached(scraper)
+        if entry:
+            return entry
+        started = time.time()
+        articles = asyncio.run(scraper.acrawl())
+        entry = (started, articles)
+        # Un listado vacío suele ser un fallo de la fuente: no se guarda
+        if articles:
+            with self._lock:
+                self._entries[self.key(scraper)] = entry
+        return entry
+
+
+_crawl_cache = None
+_crawl_cache_lock = threading.Lock()
+
+
+def get_crawl_cache():
+    """Caché compartida por todo el proceso (TTL en CRAWL_CACHE_TTL)"""
+    global _crawl_cache
+    if _crawl_cache is None:
+        with _crawl_cache_lock:
+            if _crawl_cache is None:
+                _crawl_cache = CrawlCache(float(get_setting('CRAWL_CACHE_TTL', CRAWL_TTL)))
+    return _crawl_cache
+
+
+def configure_crawl_cache(ttl=CRAWL_TTL):
+    global _crawl_cache
+    with _crawl_cache_lock:
+        _crawl_cache = CrawlCache(ttl)
+    return _crawl_cache
@@ -0,0 +1,126 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+
+
+DEFAULT_CACHE_DIR = os.path.join('.cache', 'http')
+MAX_AGE = 14 * 24 * 3600   # Entradas sin descargar ni revalidar en este tiempo se borran
+PRUNE_INTERVAL = 3600      # Segundos mínimos entre dos limpiezas del directorio
+
+
+class HttpCache:
+    """
+    Caché HTTP en disco: guarda el cuerpo de cada página junto con sus
+    validadores (ETag / Last-Modified) para revalidar con peticiones
+    condicionales en lugar de volver a descargarla. Al escribir se borran (como
+    mucho una vez cada PRUNE_INTERVAL) las entradas de más de `max_age` segundos.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_age=MAX_AGE):
+        self.cache_dir = cache_dir
+        self.max_age = max_age
+        self._last_prune = 0.0
+        self._prune_lock = threading.Lock()
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def _paths(self, url):
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        base = os.path.join(self.cache_dir, key[:2], key)
+        return base + '.json', base + '.html'
+
+    def _write_atomic(self, path, data):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def get(self, url):
+        """Devuelve la entrada guardada (metadatos + 'body') o None"""
+        meta_path, body_path = self._paths(url)
+        try:
+            with open(meta_path, encoding='utf-8') as f:
+                entry = json.load(f)
+            with open(body_path, encoding='utf-8') as f:
+                entry['body'] = f.read()
+            return entry
+        except (OSError, ValueError):
+            return None
+
+    def put(self, url, body, etag=None, last_modified=None):
+        meta_path, body_path = self._paths(url)
+        entry = {
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'content_hash': hashlib.sha256(body.encode('utf-8')).hexdigest(),
+            'fetched_at': time.time()
+        }
+        self._write_atomic(body_path, body)
+        self._write_atomic(meta_path, json.dumps(entry))
+        entry['body'] = body
+        self._maybe_prune()
+        return entry
+
+    def touch(self, url, entry):
+        """Marca una entrada como recién validada (respuesta 304)"""
+        meta_path, _ = self._paths(url)
+        entry = dict(entry, fetched_at=time.time())
+        body = entry.pop('body', None)
+        self._write_atomic(meta_path, json.dumps(entry))
+        entry['body'] = body
+        return entry
+
+    def _maybe_prune(self):
+        now = time.time()
+        if not self.max_age or now - self._last_prune < PRUNE_INTERVAL:
+            return
+        # Un solo hilo limpia; el resto sigue escribiendo sin esperar
+        if not self._prune_lock.acquire(blocking=False):
+            return
+        try:
+            self._last_prune = now
+            self.prune(now - self.max_age)
+        finally:
+            self._prune_lock.release()
+
+    def prune(self, older_than):
+        """
+        Borra las entradas escritas o revalidadas por última vez antes de
+        `older_than` (timestamp). Devuelve cuántas se borraron
+        """
+        removed = 0
+        for dirpath, _, filenames in os.walk(self.cache_dir):
+            for name in filenames:
+                if not name.endswith('.json'):
+                    continue
+                meta_path = os.path.join(dirpath, name)
+                try:
+                    if os.path.getmtime(meta_path) >= older_than:
+                        continue
+                    os.remove(meta_path)
+                    removed += 1
+                except OSError:
+                    continue
+                # Sin metadatos el cuerpo ya no se usa
+                try:
+                    os.remove(meta_path[:-len('.json')] + '.html')
+                except OSError:
+                    pass
+        return removed
+
+    @staticmethod
+    def is_fresh(entry, ttl):
+        return bool(ttl) and time.time() - entry['fetched_at'] < ttl
+
+    @staticmethod
+    def conditional_headers(entry):
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
@@ -0,0 +1,64 @@
+import requests
+from requests.adapters import HTTPAdapter
+
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.5",
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1",
+    "Cache-Control": "max-age=0"
+}
+
+DEFAULT_POOL_CONNECTIONS = 8   # Número de hosts distintos con pool propio
+DEFAULT_POOL_MAXSIZE = 10      # Conexiones keep-alive por host
+DEFAULT_TIMEOUT = 15
+
+
+class HttpClient:
+    """
+    Cliente HTTP compartido por todos los scrapers.
+    Mantiene un pool de conexiones keep-alive por host para no repetir
+    el handshake TCP/TLS en cada página.
+    """
+
+    def __init__(self, pool_connections=DEFAULT_POOL_CONNECTIONS, pool_maxsize=DEFAULT_POOL_MAXSIZE,
+                 headers=None, timeout=DEFAULT_TIMEOUT):
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers.update(DEFAULT_HEADERS)
+        if headers:
+            self.session.headers.update(headers)
+
+        self.adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.session.mount("http://", self.adapter)
+        self.session.mount("https://", self.adapter)
+
+    def get(self, url, headers=None, timeout=None):
+        """GET usando el pool compartido"""
+        return self.session.get(url, headers=headers, timeout=timeout or self.timeout)
+
+    def stats(self):
+        """
+        Estadísticas de reutilización de conexiones por host.
+        'connections' es el número de conexiones (handshakes) abiertas;
+        todo lo demás fueron peticiones sobre conexiones reutilizadas.
+        """
+        stats = {}
+        pools = self.adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            host = pool.host if pool.port in (None, 80, 443) else f"{pool.host}:{pool.port}"
+            entry = stats.setdefault(host, {'requests': 0, 'connections': 0, 'reused': 0})
+            entry['requests'] += pool.num_requests
+            entry['connections'] += pool.num_connections
+
+        for entry in stats.values():
+            entry['reused'] = max(entry['requests'] - entry['connections'], 0)
+        return stats
+
+    def close(self):
+        self.session.close()
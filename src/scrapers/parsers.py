@@ -0,0 +1,53 @@
+import html
+import re
+
+from bs4 import BeautifulSoup, FeatureNotFound
+
+
+# Backends de BeautifulSoup en orden de preferencia para 'auto' (del más rápido al más lento).
+# Todos generan el mismo tipo de árbol, así que los selectores de los scrapers no cambian.
+PARSER_BACKENDS = ('lxml', 'html.parser')
+
+_TAG_PATTERN = re.compile(r'<[^>]+>')
+# Etiquetas de bloque: separan palabras; las de línea (<b>, <a>, <span>...) no
+_BLOCK_TAG_PATTERN = re.compile(
+    r'</?(?:address|article|aside|blockquote|br|dd|div|dl|dt|figcaption|figure|footer|h[1-6]|header|hr|'
+    r'li|main|nav|ol|p|pre|section|table|td|th|tr|ul)\b[^>]*>',
+    re.IGNORECASE,
+)
+_SPACES_PATTERN = re.compile(r'\s+')
+_available = {}
+
+
+def backend_available(backend):
+    if backend not in _available:
+        try:
+            BeautifulSoup('<p></p>', backend)
+            _available[backend] = True
+        except FeatureNotFound:
+            _available[backend] = False
+    return _available[backend]
+
+
+def resolve_backend(backend='auto'):
+    """Devuelve el backend a usar; 'auto' elige el más rápido instalado"""
+    if backend == 'auto':
+        for candidate in PARSER_BACKENDS:
+            if backend_available(candidate):
+                return candidate
+        return 'html.parser'
+    if not backend_available(backend):
+        print(f"Parser backend '{backend}' not available, using html.parser")
+        return 'html.parser'
+    return backend
+
+
+def parse(html_content, backend='auto'):
+    return BeautifulSoup(html_content, resolve_backend(backend))
+
+
+def fragment_text(fragment):
+    """Texto de un fragmento HTML pequeño sin construir un árbol completo"""
+    text = _BLOCK_TAG_PATTERN.sub(' ', fragment)
+    text = html.unescape(_TAG_PATTERN.sub('', text))
+    return _SPACES_PATTERN.sub(' ', text).strip()
@@ -0,0 +1,99 @@
+import threading
+import time
+from urllib.parse import urlsplit
+from urllib.robotparser import RobotFileParser
+
+
+DEFAULT_RATE = 2.0   # Peticiones por segundo por host
+DEFAULT_BURST = 5    # Peticiones seguidas permitidas antes de limitar
+
+
+class TokenBucket:
+    """Token bucket thread-safe: `rate` tokens por segundo, hasta `burst` acumulados"""
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def reserve(self):
+        """Reserva un token y devuelve los segundos que hay que esperar para usarlo"""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+    def acquire(self):
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class HostRateLimiter:
+    """
+    Limita las peticiones por host para todo el proceso (todas las sesiones,
+    scrapers e hilos comparten la misma instancia).
+    Si `respect_robots` está activo, el Crawl-delay de robots.txt reduce el
+    ritmo permitido para ese host.
+    """
+
+    def __init__(self, rate=DEFAULT_RATE, burst=DEFAULT_BURST, respect_robots=True, robots_fetch=None):
+        self.rate = rate
+        self.burst = burst
+        self.respect_robots = respect_robots
+        self.robots_fetch = robots_fetch
+        self._buckets = {}
+        self._policies = {}
+        self._lock = threading.Lock()
+
+    def set_policy(self, host, rate, burst=1):
+        """Fija manualmente el ritmo para un host"""
+        with self._lock:
+            self._policies[host] = (rate, burst)
+            self._buckets.pop(host, None)
+
+    def crawl_delay(self, scheme, host):
+        """Lee el Crawl-delay de robots.txt (None si no hay o no se pudo descargar)"""
+        if not self.respect_robots or not self.robots_fetch:
+            return None
+        try:
+            robots_txt = self.robots_fetch(f"{scheme}://{host}/robots.txt")
+            if not robots_txt:
+                return None
+            parser = RobotFileParser()
+            parser.parse(robots_txt.splitlines())
+            delay = parser.crawl_delay('*')
+            return float(delay) if delay else None
+        except Exception as e:
+            print(f"Error reading robots.txt for {host}: {str(e)}")
+            return None
+
+    def _bucket(self, url):
+        parts = urlsplit(url)
+        host = parts.netloc
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket:
+                return bucket
+
+        # La política se calcula fuera del lock para no bloquear otros hosts mientras se lee robots.txt
+        rate, burst = self._policies.get(host, (self.rate, self.burst))
+        if host not in self._policies:
+            delay = self.crawl_delay(parts.scheme or 'https', host)
+            if delay:
+                print(f"Crawl-delay de {delay}s para {host}")
+                rate, burst = min(rate, 1.0 / delay), 1
+
+        with self._lock:
+            return self._buckets.setdefault(host, TokenBucket(rate, burst))
+
+    def acquire(self, url):
+        """Bloquea hasta que haya turno para pedir `url`; devuelve los segundos esperados"""
+        return self._bucket(url).acquire()
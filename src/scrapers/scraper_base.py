@@ -1,18 +1,422 @@
+import asyncio
+import hashlib
+import math
+import threading
+
+from src.utils.article_store import get_article_store
+from src.utils.keyword_matcher import get_matcher
+
+from .async_engine import AsyncFetchEngine, DEFAULT_MAX_PER_HOST
+from .http_cache import MAX_AGE as HTTP_CACHE_MAX_AGE, HttpCache
+from .http_client import HttpClient
+from .parsers import parse
+from .rate_limiter import HostRateLimiter
+
+
 class Scraper:
+    # Cliente HTTP compartido por todas las instancias y todos los hilos
+    _http_client = None
+    _http_client_lock = threading.Lock()
+
+    # Límite de peticiones por host compartido por todo el proceso
+    _rate_limiter = None
+
+    # Caché HTTP en disco y candidatos ya extraídos de listados sin cambios
+    _http_cache = None
+    _candidates_memo = {}
+    _candidates_memo_size = 64
+
+    # Segundos que una página se sirve de la caché sin revalidar:
+    # los listados se revalidan siempre, los artículos casi nunca cambian
+    listing_ttl = 0
+    article_ttl = 7 * 24 * 3600
+
+    # Páginas de artículo descargadas a la vez por host en ascrape()
+    max_concurrency = DEFAULT_MAX_PER_HOST
+
+    # Nombre de la fuente y uso del almacén local de artículos
+    source_name = None
+    use_article_store = True
+
+    # Artículos del listado que se ingieren en modo crawl (sin filtrar por palabras
+    # clave). None: todo el listado, como recorría la búsqueda por palabras clave.
+    # Una fuente con listados muy largos puede fijar un tope a cambio de no
+    # encontrar las coincidencias que queden por debajo de él
+    crawl_limit = None
+
+    # Backend de parseo: 'auto' (lxml si está instalado), 'lxml' o 'html.parser'
+    parser_backend = 'auto'
+
+    # Funciones a las que se pasa cada artículo en cuanto está disponible
+    # (p. ej. para resumirlo en segundo plano mientras sigue el scraping)
+    _article_listeners = []
+
     def __init__(self, base_url, keywords):
         self.base_url = base_url
         self.keywords = keywords
 
-    def fetch_html(self, url):
-        import requests
-        response = requests.get(url)
-        response.raise_for_status()
-        return response.text
+    @classmethod
+    def add_article_listener(cls, listener):
+        if listener not in Scraper._article_listeners:
+            Scraper._article_listeners.append(listener)
+
+    @classmethod
+    def remove_article_listener(cls, listener):
+        if listener in Scraper._article_listeners:
+            Scraper._article_listeners.remove(listener)
+
+    def notify_article(self, article):
+        for listener in list(Scraper._article_listeners):
+            try:
+                listener(article)
+            except Exception as e:
+                print(f"Error in article listener: {str(e)}")
+
+    @classmethod
+    def configure_http_client(cls, pool_connections=None, pool_maxsize=None, headers=None, timeout=None):
+        """Reemplaza el cliente compartido (por ejemplo para cambiar el tamaño de los pools)"""
+        kwargs = {}
+        if pool_connections is not None:
+            kwargs['pool_connections'] = pool_connections
+        if pool_maxsize is not None:
+            kwargs['pool_maxsize'] = pool_maxsize
+        if headers is not None:
+            kwargs['headers'] = headers
+        if timeout is not None:
+            kwargs['timeout'] = timeout
+
+        with cls._http_client_lock:
+            if Scraper._http_client is not None:
+                Scraper._http_client.close()
+            Scraper._http_client = HttpClient(**kwargs)
+        return Scraper._http_client
+
+    @classmethod
+    def get_http_client(cls):
+        if Scraper._http_client is None:
+            with cls._http_client_lock:
+                if Scraper._http_client is None:
+                    Scraper._http_client = HttpClient()
+        return Scraper._http_client
+
+    @classmethod
+    def configure_rate_limit(cls, rate=None, burst=None, respect_robots=None):
+        """Cambia la política de ritmo por host (peticiones/segundo y ráfaga)"""
+        current = cls.get_rate_limiter()
+        with cls._http_client_lock:
+            Scraper._rate_limiter = HostRateLimiter(
+                rate=rate if rate is not None else current.rate,
+                burst=burst if burst is not None else current.burst,
+                respect_robots=respect_robots if respect_robots is not None else current.respect_robots,
+                robots_fetch=cls._fetch_robots
+            )
+        return Scraper._rate_limiter
+
+    @classmethod
+    def get_rate_limiter(cls):
+        if Scraper._rate_limiter is None:
+            with cls._http_client_lock:
+                if Scraper._rate_limiter is None:
+                    Scraper._rate_limiter = HostRateLimiter(robots_fetch=cls._fetch_robots)
+        return Scraper._rate_limiter
+
+    @classmethod
+    def configure_http_cache(cls, cache_dir=None, enabled=True, max_age=HTTP_CACHE_MAX_AGE):
+        """Cambia el directorio o la antigüedad máxima de la caché HTTP, o la desactiva"""
+        with cls._http_client_lock:
+            if not enabled:
+                Scraper._http_cache = False
+            elif cache_dir:
+                Scraper._http_cache = HttpCache(cache_dir, max_age)
+            else:
+                Scraper._http_cache = HttpCache(max_age=max_age)
+        return Scraper._http_cache
+
+    @classmethod
+    def get_http_cache(cls):
+        """Caché compartida (None si está desactivada)"""
+        if Scraper._http_cache is None:
+            with cls._http_client_lock:
+                if Scraper._http_cache is None:
+                    Scraper._http_cache = HttpCache()
+        return Scraper._http_cache or None
+
+    @classmethod
+    def _fetch_robots(cls, url):
+        response = cls.get_http_client().get(url, timeout=5)
+        return response.text if response.status_code == 200 else None
+
+    @classmethod
+    def connection_stats(cls):
+        """Peticiones vs. conexiones abiertas por host en el cliente compartido"""
+        return cls.get_http_client().stats()
+
+    def fetch_html(self, url, ttl=None):
+        """
+        Descarga una página pasando por la caché HTTP: si la copia guardada
+        tiene menos de `ttl` segundos se usa sin tocar la red; si no, se
+        revalida con If-None-Match / If-Modified-Since
+        """
+        cache = self.get_http_cache()
+        cached = cache.get(url) if cache else None
+        if cached and cache.is_fresh(cached, ttl):
+            print(f"Using cached HTML for {url}")
+            return cached['body']
+
+        try:
+            print(f"Fetching HTML from {url}")
+            # Espera su turno según la política del host (en vez de un sleep fijo)
+            self.get_rate_limiter().acquire(url)
+            headers = cache.conditional_headers(cached) if cached else None
+            response = self.get_http_client().get(url, headers=headers)
+
+            if response.status_code == 304 and cached:
+                print(f"Not modified: {url}")
+                cache.touch(url, cached)
+                return cached['body']
+
+            response.raise_for_status()
+            print(f"Successfully fetched {url} (Status: {response.status_code})")
+            if cache:
+                cache.put(url, response.text,
+                          etag=response.headers.get('ETag'),
+                          last_modified=response.headers.get('Last-Modified'))
+            return response.text
+        except Exception as e:
+            print(f"Error fetching {url}: {str(e)}")
+            if cached:
+                print(f"Using stale cached HTML for {url}")
+                return cached['body']
+            return None
+
+    def fetch_article_html(self, url):
+        return self.fetch_html(url, ttl=self.article_ttl)
 
     def parse_html(self, html):
-        from bs4 import BeautifulSoup
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = parse(html, self.parser_backend)
         return soup
 
+    def matches_keywords(self, title):
+        """True si el título contiene alguna palabra clave (o si no hay palabras clave)"""
+        return get_matcher(self.keywords).search(title)
+
+    def extract_candidates(self, soup, html_content):
+        """
+        Recorre la página de listado y devuelve los artículos que coinciden con
+        las palabras clave, como dicts con 'title', 'link' y opcionalmente 'image'
+        """
+        raise NotImplementedError("Subclasses should implement this method")
+
+    def parse_article(self, candidate, article_soup):
+        """Construye el dict del artículo a partir de su página ya parseada"""
+        raise NotImplementedError("Subclasses should implement this method")
+
+    def listing_candidates(self, html_content):
+        """
+        Candidatos de un listado. Si el HTML no cambió desde la última vez
+        (mismo hash de contenido) se reutiliza el resultado sin volver a parsear
+        """
+        content_hash = hashlib.sha256(html_content.encode('utf-8')).hexdigest()
+        keywords = tuple(self.keywords or ())
+        # extract_candidates() se detiene en article_limit: forma parte de la clave
+        memo_key = (type(self).__name__, self.base_url, content_hash, keywords, self.article_limit)
+
+        candidates = Scraper._candidates_memo.get(memo_key)
+        if candidates is not None:
+            print(f"Listing unchanged, reusing {len(candidates)} candidates for {self.base_url}")
+            return [dict(candidate) for candidate in candidates]
+
+        soup = self.parse_html(html_content)
+        print(f"Page title: {soup.title.text if soup.title else 'No title found'}")
+        candidates = self.extract_candidates(soup, html_content)
+
+        if len(Scraper._candidates_memo) >= self._candidates_memo_size:
+            Scraper._candidates_memo.clear()
+        Scraper._candidates_memo[memo_key] = [dict(candidate) for candidate in candidates]
+        return candidates
+
+    def stored_article(self, candidate):
+        """Artículo ya guardado en el almacén local (None si hay que descargarlo)"""
+        if not self.use_article_store:
+            return None
+        try:
+            article = get_article_store().get(candidate['link'])
+        except Exception as e:
+            print(f"Error reading article store: {str(e)}")
+            return None
+        if article:
+            print(f"Using stored article: {candidate['title']}")
+            self.notify_article(article)
+        return article
+
+    def build_article(self, candidate, article_html):
+        if not article_html:
+            print(f"Failed to fetch article content for: {candidate['title']}")
+            return None
+        try:
+            article_soup = self.parse_html(article_html)
+            article = self.parse_article(candidate, article_soup)
+            print(f"Successfully added article: {candidate['title']}")
+        except Exception as e:
+            print(f"Error parsing article: {str(e)}")
+            return None
+
+        if self.use_article_store:
+            try:
+                get_article_store().put(article, source=self.source_name)
+            except Exception as e:
+                print(f"Error saving article to store: {str(e)}")
+        self.notify_article(article)
+        return article
+
+    def iter_parsed_articles(self, html_content):
+        """Genera los artículos de un listado uno a uno, descargando cada página al pedirlo"""
+        if not html_content:
+            print(f"No HTML content retrieved from {self.base_url}")
+            return
+
+        for candidate in self.listing_candidates(html_content):
+            article = self.stored_article(candidate)
+            if not article:
+                article = self.build_article(candidate, self.fetch_article_html(candidate['link']))
+            if article:
+                yield article
+
+    def parse_articles(self, html_content):
+        articles = list(self.iter_parsed_articles(html_content))
+        print(f"Total articles found after filtering: {len(articles)}")
+        return articles
+
+    def iter_articles(self):
+        """
+        Generador: descarga y construye un artículo cada vez que se le pide,
+        así en memoria solo hay una página a la vez sea cual sea `article_limit`
+        """
+        print(f"Starting scrape of {self.base_url}")
+        html_content = self.fetch_html(self.base_url, ttl=self.listing_ttl)
+        yield from self.iter_parsed_articles(html_content)
+
     def scrape(self):
-        raise NotImplementedError("Subclasses should implement this method")
\ No newline at end of file
+        articles = list(self.iter_articles())
+        print(f"Total articles found after filtering: {len(articles)}")
+        return articles
+
+    async def _aiter_indexed(self, max_per_host=None, maxsize=None):
+        """(posición en el listado, artículo) según van estando listos"""
+        print(f"Starting async scrape of {self.base_url}")
+        html_content = await asyncio.to_thread(self.fetch_html, self.base_url, self.listing_ttl)
+        if not html_content:
+            print(f"No HTML content retrieved from {self.base_url}")
+            return
+
+        # Los artículos que ya están en el almacén local salen primero, sin descargas
+        missing = []
+        for index, candidate in enumerate(self.listing_candidates(html_content)):
+            article = self.stored_article(candidate)
+            if article:
+                yield index, article
+            else:
+                missing.append((index, candidate))
+        if not missing:
+            return
+
+        # Un número fijo de tareas descarga y construye los artículos que faltan y
+        # los deja en una cola acotada: si el consumidor va lento, la cola se llena
+        # y las descargas se detienen hasta que vuelva a haber sitio
+        workers = max_per_host or self.max_concurrency
+        engine = AsyncFetchEngine(self.fetch_article_html, workers)
+        results = asyncio.Queue(maxsize or workers)
+        pending = iter(missing)
+        done = object()
+
+        async def worker():
+            try:
+                for index, candidate in pending:
+                    article = self.build_article(candidate, await engine.fetch_one(candidate['link']))
+                    if article:
+                        await results.put((index, article))
+            except Exception as e:
+                print(f"Error fetching articles from {self.base_url}: {str(e)}")
+            await results.put(done)
+
+        tasks = [asyncio.create_task(worker()) for _ in range(min(workers, len(missing)))]
+        try:
+            remaining = len(tasks)
+            while remaining:
+                item = await results.get()
+                if item is done:
+                    remaining -= 1
+                else:
+                    yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def aiter_articles(self, max_per_host=None, maxsize=None):
+        """
+        Generador asíncrono: cada artículo sale en cuanto está listo, con las
+        páginas descargadas en paralelo (como máximo `max_per_host` por host) y
+        como mucho `maxsize` artículos esperando a que el consumidor los pida
+        """
+        async for _, article in self._aiter_indexed(max_per_host, maxsize):
+            yield article
+
+    async def ascrape(self, max_per_host=None):
+        """
+        Igual que scrape(), pero descarga las páginas de los artículos
+        en paralelo (como máximo `max_per_host` a la vez por host)
+        """
+        indexed = [item async for item in self._aiter_indexed(max_per_host)]
+        articles = [article for _, article in sorted(indexed, key=lambda item: item[0])]
+        print(f"Total articles found after filtering: {len(articles)}")
+        return articles
+
+    def _crawl_settings(self):
+        """Guarda la configuración actual y desactiva el filtro de palabras clave"""
+        saved = (self.keywords, self.article_limit)
+        self.keywords = []
+        if self.crawl_limit is None:
+            self.article_limit = math.inf
+        else:
+            self.article_limit = max(self.crawl_limit, self.article_limit)
+        return saved
+
+    def _finish_crawl(self, saved, links):
+        self.keywords, self.article_limit = saved
+        if self.use_article_store and links:
+            get_article_store().mark_seen(links)
+
+    def crawl(self):
+        """
+        Ingesta todos los artículos del listado en el almacén local, sin
+        depender de las palabras clave. Después se consultan con
+        ArticleStore.search()
+        """
+        saved = self._crawl_settings()
+        articles = []
+        try:
+            articles = self.scrape()
+        finally:
+            self._finish_crawl(saved, [article['link'] for article in articles])
+        return articles
+
+    async def acrawl(self, max_per_host=None):
+        """Versión de crawl() que descarga los artículos en paralelo"""
+        saved = self._crawl_settings()
+        articles = []
+        try:
+            articles = await self.ascrape(max_per_host)
+        finally:
+            self._finish_crawl(saved, [article['link'] for article in articles])
+        return articles
+
+    async def aiter_crawl(self, max_per_host=None, maxsize=None):
+        """Versión de acrawl() que genera los artículos sin acumularlos"""
+        saved = self._crawl_settings()
+        links = []
+        try:
+            async for article in self.aiter_articles(max_per_host, maxsize):
+                links.append(article['link'])
+                yield article
+        finally:
+            self._finish_crawl(saved, links)
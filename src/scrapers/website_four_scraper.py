@@ -1,47 +1,16 @@
-from bs4 import BeautifulSoup
-import requests
-import time
-import re
 from .scraper_base import Scraper
-import streamlit as st
+from src.utils.date_parser import parse_date
+from src.utils.settings import get_setting
 
 
 class WebsiteFourScraper(Scraper):
+    source_name = "Rumbo Minero"
+
     def __init__(self, keywords):
         self.keywords = keywords.split(',') if isinstance(keywords, str) else keywords
-        self.base_url = st.secrets.get('WEBSITE_FOUR_URL')
+        self.base_url = get_setting('WEBSITE_FOUR_URL')
         self.article_limit = 10  # Set the article limit
         
-    def scrape(self):
-        print(f"Starting scrape of {self.base_url}")
-        html_content = self.fetch_html(self.base_url)
-        
-        # Para diagnóstico
-        # self.analyze_page_structure(html_content)
-        
-        return self.parse_articles(html_content)
-
-    def fetch_html(self, url):
-        try:
-            print(f"Fetching HTML from {url}")
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-                "Accept-Language": "en-US,en;q=0.5",
-                "Connection": "keep-alive",
-                "Upgrade-Insecure-Requests": "1",
-                "Cache-Control": "max-age=0"
-            }
-            # Use a session to handle cookies
-            session = requests.Session()
-            response = session.get(url, headers=headers, timeout=15)
-            response.raise_for_status()
-            print(f"Successfully fetched {url} (Status: {response.status_code})")
-            return response.text
-        except Exception as e:
-            print(f"Error fetching {url}: {str(e)}")
-            return None
-
     def extract_image(self, soup, url):
         """Extract main image from article"""
         image_url = None
@@ -128,7 +97,6 @@ class WebsiteFourScraper(Scraper):
         The date is in a span with class="td-post-date" containing a time element with datetime attribute
         """
         date_text = ""
-        formatted_date = ""
         
         try:
             # Primer intento: buscar el selector específico de RumboMinero
@@ -141,11 +109,6 @@ class WebsiteFourScraper(Scraper):
                 if time_element and time_element.has_attr('datetime'):
                     date_text = time_element['datetime']
                     print(f"Found datetime attribute: {date_text}")
-                    
-                    # También podemos usar el texto visible
-                    visible_date = time_element.get_text(strip=True)
-                    if visible_date:
-                        print(f"Visible date text: {visible_date}")
             
             # Segundo intento: buscar cualquier elemento time con datetime
             if not date_text:
@@ -174,128 +137,14 @@ class WebsiteFourScraper(Scraper):
                             date_text = date_element.get_text(strip=True)
                         print(f"Found date with alternate selector '{selector}': {date_text}")
                         break
-            
-            # Formatear la fecha para mostrarla consistentemente
-            if date_text:
-                try:
-                    # Si tenemos formato ISO (común en atributo datetime)
-                    if 'T' in date_text:
-                        from datetime import datetime
-                        
-                        # Manejar múltiples formatos ISO posibles
-                        iso_formats = [
-                            "%Y-%m-%dT%H:%M:%S%z",  # Con zona horaria formato +0000
-                            "%Y-%m-%dT%H:%M:%S.%f%z",  # Con microsegundos y zona horaria
-                            "%Y-%m-%dT%H:%M:%S",  # Sin zona horaria
-                            "%Y-%m-%dT%H:%M:%S.%f"  # Con microsegundos sin zona horaria
-                        ]
-                        
-                        # Limpiar y normalizar el formato
-                        cleaned_date = date_text.strip()
-                        if cleaned_date.endswith('Z'):
-                            cleaned_date = cleaned_date.replace('Z', '+00:00')
-                        
-                        # Para compatibilidad con formatos de Python < 3.7 que no manejan el ':' en el offset
-                        if '+' in cleaned_date and ':' in cleaned_date.split('+')[1]:
-                            parts = cleaned_date.split('+')
-                            offset = parts[1].replace(':', '')
-                            cleaned_date = f"{parts[0]}+{offset}"
-                        
-                        # Intentar diferentes formatos
-                        date_obj = None
-                        for fmt in iso_formats:
-                            try:
-                                date_obj = datetime.strptime(cleaned_date, fmt)
-                                break
-                            except ValueError:
-                                continue
-                        
-                        if date_obj:
-                            formatted_date = date_obj.strftime("%d/%m/%Y")
-                        else:
-                            # Intentar formato simple de fecha
-                            date_obj = datetime.strptime(cleaned_date.split('T')[0], "%Y-%m-%d")
-                            formatted_date = date_obj.strftime("%d/%m/%Y")
-                    else:
-                        # Intentar formatos comunes en español
-                        import re
-                        from datetime import datetime
-                        
-                        # Patrones comunes
-                        patterns = [
-                            r'(\d{1,2})\s+de\s+([a-zé]+)(?:\s+de)?\s+(\d{4})',  # "15 de abril de 2023"
-                            r'(\d{1,2})\s+([a-zé]+)\s+(\d{4})',                 # "15 abril 2023"
-                            r'(\d{1,2})/(\d{1,2})/(\d{4})',                     # "15/04/2023"
-                            r'(\d{4})-(\d{1,2})-(\d{1,2})'                      # "2023-04-15"
-                        ]
-                        
-                        date_match = None
-                        matched_pattern = None
-                        
-                        for pattern in patterns:
-                            match = re.search(pattern, date_text.lower())
-                            if match:
-                                date_match = match.groups()
-                                matched_pattern = pattern
-                                break
-                        
-                        if date_match:
-                            if matched_pattern == patterns[0] or matched_pattern == patterns[1]:
-                                # Convertir nombre del mes en español al número
-                                month_names = {
-                                    'enero': 1, 'febrero': 2, 'marzo': 3, 'abril': 4, 
-                                    'mayo': 5, 'junio': 6, 'julio': 7, 'agosto': 8, 
-                                    'septiembre': 9, 'octubre': 10, 'noviembre': 11, 'diciembre': 12
-                                }
-                                
-                                day = int(date_match[0])
-                                month = month_names.get(date_match[1].lower(), 1)  # Valor por defecto 1 si no se encuentra
-                                year = int(date_match[2])
-                                
-                                date_obj = datetime(year, month, day)
-                                formatted_date = date_obj.strftime("%d/%m/%Y")
-                            elif matched_pattern == patterns[2]:
-                                # Formato "15/04/2023"
-                                day = int(date_match[0])
-                                month = int(date_match[1])
-                                year = int(date_match[2])
-                                
-                                date_obj = datetime(year, month, day)
-                                formatted_date = date_obj.strftime("%d/%m/%Y")
-                            elif matched_pattern == patterns[3]:
-                                # Formato "2023-04-15"
-                                year = int(date_match[0])
-                                month = int(date_match[1])
-                                day = int(date_match[2])
-                                
-                                date_obj = datetime(year, month, day)
-                                formatted_date = date_obj.strftime("%d/%m/%Y")
-                            else:
-                                formatted_date = date_text
-                        else:
-                            formatted_date = date_text
-                except Exception as e:
-                    print(f"Error formatting date: {e}")
-                    formatted_date = date_text
         
         except Exception as e:
             print(f"Error extracting date: {e}")
         
-        return {
-            'raw': date_text,
-            'formatted': formatted_date
-        }
+        return parse_date(date_text)
 
-    def parse_articles(self, html_content):
-        if not html_content:
-            print("No HTML content retrieved from RumboMinero.com")
-            return []
-            
-        soup = BeautifulSoup(html_content, 'html.parser')
-        articles = []
-        
-        # Debug información básica
-        print(f"Page title: {soup.title.text if soup.title else 'No title found'}")
+    def extract_candidates(self, soup, html_content):
+        candidates = []
         
         # ---- PRIMERA ESTRATEGIA: Buscar cualquier módulo de artículo ----
         # Buscar todos los posibles módulos de artículos (patrón común en el tema de WordPress)
@@ -305,7 +154,7 @@ class WebsiteFourScraper(Scraper):
         for article_module in article_modules:
             try:
                 # Break the loop if we've reached the limit
-                if len(articles) >= self.article_limit:
+                if len(candidates) >= self.article_limit:
                     break
                 
                 # Obtener título y enlace - buscar tags h3/h4 con enlaces
@@ -340,7 +189,7 @@ class WebsiteFourScraper(Scraper):
                     continue
                     
                 # Verificar keywords
-                if self.keywords and not any(keyword.lower().strip() in title.lower() for keyword in self.keywords):
+                if not self.matches_keywords(title):
                     print(f"Skipping article (no matching keywords): {title}")
                     continue
                 
@@ -363,83 +212,27 @@ class WebsiteFourScraper(Scraper):
                                 image['alt'] = img_element['alt']
                             break
                 
-                # Fetch article content
-                time.sleep(1)  # Be nice to the server
-                article_html = self.fetch_html(link)
-                
-                if article_html:
-                    article_soup = BeautifulSoup(article_html, 'html.parser')
-                    
-                    # Si no tenemos imagen desde el listado, buscamos en la página del artículo
-                    if not image['url']:
-                        image = self.extract_image(article_soup, link)
-                    
-                    # Buscar el contenido del artículo
-                    content_element = None
-                    for selector in [
-                        '.td-post-content',
-                        '.tdb_single_content',
-                        '.td_block_wrap .tdb-block-inner',
-                        'article .content',
-                        '.entry-content',
-                        '.post-content',
-                        'article'
-                    ]:
-                        content_element = article_soup.select_one(selector)
-                        if content_element:
-                            print(f"Found content with selector '{selector}'")
-                            break
-                    
-                    text = ""
-                    if content_element:
-                        # Limpiar el contenido
-                        for unwanted in content_element.select('script, style, .sharedaddy, .jp-relatedposts, .social-share, .comments-area, .navigation'):
-                            unwanted.decompose()
-                        
-                        paragraphs = content_element.find_all('p')
-                        if paragraphs:
-                            text = ' '.join([p.get_text(strip=True) for p in paragraphs])
-                        else:
-                            text = content_element.get_text(strip=True, separator=' ')
-                            
-                        print(f"Extracted {len(text)} characters of content")
-                    else:
-                        print(f"Could not find content for: {title}")
-                    
-                    date_info = self.extract_date(article_soup)
-
-                    # Añadir el artículo a nuestra lista
-                    articles.append({
-                        'title': title,
-                        'link': link,
-                        'text': text,
-                        'image': image,
-                        'date': date_info['raw'],
-                        'formatted_date': date_info['formatted']
-                    })
-                    print(f"Successfully added article: {title}")
-                else:
-                    print(f"Failed to fetch article content for: {title}")
+                candidates.append({'title': title, 'link': link, 'image': image})
             
             except Exception as e:
                 print(f"Error parsing article: {str(e)}")
                 continue
         
         # ---- SEGUNDA ESTRATEGIA: Si no se encontraron artículos, buscar en bloques de contenido ----
-        if not articles:
+        if not candidates:
             print("First strategy found no articles. Trying alternative approach...")
             
             # Bloques comunes en temas de newspaper
             block_elements = soup.select('.td_block_inner, .tdb-block-inner')
+            processed_links = set()  # Para evitar procesar el mismo enlace dos veces
             
             for block in block_elements:
                 links = block.find_all('a')
-                processed_links = set()  # Para evitar procesar el mismo enlace dos veces
                 
                 for link in links:
                     try:
                         # Break the loop if we've reached the limit
-                        if len(articles) >= self.article_limit:
+                        if len(candidates) >= self.article_limit:
                             break
                         
                         href = link.get('href')
@@ -464,72 +257,72 @@ class WebsiteFourScraper(Scraper):
                         print(f"Found potential article link: {title}")
                         
                         # Verificar keywords
-                        if self.keywords and not any(keyword.lower().strip() in title.lower() for keyword in self.keywords):
+                        if not self.matches_keywords(title):
                             print(f"Skipping article (no matching keywords): {title}")
                             continue
                         
-                        # Fetch article content
-                        time.sleep(1)
-                        article_html = self.fetch_html(href)
-                        
-                        if article_html:
-                            article_soup = BeautifulSoup(article_html, 'html.parser')
-                            
-                            # Obtener imagen del artículo
-                            image = self.extract_image(article_soup, href)
-                            
-                            # Buscar el contenido del artículo
-                            content_element = None
-                            for selector in [
-                                '.td-post-content',
-                                '.tdb_single_content',
-                                '.td_block_wrap .tdb-block-inner',
-                                'article .content',
-                                '.entry-content',
-                                '.post-content',
-                                'article'
-                            ]:
-                                content_element = article_soup.select_one(selector)
-                                if content_element:
-                                    break
-                            
-                            text = ""
-                            if content_element:
-                                # Limpiar el contenido
-                                for unwanted in content_element.select('script, style, .sharedaddy, .jp-relatedposts, .social-share, .comments-area, .navigation'):
-                                    unwanted.decompose()
-                                
-                                paragraphs = content_element.find_all('p')
-                                if paragraphs:
-                                    text = ' '.join([p.get_text(strip=True) for p in paragraphs])
-                                else:
-                                    text = content_element.get_text(strip=True, separator=' ')
-                                
-                                print(f"Extracted {len(text)} characters of content")
-                            else:
-                                print(f"Could not find content for: {title}")
-                            
-                            date_info = self.extract_date(article_soup)
-
-                            # Añadir el artículo a nuestra lista
-                            articles.append({
-                                'title': title,
-                                'link': link,
-                                'text': text,
-                                'image': image,
-                                'date': date_info['raw'],
-                                'formatted_date': date_info['formatted']
-                            })
-                            print(f"Successfully added article (strategy 2): {title}")
+                        candidates.append({'title': title, 'link': href})
                     except Exception as e:
                         print(f"Error processing link: {str(e)}")
         
-        print(f"Total articles found after all strategies: {len(articles)}")
-        return articles
+        return candidates
+
+    def parse_article(self, candidate, article_soup):
+        title = candidate['title']
+        link = candidate['link']
+        
+        # Si no tenemos imagen desde el listado, buscamos en la página del artículo
+        image = candidate.get('image')
+        if not image or not image['url']:
+            image = self.extract_image(article_soup, link)
+        
+        # Buscar el contenido del artículo
+        content_element = None
+        for selector in [
+            '.td-post-content',
+            '.tdb_single_content',
+            '.td_block_wrap .tdb-block-inner',
+            'article .content',
+            '.entry-content',
+            '.post-content',
+            'article'
+        ]:
+            content_element = article_soup.select_one(selector)
+            if content_element:
+                print(f"Found content with selector '{selector}'")
+                break
+        
+        text = ""
+        if content_element:
+            # Limpiar el contenido
+            for unwanted in content_element.select('script, style, .sharedaddy, .jp-relatedposts, .social-share, .comments-area, .navigation'):
+                unwanted.decompose()
+            
+            paragraphs = content_element.find_all('p')
+            if paragraphs:
+                text = ' '.join([p.get_text(strip=True) for p in paragraphs])
+            else:
+                text = content_element.get_text(strip=True, separator=' ')
+                
+            print(f"Extracted {len(text)} characters of content")
+        else:
+            print(f"Could not find content for: {title}")
+        
+        date_info = self.extract_date(article_soup)
+
+        return {
+            'title': title,
+            'link': link,
+            'text': text,
+            'image': image,
+            'date': date_info['raw'],
+            'formatted_date': date_info['formatted'],
+            'timestamp': date_info['timestamp']
+        }
 
     def analyze_page_structure(self, html_content):
         """Analyzes the page structure to help adjust selectors"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = self.parse_html(html_content)
         
         print("\n=== PAGE STRUCTURE ANALYSIS ===")
         print(f"Page title: {soup.title.text if soup.title else 'No title found'}")
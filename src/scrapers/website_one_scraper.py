@@ -1,25 +1,16 @@
-from bs4 import BeautifulSoup
-import requests
 from .scraper_base import Scraper
-import streamlit as st
+from src.utils.date_parser import parse_date
+from src.utils.settings import get_setting
 
 
 class WebsiteOneScraper(Scraper):
+    source_name = "Minería en Línea"
+
     def __init__(self, keywords):
         self.keywords = keywords.split(',') if isinstance(keywords, str) else keywords
-        self.base_url = st.secrets.get('WEBSITE_ONE_URL')
+        self.base_url = get_setting('WEBSITE_ONE_URL')
         self.article_limit = 15  # Set the article limit
 
-    def scrape(self):
-        html_content = self.fetch_html(self.base_url)
-        return self.parse_articles(html_content)
-
-    def fetch_html(self, url):
-        response = requests.get(url)
-        if response.status_code == 200:
-            return response.text
-        return None
-
     def extract_image(self, soup, url):
         """Extract main image from article"""
         image_url = None
@@ -70,18 +61,14 @@ class WebsiteOneScraper(Scraper):
             'alt': image_alt
         }
 
-    def parse_articles(self, html_content):
-        if not html_content:
-            return []
-            
-        soup = BeautifulSoup(html_content, 'html.parser')
-        articles = []
+    def extract_candidates(self, soup, html_content):
+        candidates = []
         
         # Update the selectors based on the actual HTML structure of miningmexico.com
         for item in soup.find_all('article'):
             try:
                 # Break the loop if we've reached the limit
-                if len(articles) >= self.article_limit:
+                if len(candidates) >= self.article_limit:
                     break
                     
                 title_element = item.find('h2', class_='entry-title')
@@ -92,60 +79,55 @@ class WebsiteOneScraper(Scraper):
                 link = title_element.find('a')['href']
                 
                 # Check if any keyword is in the title
-                if not any(keyword.lower() in title.lower() for keyword in self.keywords):
+                if not self.matches_keywords(title):
                     continue
                 
-                # Fetch the full article content
-                article_html = self.fetch_html(link)
-                article_soup = BeautifulSoup(article_html, 'html.parser')
-                
-                # Extract the featured image
-                image = self.extract_image(article_soup, link)
-                
-                # Extract the publication date
-                published_date = ""
-                formatted_date = ""
-                
-                # Intentar diferentes selectores para la fecha
-                date_selectors = [
-                    ('time.entry-date.published', 'datetime'),
-                    ('time.entry-date', 'datetime'),
-                    ('.post-date', 'text'),
-                    ('.meta-date', 'text'),
-                    ('span.date', 'text')
-                ]
-                
-                for selector, attr_type in date_selectors:
-                    date_element = article_soup.select_one(selector)
-                    if date_element:
-                        if attr_type == 'datetime' and date_element.has_attr('datetime'):
-                            published_date = date_element['datetime']
-                            # Intentar formatear fecha ISO
-                            try:
-                                from datetime import datetime
-                                date_obj = datetime.fromisoformat(published_date.replace('Z', '+00:00'))
-                                formatted_date = date_obj.strftime("%d/%m/%Y")
-                            except:
-                                formatted_date = date_element.text.strip()
-                        else:
-                            published_date = date_element.text.strip()
-                            formatted_date = published_date
-                        break
-                
-                # Get the content (adjust the selector based on actual HTML)
-                content_element = article_soup.find('div', class_='entry-content')
-                text = content_element.get_text(strip=True) if content_element else ""
-                
-                articles.append({
-                    'title': title,
-                    'link': link,
-                    'text': text,
-                    'image': image,
-                    'date': published_date,  # Fecha original
-                    'formatted_date': formatted_date  # Fecha formateada para mostrar
-                })
+                candidates.append({'title': title, 'link': link})
             except Exception as e:
                 print(f"Error parsing article: {e}")
                 continue
                 
-        return articles
\ No newline at end of file
+        return candidates
+
+    def parse_article(self, candidate, article_soup):
+        link = candidate['link']
+        
+        # Extract the featured image
+        image = self.extract_image(article_soup, link)
+        
+        # Extract the publication date
+        published_date = ""
+        
+        # Intentar diferentes selectores para la fecha
+        date_selectors = [
+            ('time.entry-date.published', 'datetime'),
+            ('time.entry-date', 'datetime'),
+            ('.post-date', 'text'),
+            ('.meta-date', 'text'),
+            ('span.date', 'text')
+        ]
+        
+        for selector, attr_type in date_selectors:
+            date_element = article_soup.select_one(selector)
+            if date_element:
+                if attr_type == 'datetime' and date_element.has_attr('datetime'):
+                    published_date = date_element['datetime']
+                else:
+                    published_date = date_element.text.strip()
+                break
+        
+        date_info = parse_date(published_date)
+        
+        # Get the content (adjust the selector based on actual HTML)
+        content_element = article_soup.find('div', class_='entry-content')
+        text = content_element.get_text(strip=True) if content_element else ""
+        
+        return {
+            'title': candidate['title'],
+            'link': link,
+            'text': text,
+            'image': image,
+            'date': date_info['raw'],  # Fecha original
+            'formatted_date': date_info['formatted'],  # Fecha formateada para mostrar
+            'timestamp': date_info['timestamp']  # Para ordenar por fecha
+        }
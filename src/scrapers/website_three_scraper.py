@@ -1,43 +1,17 @@
-from bs4 import BeautifulSoup
-import requests
-import time
 import re
 from .scraper_base import Scraper
-import streamlit as st
+from src.utils.date_parser import parse_date, find_date
+from src.utils.settings import get_setting
 
 
 class WebsiteThreeScraper(Scraper):
+    source_name = "Cluster Minero"
+
     def __init__(self, keywords):
         self.keywords = keywords.split(',') if isinstance(keywords, str) else keywords
-        self.base_url = st.secrets.get('WEBSITE_THREE_URL')
+        self.base_url = get_setting('WEBSITE_THREE_URL')
         self.article_limit = 15  # Set the article limit
         
-    def scrape(self):
-        print(f"Starting scrape of {self.base_url}")
-        html_content = self.fetch_html(self.base_url)
-        return self.parse_articles(html_content)
-
-    def fetch_html(self, url):
-        try:
-            print(f"Fetching HTML from {url}")
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-                "Accept-Language": "en-US,en;q=0.5",
-                "Connection": "keep-alive",
-                "Upgrade-Insecure-Requests": "1",
-                "Cache-Control": "max-age=0"
-            }
-            # Use a session to handle cookies
-            session = requests.Session()
-            response = session.get(url, headers=headers, timeout=15)
-            response.raise_for_status()
-            print(f"Successfully fetched {url} (Status: {response.status_code})")
-            return response.text
-        except Exception as e:
-            print(f"Error fetching {url}: {str(e)}")
-            return None
-
     def extract_image(self, soup, url):
         """
         Extract main image from article
@@ -135,7 +109,6 @@ class WebsiteThreeScraper(Scraper):
         /html/body/div[3]/div[1]/div[1]/div[1]/div[1]/text()
         """
         date_text = ""
-        formatted_date = ""
         
         try:
             # Buscar el div con class="info" - este es el contenedor principal
@@ -148,36 +121,17 @@ class WebsiteThreeScraper(Scraper):
                 for content in info_div.contents:
                     # Los nodos de texto son NavigableString en BeautifulSoup
                     if isinstance(content, str) and content.strip():
-                        potential_date = content.strip()
-                        print(f"Found potential date text: '{potential_date}'")
-                        
-                        # Verificar si este texto tiene el formato esperado de fecha
-                        import re
-                        date_match = re.search(r'\b\d{1,2}\s+de\s+[a-zé]+(?:\s+de)?\s+\d{4}\b', potential_date, re.IGNORECASE)
-                        if date_match:
-                            date_text = date_match.group(0)
+                        date_text = find_date(content)
+                        if date_text:
                             print(f"✅ Extracted date from text node: '{date_text}'")
                             break
                 
                 # Si no encontramos la fecha en los nodos de texto directos
                 if not date_text:
-                    # Obtener todo el texto del div y buscar patrones de fecha
-                    full_text = info_div.get_text(strip=True)
-                    print(f"Full text in info div: '{full_text}'")
-                    
-                    # Buscar patrones de fecha en el texto completo
-                    date_patterns = [
-                        r'\b\d{1,2}\s+de\s+[a-zé]+(?:\s+de)?\s+\d{4}\b',  # "15 de abril de 2023"
-                        r'\b\d{1,2}/\d{1,2}/\d{4}\b',                     # "15/04/2023"
-                        r'\b\d{4}-\d{1,2}-\d{1,2}\b'                      # "2023-04-15"
-                    ]
-                    
-                    for pattern in date_patterns:
-                        match = re.search(pattern, full_text, re.IGNORECASE)
-                        if match:
-                            date_text = match.group(0)
-                            print(f"✅ Extracted date using pattern: '{date_text}'")
-                            break
+                    # Buscar patrones de fecha en todo el texto del div
+                    date_text = find_date(info_div.get_text(strip=True))
+                    if date_text:
+                        print(f"✅ Extracted date using pattern: '{date_text}'")
             
             # Si aún no tenemos fecha, intentar aproximación específica de XPath
             if not date_text:
@@ -206,18 +160,9 @@ class WebsiteThreeScraper(Scraper):
                         # Extraer nodos de texto directos
                         for content in current.contents:
                             if isinstance(content, str) and content.strip():
-                                potential_date = content.strip()
-                                print(f"Found text at target XPath location: '{potential_date}'")
-                                
-                                # Verificar si este texto tiene formato de fecha
-                                for pattern in date_patterns:
-                                    match = re.search(pattern, potential_date, re.IGNORECASE)
-                                    if match:
-                                        date_text = match.group(0)
-                                        print(f"✅ Extracted date from XPath location: '{date_text}'")
-                                        break
-                                
-                                if date_text:  # Si encontramos la fecha, salimos
+                                date_text = find_date(content)
+                                if date_text:
+                                    print(f"✅ Extracted date from XPath location: '{date_text}'")
                                     break
             
             # Si todavía no tenemos fecha, intentar otros selectores comunes
@@ -241,91 +186,23 @@ class WebsiteThreeScraper(Scraper):
                             date_text = date_element.get_text(strip=True)
                         print(f"Found date with alternate selector '{selector}': {date_text}")
                         break
-            
-            # Formatear la fecha para mostrarla consistentemente
-            if date_text:
-                try:
-                    # Formato común en español: "15 de abril de 2023" o "15 abril 2023"
-                    import re
-                    from datetime import datetime
-                    
-                    # Patrones comunes en español
-                    patterns = [
-                        r'(\d{1,2})\s+de\s+([a-zé]+)(?:\s+de)?\s+(\d{4})',  # "15 de abril de 2023" o "15 de abril 2023"
-                        r'(\d{1,2})\s+([a-zé]+)\s+(\d{4})',                 # "15 abril 2023"
-                        r'(\d{1,2})/(\d{1,2})/(\d{4})',                     # "15/04/2023"
-                        r'(\d{4})-(\d{1,2})-(\d{1,2})'                      # "2023-04-15"
-                    ]
-                    
-                    date_match = None
-                    matched_pattern = None
-                    
-                    for pattern in patterns:
-                        match = re.search(pattern, date_text.lower())
-                        if match:
-                            date_match = match.groups()
-                            matched_pattern = pattern
-                            break
-                    
-                    if date_match:
-                        if matched_pattern == patterns[0] or matched_pattern == patterns[1]:
-                            # Convertir nombre del mes en español al número
-                            month_names = {
-                                'enero': 1, 'febrero': 2, 'marzo': 3, 'abril': 4, 
-                                'mayo': 5, 'junio': 6, 'julio': 7, 'agosto': 8, 
-                                'septiembre': 9, 'octubre': 10, 'noviembre': 11, 'diciembre': 12
-                            }
-                            
-                            day = int(date_match[0])
-                            month = month_names.get(date_match[1].lower(), 1)  # Valor por defecto 1 si no se encuentra
-                            year = int(date_match[2])
-                            
-                            date_obj = datetime(year, month, day)
-                            formatted_date = date_obj.strftime("%d/%m/%Y")
-                        elif matched_pattern == patterns[2]:
-                            # Formato "15/04/2023"
-                            day = int(date_match[0])
-                            month = int(date_match[1])
-                            year = int(date_match[2])
-                            
-                            date_obj = datetime(year, month, day)
-                            formatted_date = date_obj.strftime("%d/%m/%Y")
-                        elif matched_pattern == patterns[3]:
-                            # Formato "2023-04-15"
-                            year = int(date_match[0])
-                            month = int(date_match[1])
-                            day = int(date_match[2])
-                            
-                            date_obj = datetime(year, month, day)
-                            formatted_date = date_obj.strftime("%d/%m/%Y")
-                        else:
-                            formatted_date = date_text
-                    else:
-                        # Si no pudimos extraer con regex, dejamos el texto original
-                        formatted_date = date_text
-                except Exception as e:
-                    print(f"Error formatting date: {e}")
-                    formatted_date = date_text
         
         except Exception as e:
             print(f"Error extracting date: {e}")
         
-        return {
-            'raw': date_text,
-            'formatted': formatted_date
-        }
+        return parse_date(date_text)
 
-    def parse_articles(self, html_content):
-        """Parse the HTML content to extract articles"""
-        if not html_content:
-            print("No HTML content retrieved from ProMineria.com")
-            return []
-            
-        soup = BeautifulSoup(html_content, 'html.parser')
-        articles = []
-        
-        # Debug information
-        print(f"Page title: {soup.title.text if soup.title else 'No title found'}")
+    def make_absolute(self, link):
+        """Make URL absolute if it's relative"""
+        if link.startswith('//'):
+            link = 'https:' + link
+        elif not link.startswith(('http://', 'https://')):
+            link = f"https://www.promineria.com/{link.lstrip('/')}"
+        return link
+
+    def extract_candidates(self, soup, html_content):
+        """Parse the listing page to find the articles to fetch"""
+        candidates = []
         
         # First, try to find news blocks with the specific structure described
         news_container = soup.find('div', class_='portada_noticias_cuadro')
@@ -339,7 +216,7 @@ class WebsiteThreeScraper(Scraper):
             for item in news_items:
                 try:
                     # Break the loop if we've reached the limit
-                    if len(articles) >= self.article_limit:
+                    if len(candidates) >= self.article_limit:
                         break
                     
                     # Extract the background image URL from style attribute
@@ -365,72 +242,27 @@ class WebsiteThreeScraper(Scraper):
                         
                     print(f"Found article: {title}")
                     
-                    # Make URL absolute if it's relative
-                    if link.startswith('//'):
-                        link = 'https:' + link
-                    elif not link.startswith(('http://', 'https://')):
-                        link = f"https://www.promineria.com/{link.lstrip('/')}"
+                    link = self.make_absolute(link)
                     
                     # Check keywords in title
-                    if self.keywords and not any(keyword.lower().strip() in title.lower() for keyword in self.keywords):
+                    if not self.matches_keywords(title):
                         print(f"Skipping article (no matching keywords): {title}")
                         continue
                     
-                    # Fetch article content
-                    time.sleep(1)
-                    article_html = self.fetch_html(link)
-                    if not article_html:
-                        print(f"Failed to fetch article content for: {title}")
-                        continue
-                        
-                    article_soup = BeautifulSoup(article_html, 'html.parser')
-                    
-                    # Look for the article content
-                    content_element = article_soup.find('div', class_='nota_contenido')
-                    
-                    if not content_element:
-                        # Try other common content containers
-                        content_element = article_soup.select_one('#cuerpo_nota, .contenido, .entry-content, article')
-                    
-                    if not content_element:
-                        print(f"Could not find content for: {title}")
-                        text = ""
-                    else:
-                        # Clean content
-                        for unwanted in content_element.select('script, style, nav, footer, .comentarios, .redes_sociales'):
-                            unwanted.decompose()
-                        
-                        text = content_element.get_text(strip=True, separator=' ')
-                        print(f"Extracted {len(text)} characters of content")
-                    
                     # Create image object
                     image = {
                         'url': 'https:' + image_url if image_url and image_url.startswith('//') else image_url,
                         'alt': title
                     }
                     
-                    # If we don't have an image from the list, try to extract it from the article page
-                    if not image['url']:
-                        image = self.extract_image(article_soup, link)
-                    
-                    date_info = self.extract_date(article_soup)
-
-                    articles.append({
-                        'title': title,
-                        'link': link,
-                        'text': text,
-                        'image': image,
-                        'date': date_info['raw'],
-                        'formatted_date': date_info['formatted']
-                    })
-                    print(f"Successfully added article: {title}")
+                    candidates.append({'title': title, 'link': link, 'image': image})
                     
                 except Exception as e:
                     print(f"Error parsing article: {str(e)}")
                     continue
         
         # If we didn't find any articles with the specific structure, try an alternative approach
-        if not articles:
+        if not candidates:
             print("No articles found with the specific structure, trying alternative approach...")
             
             # Look for articles with more generic selectors
@@ -440,7 +272,7 @@ class WebsiteThreeScraper(Scraper):
             for link_element in article_links:
                 try:
                     # Break the loop if we've reached the limit
-                    if len(articles) >= self.article_limit:
+                    if len(candidates) >= self.article_limit:
                         break
                     
                     title = link_element.get_text(strip=True)
@@ -451,61 +283,59 @@ class WebsiteThreeScraper(Scraper):
                     if not link:
                         continue
                     
-                    # Make URL absolute
-                    if link.startswith('//'):
-                        link = 'https:' + link
-                    elif not link.startswith(('http://', 'https://')):
-                        link = f"https://www.promineria.com/{link.lstrip('/')}"
+                    link = self.make_absolute(link)
                     
                     print(f"Found article with generic selector: {title}")
                     
                     # Check keywords in title
-                    if self.keywords and not any(keyword.lower().strip() in title.lower() for keyword in self.keywords):
+                    if not self.matches_keywords(title):
                         print(f"Skipping article (no matching keywords): {title}")
                         continue
                     
-                    # Fetch article content
-                    time.sleep(1)
-                    article_html = self.fetch_html(link)
-                    if not article_html:
-                        continue
-                        
-                    article_soup = BeautifulSoup(article_html, 'html.parser')
-                    
-                    # Extract image from article
-                    image = self.extract_image(article_soup, link)
-                    
-                    # Look for content
-                    content_element = article_soup.find('div', class_='nota_contenido')
-                    
-                    if not content_element:
-                        content_element = article_soup.select_one('#cuerpo_nota, .contenido, .entry-content, article')
-                        
-                    if not content_element:
-                        print(f"Could not find content for: {title}")
-                        text = ""
-                    else:
-                        # Clean content
-                        for unwanted in content_element.select('script, style, nav, footer'):
-                            unwanted.decompose()
-                            
-                        text = content_element.get_text(strip=True, separator=' ')
-                        print(f"Extracted {len(text)} characters of content")
-                    
-                    date_info = self.extract_date(article_soup)
-
-                    articles.append({
-                        'title': title,
-                        'link': link,
-                        'text': text,
-                        'image': image,
-                        'date': date_info['raw'],
-                        'formatted_date': date_info['formatted']
-                    })
+                    candidates.append({'title': title, 'link': link})
                     
                 except Exception as e:
                     print(f"Error processing article with generic selector: {str(e)}")
                     continue
         
-        print(f"Total articles found after filtering: {len(articles)}")
-        return articles
\ No newline at end of file
+        return candidates
+
+    def parse_article(self, candidate, article_soup):
+        """Extract content, image and date from the article page"""
+        title = candidate['title']
+        link = candidate['link']
+        
+        # Look for the article content
+        content_element = article_soup.find('div', class_='nota_contenido')
+        
+        if not content_element:
+            # Try other common content containers
+            content_element = article_soup.select_one('#cuerpo_nota, .contenido, .entry-content, article')
+        
+        if not content_element:
+            print(f"Could not find content for: {title}")
+            text = ""
+        else:
+            # Clean content
+            for unwanted in content_element.select('script, style, nav, footer, .comentarios, .redes_sociales'):
+                unwanted.decompose()
+            
+            text = content_element.get_text(strip=True, separator=' ')
+            print(f"Extracted {len(text)} characters of content")
+        
+        # If we don't have an image from the list, try to extract it from the article page
+        image = candidate.get('image')
+        if not image or not image['url']:
+            image = self.extract_image(article_soup, link)
+        
+        date_info = self.extract_date(article_soup)
+
+        return {
+            'title': title,
+            'link': link,
+            'text': text,
+            'image': image,
+            'date': date_info['raw'],
+            'formatted_date': date_info['formatted'],
+            'timestamp': date_info['timestamp']
+        }
@@ -1,43 +1,18 @@
 
-from bs4 import BeautifulSoup
-import requests
-import time
 import re
 from .scraper_base import Scraper
-import streamlit as st
+from src.utils.date_parser import parse_date, find_date
+from .parsers import fragment_text
+from src.utils.settings import get_setting
 
 class WebsiteTwoScraper(Scraper):
+    source_name = "Mundo Minero"
+
     def __init__(self, keywords):
         self.keywords = keywords.split(',') if isinstance(keywords, str) else keywords
-        self.base_url = st.secrets.get('WEBSITE_TWO_URL')
+        self.base_url = get_setting('WEBSITE_TWO_URL')
         self.article_limit = 15  # Límite de artículos
         
-    def scrape(self):
-        print(f"Starting scrape of {self.base_url}")
-        html_content = self.fetch_html(self.base_url)
-        return self.parse_articles(html_content)
-
-    def fetch_html(self, url):
-        try:
-            print(f"Fetching HTML from {url}")
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-                "Accept-Language": "en-US,en;q=0.5",
-                "Connection": "keep-alive",
-                "Upgrade-Insecure-Requests": "1",
-                "Cache-Control": "max-age=0"
-            }
-            # Use a session to handle cookies (important for popup handling)
-            session = requests.Session()
-            response = session.get(url, headers=headers, timeout=15)
-            response.raise_for_status()
-            print(f"Successfully fetched {url} (Status: {response.status_code})")
-            return response.text
-        except Exception as e:
-            print(f"Error fetching {url}: {str(e)}")
-            return None
-
     def extract_image(self, soup, url):
         """Extract main image from article"""
         image_url = None
@@ -120,7 +95,6 @@ class WebsiteTwoScraper(Scraper):
     def extract_date(self, soup):
         """Extract publication date from MundoMinero article"""
         date_text = ""
-        formatted_date = ""
         
         try:
             # Estrategia 1: Buscar directamente el span con clase tt-post-date
@@ -138,102 +112,34 @@ class WebsiteTwoScraper(Scraper):
                         date_text = date_span.text.strip()
                         print(f"Fecha encontrada en div.tt-post-label > span.tt-post-date: '{date_text}'")
             
-            # Estrategia 3: Buscar por el texto contenido en cualquier elemento
+            # Estrategia 3: Buscar el primer nodo de texto con una fecha en español
+            # (solo se recorren los textos, no el texto completo de cada subárbol)
             if not date_text:
-                # Buscar texto que contenga patrones de meses en español
-                month_patterns = ['enero', 'febrero', 'marzo', 'abril', 'mayo', 'junio', 
-                                'julio', 'agosto', 'septiembre', 'octubre', 'noviembre', 'diciembre']
-                
-                for element in soup.find_all(['span', 'div', 'time']):
-                    text = element.text.strip().lower()
-                    if any(month in text for month in month_patterns) and any(str(year) in text for year in range(2020, 2030)):
-                        date_text = element.text.strip()
-                        print(f"Fecha encontrada por patrón de mes y año: '{date_text}'")
-                        break
+                date_node = soup.find(string=lambda text: bool(find_date(text)))
+                if date_node:
+                    date_text = find_date(date_node)
+                    print(f"Fecha encontrada por patrón de mes y año: '{date_text}'")
             
-            # Si encontramos alguna fecha, intentar formatearla consistentemente
-            if date_text:
-                import re
-                from datetime import datetime
-                
-                # Mapeado de nombres de meses en español a números
-                month_names = {
-                    'enero': 1, 'febrero': 2, 'marzo': 3, 'abril': 4, 
-                    'mayo': 5, 'junio': 6, 'julio': 7, 'agosto': 8, 
-                    'septiembre': 9, 'octubre': 10, 'noviembre': 11, 'diciembre': 12
-                }
-                
-                # Formato específico de MundoMinero: "abril 14, 2025"
-                pattern1 = re.compile(r'(\w+)\s+(\d{1,2}),?\s+(\d{4})')
-                match = pattern1.search(date_text.lower())
-                
-                if match:
-                    # Formato "mes día, año" (abril 14, 2025)
-                    month_name, day, year = match.groups()
-                    if month_name.lower() in month_names:
-                        month = month_names[month_name.lower()]
-                        try:
-                            date_obj = datetime(int(year), month, int(day))
-                            formatted_date = date_obj.strftime("%d/%m/%Y")
-                            print(f"Fecha formateada exitosamente: {formatted_date}")
-                        except ValueError as e:
-                            print(f"Error al formatear fecha: {e}")
-                            formatted_date = date_text
-                else:
-                    # Intentar otros formatos comunes en español
-                    # Formato "día de mes de año" (15 de abril de 2023)
-                    pattern2 = re.compile(r'(\d{1,2})\s+de\s+(\w+)(?:\s+de)?\s+(\d{4})')
-                    match = pattern2.search(date_text.lower())
-                    
-                    if match:
-                        day, month_name, year = match.groups()
-                        if month_name in month_names:
-                            month = month_names[month_name]
-                            try:
-                                date_obj = datetime(int(year), month, int(day))
-                                formatted_date = date_obj.strftime("%d/%m/%Y")
-                            except ValueError:
-                                formatted_date = date_text
-                    else:
-                        # Formato numérico (15/04/2023)
-                        pattern3 = re.compile(r'(\d{1,2})[/\-](\d{1,2})[/\-](\d{4})')
-                        match = pattern3.search(date_text)
-                        
-                        if match:
-                            if '/' in date_text:  # Formato DD/MM/YYYY
-                                day, month, year = match.groups()
-                            else:  # Formato YYYY-MM-DD
-                                year, month, day = match.groups()
-                            
-                            try:
-                                date_obj = datetime(int(year), int(month), int(day))
-                                formatted_date = date_obj.strftime("%d/%m/%Y")
-                            except ValueError:
-                                formatted_date = date_text
-                        else:
-                            # Si no se pudo parsear, usar la fecha original
-                            formatted_date = date_text
-            else:
+            if not date_text:
                 print("No se encontró fecha en el artículo")
         
         except Exception as e:
             print(f"Error general al extraer fecha: {e}")
         
-        return {
-            'raw': date_text,
-            'formatted': formatted_date
-        }
+        return parse_date(date_text)
 
-    def parse_articles(self, html_content):
-        if not html_content:
-            print("No HTML content retrieved from MundoMinero.mx")
-            return []
-            
-        soup = BeautifulSoup(html_content, 'html.parser')
-        articles = []
-        
-        # Debug information
-        print(f"Page title: {soup.title.text if soup.title else 'No title found'}")
+    def make_absolute(self, link):
+        """Make sure URL is absolute"""
+        if not link.startswith('http'):
+            if link.startswith('/'):
+                base_domain = '/'.join(self.base_url.split('/')[:3])
+                link = base_domain + link
+            else:
+                link = f"{self.base_url.rstrip('/')}/{link.lstrip('/')}"
+        return link
+
+    def extract_candidates(self, soup, html_content):
+        candidates = []
         
         # Try the specific MundoMinero.mx title class you identified
         title_elements = soup.find_all(class_="tt-post-title c-h5")
@@ -244,7 +150,7 @@ class WebsiteTwoScraper(Scraper):
             for title_element in title_elements:
                 try:
                     # Break the loop if we've reached the limit
-                    if len(articles) >= self.article_limit:
+                    if len(candidates) >= self.article_limit:
                         break
                         
                     # Extract the title
@@ -268,89 +174,22 @@ class WebsiteTwoScraper(Scraper):
                         print(f"No link found for article: {title}")
                         continue
                         
-                    link = link_element['href']
-                    
-                    # Make sure URL is absolute
-                    if not link.startswith('http'):
-                        if link.startswith('/'):
-                            base_domain = '/'.join(self.base_url.split('/')[:3])
-                            link = base_domain + link
-                        else:
-                            link = f"{self.base_url.rstrip('/')}/{link.lstrip('/')}"
+                    link = self.make_absolute(link_element['href'])
                     
                     print(f"Found article: {title} - {link}")
                     
                     # Check if any keyword is in the title
-                    if self.keywords and not any(keyword.lower() in title.lower() for keyword in self.keywords):
+                    if not self.matches_keywords(title):
                         print(f"Skipping article (no matching keywords): {title}")
                         continue
                     
-                    # Add a small delay to not overload the server
-                    time.sleep(1)
-                    
-                    # Fetch the full article content
-                    article_html = self.fetch_html(link)
-                    if not article_html:
-                        print(f"Failed to fetch article content for: {title}")
-                        continue
-                        
-                    article_soup = BeautifulSoup(article_html, 'html.parser')
-                    
-                    # Extract the featured image
-                    image = self.extract_image(article_soup, link)
-                    # Extract the publication date
-                    date_info = self.extract_date(article_soup)
-                    
-                    # Try MundoMinero specific content selectors first
-                    content_element = article_soup.find(class_='tt-blog-content')
-                    
-                    # If that fails, try multiple generic content selector patterns
-                    if not content_element:
-                        for selector in [
-                            'div.post-content',
-                            'div.entry-content', 
-                            'div.tt-content',
-                            'div.content-inner',
-                            'article div.post-content', 
-                            'div.content',
-                            'article', 
-                            'div.entry',
-                            'div.post',
-                            'main',
-                            'div#content'
-                        ]:
-                            content_element = article_soup.select_one(selector)
-                            if content_element:
-                                print(f"Found content with selector '{selector}'")
-                                break
-                    
-                    if not content_element:
-                        print(f"Could not find content for: {title}")
-                        text = ""
-                    else:
-                        # Remove unwanted elements from content
-                        for unwanted in content_element.select('script, style, nav, footer, .navigation, .comments, .related-posts, .fusion-sharing-box, .fusion-meta-info'):
-                            unwanted.decompose()
-                        
-                        text = content_element.get_text(strip=True, separator=' ')
-                        print(f"Extracted {len(text)} characters of content")
-                    
-                    articles.append({
-                        'title': title,
-                        'link': link,
-                        'text': text,
-                        'image': image,
-                        'date': date_info['raw'],
-                        'formatted_date': date_info['formatted']
-                    })
-                    print(f"Successfully added article: {title}")
+                    candidates.append({'title': title, 'link': link})
                     
                 except Exception as e:
                     print(f"Error parsing article: {e}")
                     continue
             
-            print(f"Total articles found after filtering: {len(articles)}")
-            return articles
+            return candidates
                     
         # If we didn't find articles using the specific class, fall back to the original approach
         print("No title elements found with class 'tt-post-title c-h5', trying alternative approaches...")
@@ -364,7 +203,7 @@ class WebsiteTwoScraper(Scraper):
             for container in article_containers:
                 try:
                     # Break the loop if we've reached the limit
-                    if len(articles) >= self.article_limit:
+                    if len(candidates) >= self.article_limit:
                         break
                     
                     # Try to find the title in this container
@@ -403,87 +242,22 @@ class WebsiteTwoScraper(Scraper):
                         print(f"No link found for article: {title}")
                         continue
                         
-                    link = link_element['href']
-                    
-                    # Make URL absolute
-                    if not link.startswith('http'):
-                        if link.startswith('/'):
-                            base_domain = '/'.join(self.base_url.split('/')[:3])
-                            link = base_domain + link
-                        else:
-                            link = f"{self.base_url.rstrip('/')}/{link.lstrip('/')}"
+                    link = self.make_absolute(link_element['href'])
                     
                     print(f"Found article: {title} - {link}")
                     
                     # Check keywords
-                    if self.keywords and not any(keyword.lower() in title.lower() for keyword in self.keywords):
+                    if not self.matches_keywords(title):
                         print(f"Skipping article (no matching keywords): {title}")
                         continue
                     
-                    # Fetch article content
-                    time.sleep(1)
-                    article_html = self.fetch_html(link)
-                    if not article_html:
-                        print(f"Failed to fetch article content for: {title}")
-                        continue
-                        
-                    article_soup = BeautifulSoup(article_html, 'html.parser')
-                    
-                    # Extract the featured image
-                    image = self.extract_image(article_soup, link)
-
-                    # Extract the publication date
-                    date_info = self.extract_date(article_soup)
-                    
-                    # Try to find content
-                    content_element = article_soup.find(class_='tt-blog-content')
-                    
-                    if not content_element:
-                        for selector in [
-                            'div.post-content',
-                            'div.entry-content', 
-                            'div.tt-content',
-                            'div.content-inner',
-                            'article div.post-content', 
-                            'div.content',
-                            'article', 
-                            'div.entry',
-                            'div.post',
-                            'main',
-                            'div#content'
-                        ]:
-                            content_element = article_soup.select_one(selector)
-                            if content_element:
-                                print(f"Found content with selector '{selector}'")
-                                break
-                    
-                    if not content_element:
-                        print(f"Could not find content for: {title}")
-                        text = ""
-                    else:
-                        # Clean content
-                        for unwanted in content_element.select('script, style, nav, footer, .navigation, .comments, .related-posts'):
-                            unwanted.decompose()
-                        
-                        text = content_element.get_text(strip=True, separator=' ')
-                        print(f"Extracted {len(text)} characters of content")
-                    
-                    articles.append({
-                        'title': title,
-                        'link': link,
-                        'text': text,
-                        'image': image,
-                        'date': date_info['raw'],
-                        'formatted_date': date_info['formatted']
-                    })
-                    print(f"Successfully added article: {title}")
+                    candidates.append({'title': title, 'link': link})
                     
                 except Exception as e:
                     print(f"Error parsing article: {e}")
                     continue
                     
-            print(f"Total articles found after filtering: {len(articles)}")
-            return articles
+            return candidates
             
         # Last resort - direct HTML search
         print("Attempting direct HTML pattern matching...")
@@ -503,91 +277,102 @@ class WebsiteTwoScraper(Scraper):
                 print(f"Found {len(matches)} potential titles with pattern: {pattern}")
                 all_matches.extend(matches)
                 
-        if all_matches:
-            # Try to extract titles and links from the matches
-            for match in all_matches:
-                try:
-                    # Break the loop if we've reached the limit
-                    if len(articles) >= self.article_limit:
-                        break
-                    
-                    # Extract text from the match
-                    if isinstance(match, tuple):
-                        # If the pattern captured multiple groups
-                        link = match[0]
-                        title_html = match[1]
+        # Try to extract titles and links from the matches
+        for match in all_matches:
+            try:
+                # Break the loop if we've reached the limit
+                if len(candidates) >= self.article_limit:
+                    break
+                
+                # Extract text from the match
+                if isinstance(match, tuple):
+                    # If the pattern captured multiple groups
+                    link = match[0]
+                    title_html = match[1]
+                else:
+                    # If the pattern captured just one group (the title)
+                    title_html = match
+                    
+                    # Try to find a nearby link
+                    link_pattern = f'<a[^>]*href="([^"]+)"[^>]*>{re.escape(title_html)}</a>'
+                    link_match = re.search(link_pattern, html_content, re.DOTALL)
+                    if link_match:
+                        link = link_match.group(1)
                     else:
-                        # If the pattern captured just one group (the title)
-                        title_html = match
-                        
-                        # Try to find a nearby link
-                        link_pattern = f'<a[^>]*href="([^"]+)"[^>]*>{re.escape(title_html)}</a>'
-                        link_match = re.search(link_pattern, html_content, re.DOTALL)
-                        if link_match:
-                            link = link_match.group(1)
-                        else:
-                            # Can't find a link, skip this match
-                            continue
-                    
-                    # Parse the HTML to get clean text
-                    title = BeautifulSoup(title_html, 'html.parser').get_text(strip=True)
-                    if not title:
-                        continue
-                        
-                    # Make URL absolute
-                    if not link.startswith('http'):
-                        if link.startswith('/'):
-                            base_domain = '/'.join(self.base_url.split('/')[:3])
-                            link = base_domain + link
-                        else:
-                            link = f"{self.base_url.rstrip('/')}/{link.lstrip('/')}"
-                            
-                    print(f"Found article via direct HTML extraction: {title} - {link}")
-                    
-                    # Check keywords
-                    if self.keywords and not any(keyword.lower() in title.lower() for keyword in self.keywords):
-                        print(f"Skipping article (no matching keywords): {title}")
+                        # Can't find a link, skip this match
                         continue
-                        
-                    # Fetch article content
-                    time.sleep(1)
-                    article_html = self.fetch_html(link)
-                    if not article_html:
-                        continue
-                        
-                    # Parse the article content
-                    article_soup = BeautifulSoup(article_html, 'html.parser')
-                    
-                    # Extract the featured image
-                    image = self.extract_image(article_soup, link)
-
-                    # Extract the publication date
-                    date_info = self.extract_date(article_soup)
-                    
-                    # Look for content using multiple selectors
-                    content_element = article_soup.find(class_='tt-blog-content')
+                
+                # Get clean text without parsing the fragment again
+                title = fragment_text(title_html)
+                if not title:
+                    continue
                     
-                    if not content_element:
-                        content_element = article_soup.select_one('div.content, div.entry-content, article')
+                link = self.make_absolute(link)
                         
-                    if content_element:
-                        text = content_element.get_text(strip=True, separator=' ')
-                    else:
-                        text = ""
-                        
-                    articles.append({
-                        'title': title,
-                        'link': link,
-                        'text': text,
-                        'image': image,
-                        'date': date_info['raw'],
-                        'formatted_date': date_info['formatted']
-                    })
-                    
-                except Exception as e:
-                    print(f"Error processing match: {e}")
+                print(f"Found article via direct HTML extraction: {title} - {link}")
+                
+                # Check keywords
+                if not self.matches_keywords(title):
+                    print(f"Skipping article (no matching keywords): {title}")
                     continue
                     
-        # Return the articles we found
-        print(f"Total articles found after filtering: {len(articles)}")
-        return articles
\ No newline at end of file
+                candidates.append({'title': title, 'link': link})
+                
+            except Exception as e:
+                print(f"Error processing match: {e}")
+                continue
+                    
+        return candidates
+
+    def parse_article(self, candidate, article_soup):
+        title = candidate['title']
+        link = candidate['link']
+        
+        # Extract the featured image
+        image = self.extract_image(article_soup, link)
+        # Extract the publication date
+        date_info = self.extract_date(article_soup)
+        
+        # Try MundoMinero specific content selectors first
+        content_element = article_soup.find(class_='tt-blog-content')
+        
+        # If that fails, try multiple generic content selector patterns
+        if not content_element:
+            for selector in [
+                'div.post-content',
+                'div.entry-content', 
+                'div.tt-content',
+                'div.content-inner',
+                'article div.post-content', 
+                'div.content',
+                'article', 
+                'div.entry',
+                'div.post',
+                'main',
+                'div#content'
+            ]:
+                content_element = article_soup.select_one(selector)
+                if content_element:
+                    print(f"Found content with selector '{selector}'")
+                    break
+        
+        if not content_element:
+            print(f"Could not find content for: {title}")
+            text = ""
+        else:
+            # Remove unwanted elements from content
+            for unwanted in content_element.select('script, style, nav, footer, .navigation, .comments, .related-posts, .fusion-sharing-box, .fusion-meta-info'):
+                unwanted.decompose()
+            
+            text = content_element.get_text(strip=True, separator=' ')
+            print(f"Extracted {len(text)} characters of content")
+        
+        return {
+            'title': title,
+            'link': link,
+            'text': text,
+            'image': image,
+            'date': date_info['raw'],
+            'formatted_date': date_info['formatted'],
+            'timestamp': date_info['timestamp']
+        }
@@ -0,0 +1,26 @@
+from src.summarizer.local_summarizer import LocalSummarizer
+from src.summarizer.openai_summarizer import OpenAISummarizer
+from src.utils.settings import get_setting
+
+
+# 'auto': OpenAI con el resumen local como reserva si no hay clave o la API falla
+SUMMARIZER_BACKENDS = ('auto', 'openai', 'local')
+DEFAULT_BACKEND = 'auto'
+
+
+def configured_backend():
+    """Backend elegido en SUMMARIZER_BACKEND ('auto' si no está)"""
+    backend = get_setting("SUMMARIZER_BACKEND", DEFAULT_BACKEND).lower().strip()
+    if backend not in SUMMARIZER_BACKENDS:
+        print(f"Summarizer backend '{backend}' not available, using {DEFAULT_BACKEND}")
+        return DEFAULT_BACKEND
+    return backend
+
+
+def create_summarizer(backend=None):
+    backend = backend or configured_backend()
+    if backend == 'local':
+        return LocalSummarizer()
+    if backend == 'openai':
+        return OpenAISummarizer()
+    return OpenAISummarizer(fallback=LocalSummarizer())
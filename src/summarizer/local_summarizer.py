@@ -0,0 +1,91 @@
+import math
+
+import numpy as np
+
+from src.summarizer.summarizer_base import ERROR_MESSAGE, NOT_ENOUGH_TEXT, Summarizer
+from src.summarizer.text_compression import sentence_words, split_sentences, strip_boilerplate
+
+
+SUMMARY_SENTENCES = 5
+DAMPING = 0.85
+MAX_ITERATIONS = 50
+TOLERANCE = 1e-6
+# Frases más parecidas que esto a una ya elegida se consideran repetidas
+REDUNDANCY = 0.7
+
+
+class LocalSummarizer(Summarizer):
+    """
+    Resumen extractivo sin red: TextRank sobre la similitud coseno TF-IDF de las
+    frases del artículo. Devuelve las `sentences` frases mejor puntuadas en su
+    orden original, en milisegundos.
+    """
+    name = "local"
+    # Es CPU pura: más hilos no aceleran nada
+    max_in_flight = 1
+
+    def __init__(self, sentences=SUMMARY_SENTENCES):
+        self.sentences = sentences
+
+    def summarize(self, article_text):
+        try:
+            sentences = strip_boilerplate(split_sentences(article_text))
+            if not sentences or len(" ".join(sentences)) < 50:
+                return NOT_ENOUGH_TEXT
+            if len(sentences) <= self.sentences:
+                return " ".join(sentences)
+            scores, similarity = self.rank(sentences)
+            return " ".join(sentences[index] for index in self.select(scores, similarity))
+        except Exception as e:
+            print(f"Error al summarizar: {e}")
+            return ERROR_MESSAGE.format(error=e)
+
+    @staticmethod
+    def tfidf_matrix(sentences):
+        """Matriz frases x vocabulario TF-IDF con filas normalizadas (L2)"""
+        words = [sentence_words(sentence) for sentence in sentences]
+        vocabulary = {}
+        for sentence in words:
+            for word in sentence:
+                vocabulary.setdefault(word, len(vocabulary))
+        matrix = np.zeros((len(sentences), max(1, len(vocabulary))))
+        for row, sentence in enumerate(words):
+            for word in sentence:
+                matrix[row, vocabulary[word]] += 1
+        document_frequency = np.count_nonzero(matrix, axis=0)
+        idf = np.log((1 + len(sentences)) / (1 + document_frequency)) + 1
+        matrix *= idf
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1
+        return matrix / norms
+
+    def select(self, scores, similarity):
+        """Las mejores frases que no repiten a otra ya elegida, en orden original"""
+        selected = []
+        for index in np.argsort(-scores, kind="stable"):
+            if selected and similarity[index, selected].max() > REDUNDANCY:
+                continue
+            selected.append(index)
+            if len(selected) == self.sentences:
+                break
+        return sorted(selected)
+
+    def rank(self, sentences):
+        """Puntuación TextRank de cada frase y matriz de similitud entre frases"""
+        matrix = self.tfidf_matrix(sentences)
+        similarity = matrix @ matrix.T
+        np.fill_diagonal(similarity, 0)
+        count = len(sentences)
+        # Matriz de transición: cada frase reparte su voto entre las similares
+        totals = similarity.sum(axis=1, keepdims=True)
+        transition = np.divide(similarity, totals, out=np.full_like(similarity, 1 / count), where=totals > 0)
+        scores = np.full(count, 1 / count)
+        for _ in range(MAX_ITERATIONS):
+            updated = (1 - DAMPING) / count + DAMPING * (transition.T @ scores)
+            converged = np.abs(updated - scores).sum() < TOLERANCE
+            scores = updated
+            if converged:
+                break
+        # Ligera preferencia por la entradilla de la nota
+        position = np.array([1 + 0.5 / math.sqrt(index + 1) for index in range(count)])
+        return scores * position, similarity
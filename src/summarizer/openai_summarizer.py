@@ -1,32 +1,204 @@
-from openai import OpenAI
-import streamlit as st
+import time
+from openai import OpenAI, APIConnectionError, APITimeoutError, InternalServerError, RateLimitError
+from src.summarizer.rate_scheduler import MAX_RETRIES, backoff_delay, get_request_scheduler, retry_after_seconds
+from src.summarizer.summarizer_base import ERROR_MESSAGE, MAX_IN_FLIGHT, NOT_ENOUGH_TEXT, FallbackSummary, Summarizer
+from src.summarizer.summary_cache import get_summary_cache, summary_key
+from src.summarizer.text_compression import PROMPT_TOKEN_BUDGET, compress_text, count_tokens
+from src.utils.settings import get_setting
+from src.utils.single_flight import SingleFlight
 
-class OpenAISummarizer:
-    def __init__(self):
-        api_key = st.secrets.get("OPENAI_API_KEY")
+MODEL = "gpt-3.5-turbo"
+SYSTEM_PROMPT = "Eres un periodista profesional especializado en minería."
+USER_PROMPT = "Tu tarea es resumir la siguiente nota a 4 o 5 líneas. Se objetivo y no omitas nada importante:\n\n{text}"
+COMPLETION_TOKENS = 250  # Tokens de respuesta que se reservan por resumen (4-5 líneas)
+REQUEST_TIMEOUT = 30  # Segundos antes de considerar que la API no responde
+
+# Resúmenes en curso, compartidos por todas las sesiones del proceso: si varias sesiones
+# (o la app y el correo) piden el mismo texto a la vez, se hace una sola llamada a la API
+_in_flight = SingleFlight()
+
+class OpenAISummarizer(Summarizer):
+    name = "openai"
+
+    def __init__(self, model=MODEL, use_cache=True, max_in_flight=MAX_IN_FLIGHT, api_key=None, base_url=None,
+                 scheduler=None, token_budget=PROMPT_TOKEN_BUDGET, fallback=None, timeout=REQUEST_TIMEOUT):
+        api_key = api_key or get_setting("OPENAI_API_KEY")
         if not api_key:
             print("Warning: OPENAI_API_KEY environment variable not set")
-        self.client = OpenAI(api_key=api_key)
+        self.available = bool(api_key)
+        # Backend (p. ej. LocalSummarizer) a usar si la API no está disponible o falla
+        self.fallback = fallback
+        # Los reintentos los gestiona el scheduler (respetando Retry-After), no el cliente
+        self.client = OpenAI(api_key=api_key or "missing", base_url=base_url, max_retries=0, timeout=timeout)
+        self.model = model
+        self.max_in_flight = max_in_flight
+        self.cache = get_summary_cache() if use_cache else None
+        self.scheduler = scheduler or get_request_scheduler()
+        self.token_budget = token_budget
+
+    def build_prompt(self, article_text):
+        # Sin boilerplate y, si es largo, solo las frases más relevantes que quepan en el presupuesto
+        return USER_PROMPT.format(text=compress_text(article_text, self.token_budget, self.model))
 
     def summarize(self, article_text):
+        if not self.available and self.fallback:
+            return self._fallback_summary(article_text)
+        try:
+            if not article_text or len(article_text.strip()) < 50:
+                return NOT_ENOUGH_TEXT
+
+            user_prompt = self.build_prompt(article_text)
+            key = summary_key(self.model, SYSTEM_PROMPT, user_prompt)
+
+            # Cada artículo se resume una sola vez (entre recargas, sesiones, correos y reinicios)
+            if self.cache:
+                cached = self.cache.get(key)
+                if cached:
+                    return cached
+
+            return _in_flight.do(key, lambda: self._generate(key, user_prompt))
+        except Exception as e:
+            print(f"Error al summarizar: {e}")
+            if self.fallback:
+                return self._fallback_summary(article_text)
+            return ERROR_MESSAGE.format(error=e)
+
+    def summarize_stream(self, article_text):
+        """
+        Igual que summarize() pero va devolviendo el resumen por fragmentos según
+        llegan de la API. El texto completo se guarda en la caché al terminar; si ya
+        estaba en caché, o si otra sesión lo está generando, se devuelve de una vez.
+        """
+        if not self.available and self.fallback:
+            yield from self._fallback_stream(article_text)
+            return
+        parts = []
         try:
             if not article_text or len(article_text.strip()) < 50:
-                return "No hay suficiente texto en el artículo para generar un resumen."
-
-            # Truncate to avoid token limits
-            max_chars = 15000  # Adjust based on your API tier
-            truncated_text = article_text[:max_chars] if len(article_text) > max_chars else article_text
-            
-            response = self.client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {"role": "system", "content": "Eres un periodista profesional especializado en minería."},
-                    {"role": "user", "content": f"Tu tarea es resumir la siguiente nota a 4 o 5 líneas. Se objetivo y no omitas nada importante:\n\n{truncated_text}"}
-                ]
-            )
-            
-            summary = response.choices[0].message.content
-            return summary.strip()
+                yield NOT_ENOUGH_TEXT
+                return
+
+            user_prompt = self.build_prompt(article_text)
+            key = summary_key(self.model, SYSTEM_PROMPT, user_prompt)
+
+            if self.cache:
+                cached = self.cache.get(key)
+                if cached:
+                    yield cached
+                    return
+
+            call, leader = _in_flight.acquire(key)
+            if not leader:
+                yield _in_flight.wait(call)
+                return
+            try:
+                summary = yield from self._stream(key, user_prompt, parts)
+            except Exception as e:
+                _in_flight.release(key, call, error=e)
+                raise
+            except BaseException:
+                # El generador se cerró antes de terminar (p. ej. la sesión se recargó)
+                _in_flight.release(key, call, error=RuntimeError("Resumen interrumpido"))
+                raise
+            _in_flight.release(key, call, result=summary)
         except Exception as e:
             print(f"Error al summarizar: {e}")
-            return f"No se pudo generar un resumen para este artículo. Error: {str(e)}"
\ No newline at end of file
+            # Si la respuesta ya empezó a mostrarse no se mezcla con otro resumen
+            if self.fallback and not parts:
+                yield from self._fallback_stream(article_text)
+            else:
+                yield ERROR_MESSAGE.format(error=e)
+
+    def _fallback_summary(self, article_text):
+        return FallbackSummary(self.fallback.summarize(article_text))
+
+    def _fallback_stream(self, article_text):
+        for part in self.fallback.summarize_stream(article_text):
+            yield FallbackSummary(part)
+
+    def _generate(self, key, user_prompt):
+        """Llamada a la API para un resumen que no está en caché (la hace solo una sesión)"""
+        # Puede haberse guardado justo antes de entrar
+        if self.cache:
+            cached = self.cache.get(key)
+            if cached:
+                return cached
+
+        response, reservation = self._complete(user_prompt)
+        self._settle(reservation, response)
+
+        summary = response.choices[0].message.content.strip()
+        if self.cache:
+            self.cache.put(key, summary, model=self.model)
+        return summary
+
+    def _stream(self, key, user_prompt, parts):
+        """Como _generate() pero en streaming; acumula en `parts` lo ya devuelto"""
+        stream, reservation = self._complete(user_prompt, stream=True)
+        usage = None
+        for chunk in stream:
+            # El último fragmento solo trae el consumo de tokens
+            if chunk.usage:
+                usage = chunk.usage
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if delta:
+                # Sin espacios iniciales, igual que el .strip() de summarize()
+                if not parts:
+                    delta = delta.lstrip()
+                    if not delta:
+                        continue
+                parts.append(delta)
+                yield delta
+        self.scheduler.settle(reservation, getattr(usage, 'total_tokens', None) or None)
+
+        summary = "".join(parts).strip()
+        if not summary:
+            raise ValueError("La API devolvió un resumen vacío")
+        if self.cache:
+            self.cache.put(key, summary, model=self.model)
+        return summary
+
+    def _settle(self, reservation, response):
+        usage = getattr(response, 'usage', None)
+        self.scheduler.settle(reservation, getattr(usage, 'total_tokens', None) or None)
+
+    def _complete(self, user_prompt, stream=False):
+        """
+        Envía la petición dentro del presupuesto RPM/TPM del scheduler. Ante un 429
+        o un error transitorio pausa y reintenta; solo se rinde tras MAX_RETRIES.
+        Con un backend de reserva, los errores de conexión y timeouts no se
+        reintentan: se pasa directamente a la reserva.
+        Devuelve la respuesta (o el stream) y la reserva hecha en el scheduler.
+        """
+        messages = [
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": user_prompt}
+        ]
+        estimated = count_tokens(SYSTEM_PROMPT, self.model) + count_tokens(user_prompt, self.model) + COMPLETION_TOKENS
+        options = {"stream": True, "stream_options": {"include_usage": True}} if stream else {}
+        attempt = 0
+        while True:
+            reservation = self.scheduler.acquire(estimated)
+            try:
+                response = self.client.chat.completions.create(model=self.model, messages=messages, **options)
+            except RateLimitError as e:
+                # La petición fallida no consumió tokens: liberar su estimación
+                # para no frenar al resto de hilos durante el minuto de la ventana
+                self.scheduler.settle(reservation, 0)
+                # Sin saldo no tiene sentido reintentar
+                if attempt >= MAX_RETRIES or getattr(e, 'code', None) == 'insufficient_quota':
+                    raise
+                delay = backoff_delay(attempt, retry_after_seconds(e.response.headers))
+                print(f"Límite de la API alcanzado, reintentando en {delay:.1f}s")
+                # Pausa compartida: el resto de hilos también esperan
+                self.scheduler.pause(delay)
+            except (APIConnectionError, APITimeoutError, InternalServerError):
+                self.scheduler.settle(reservation, 0)
+                if attempt >= MAX_RETRIES or self.fallback:
+                    raise
+                time.sleep(backoff_delay(attempt))
+            else:
+                return response, reservation
+            attempt += 1
@@ -0,0 +1,102 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from src.summarizer.backends import create_summarizer
+from src.summarizer.summarizer_base import MAX_IN_FLIGHT, FallbackSummary, is_fallback_summary, is_storable_summary, is_summary_error
+from src.utils.article_store import canonical_url, get_article_store
+
+
+class SummaryPipeline:
+    """
+    Etapa de resumen en segundo plano: cada artículo que se pide (las tarjetas de
+    la página visible, "Resumir todos" o src.main) se encola en un pool de hilos, y su resumen se guarda
+    junto al artículo en el almacén local. Mientras se genera (en streaming), el
+    texto recibido hasta el momento se consulta con partial(link).
+    """
+
+    def __init__(self, summarizer=None, workers=MAX_IN_FLIGHT, store=None):
+        self.summarizer = summarizer or create_summarizer()
+        self.store = store or get_article_store()
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='summary')
+        self._pending = {}
+        self._partial = {}
+        self._lock = threading.Lock()
+
+    def submit(self, article):
+        """Encola el artículo si aún no tiene resumen; devuelve el Future (o None)"""
+        if article.get('summary') or not article.get('link'):
+            return None
+        key = canonical_url(article['link'])
+        with self._lock:
+            future = self._pending.get(key)
+            if future is not None:
+                return future
+            future = self._executor.submit(self._summarize, article['link'], article.get('text', ""))
+            self._pending[key] = future
+        # Fuera del lock: si ya terminó, el callback se ejecuta aquí mismo
+        future.add_done_callback(lambda done: self._done(key, done))
+        return future
+
+    def _done(self, key, future):
+        with self._lock:
+            if self._pending.get(key) is future:
+                del self._pending[key]
+
+    def _summarize(self, link, text):
+        key = canonical_url(link)
+        try:
+            summary = self._stream(key, text)
+        finally:
+            with self._lock:
+                self._partial.pop(key, None)
+        # Los errores, los resúmenes de reserva y el aviso de texto insuficiente se
+        # muestran pero no se guardan, para que se vuelvan a generar más adelante
+        if is_storable_summary(summary):
+            try:
+                self.store.set_summary(link, summary)
+            except Exception as e:
+                print(f"Error saving summary to store: {str(e)}")
+        return summary
+
+    def _stream(self, key, text):
+        """Consume summarize_stream() dejando visible el texto parcial"""
+        parts = []
+        fallback = False
+        for part in self.summarizer.summarize_stream(text):
+            # Un error (aunque ya hubiera texto parcial) sustituye al resumen incompleto
+            if is_summary_error(part):
+                return part
+            fallback = fallback or is_fallback_summary(part)
+            parts.append(part)
+            with self._lock:
+                self._partial[key] = "".join(parts)
+        summary = "".join(parts).strip()
+        return FallbackSummary(summary) if fallback else summary
+
+    def partial(self, link):
+        """Texto del resumen recibido hasta ahora ("" si aún no hay o ya terminó)"""
+        with self._lock:
+            return self._partial.get(canonical_url(link), "")
+
+    def pending(self, link):
+        """Future del resumen en curso para este artículo (None si no hay)"""
+        with self._lock:
+            return self._pending.get(canonical_url(link))
+
+    def pending_count(self):
+        with self._lock:
+            return len(self._pending)
+
+
+_pipeline = None
+_pipeline_lock = threading.Lock()
+
+
+def get_summary_pipeline():
+    """Pipeline compartido por todo el proceso (todas las sesiones)"""
+    global _pipeline
+    if _pipeline is None:
+        with _pipeline_lock:
+            if _pipeline is None:
+                _pipeline = SummaryPipeline()
+    return _pipeline
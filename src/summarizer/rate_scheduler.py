@@ -0,0 +1,146 @@
+import random
+import threading
+import time
+from collections import deque
+
+
+# Límites por defecto de la organización para el modelo de resúmenes (por minuto)
+DEFAULT_RPM = 500
+DEFAULT_TPM = 200000
+WINDOW = 60.0
+
+# Reintentos ante 429 / errores transitorios
+MAX_RETRIES = 6
+BASE_BACKOFF = 1.0
+MAX_BACKOFF = 60.0
+
+
+def estimate_tokens(text):
+    """Estimación rápida de tokens (~4 caracteres por token en español/inglés)"""
+    return max(1, len(text or '') // 4)
+
+
+def backoff_delay(attempt, retry_after=None):
+    """
+    Espera antes del reintento `attempt` (0, 1, 2...). Respeta Retry-After si el
+    servidor lo indicó y le añade jitter para que los hilos no reintenten a la vez.
+    """
+    if retry_after is not None:
+        return retry_after + random.uniform(0, min(1.0, retry_after * 0.25 + 0.1))
+    delay = min(MAX_BACKOFF, BASE_BACKOFF * (2 ** attempt))
+    return random.uniform(delay / 2, delay)
+
+
+def retry_after_seconds(headers):
+    """Lee retry-after-ms / retry-after de una respuesta 429 (None si no viene)"""
+    if not headers:
+        return None
+    try:
+        value = headers.get('retry-after-ms')
+        if value is not None:
+            return float(value) / 1000
+        value = headers.get('retry-after')
+        if value is not None:
+            return float(value)
+    except (TypeError, ValueError):
+        pass
+    return None
+
+
+class Reservation:
+    __slots__ = ('at', 'tokens')
+
+    def __init__(self, at, tokens):
+        self.at = at
+        self.tokens = tokens
+
+
+class RequestScheduler:
+    """
+    Presupuesto de peticiones y tokens por minuto compartido por todos los hilos.
+    Cada petición reserva su estimación de tokens antes de enviarse y espera si
+    superaría el presupuesto de la ventana de 60 s; un 429 pausa a todos los hilos.
+    """
+
+    def __init__(self, rpm=DEFAULT_RPM, tpm=DEFAULT_TPM):
+        self.rpm = rpm
+        self.tpm = tpm
+        self._window = deque()
+        self._tokens = 0
+        self._paused_until = 0.0
+        self._cond = threading.Condition()
+
+    def _expire(self, now):
+        while self._window and now - self._window[0].at >= WINDOW:
+            self._tokens -= self._window.popleft().tokens
+
+    def _wait_time(self, now, tokens):
+        if now < self._paused_until:
+            return self._paused_until - now
+        if not self._window:
+            return 0
+        over_requests = len(self._window) >= self.rpm
+        # Una petición más grande que todo el presupuesto pasa cuando la ventana está vacía
+        over_tokens = self._tokens + tokens > self.tpm
+        if not (over_requests or over_tokens):
+            return 0
+        if over_requests:
+            return self._window[0].at + WINDOW - now
+        # Esperar hasta que salgan de la ventana suficientes tokens
+        freed = 0
+        for entry in self._window:
+            freed += entry.tokens
+            if self._tokens - freed + tokens <= self.tpm:
+                return entry.at + WINDOW - now
+        return self._window[-1].at + WINDOW - now
+
+    def acquire(self, tokens):
+        """Bloquea hasta que la petición cabe en el presupuesto y la registra"""
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                self._expire(now)
+                wait = self._wait_time(now, tokens)
+                if wait <= 0:
+                    reservation = Reservation(now, tokens)
+                    self._window.append(reservation)
+                    self._tokens += tokens
+                    return reservation
+                self._cond.wait(wait)
+
+    def settle(self, reservation, tokens):
+        """Sustituye la estimación por los tokens reales que informó la API"""
+        if tokens is None:
+            return
+        with self._cond:
+            if reservation in self._window:
+                self._tokens += tokens - reservation.tokens
+            reservation.tokens = tokens
+            self._cond.notify_all()
+
+    def pause(self, seconds):
+        """Detiene todas las peticiones durante `seconds` (tras un 429)"""
+        with self._cond:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._cond.notify_all()
+
+
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+
+def get_request_scheduler():
+    """Scheduler compartido por todo el proceso (los límites son de la organización)"""
+    global _scheduler
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                _scheduler = RequestScheduler()
+    return _scheduler
+
+
+def configure_request_scheduler(rpm=DEFAULT_RPM, tpm=DEFAULT_TPM):
+    global _scheduler
+    with _scheduler_lock:
+        _scheduler = RequestScheduler(rpm, tpm)
+    return _scheduler
@@ -0,0 +1,64 @@
+from concurrent.futures import ThreadPoolExecutor
+
+
+MAX_IN_FLIGHT = 8  # Resúmenes simultáneos en summarize_many
+
+NOT_ENOUGH_TEXT = "No hay suficiente texto en el artículo para generar un resumen."
+ERROR_PREFIX = "No se pudo generar un resumen para este artículo."
+ERROR_MESSAGE = ERROR_PREFIX + " Error: {error}"
+
+
+def is_summary_error(summary):
+    """True si `summary` es un mensaje de error y no un resumen (no debe guardarse)"""
+    return not summary or summary.startswith(ERROR_PREFIX)
+
+
+class FallbackSummary(str):
+    """
+    Resumen del backend de reserva, usado porque el principal no estaba disponible
+    o falló. Se muestra igual que cualquier otro, pero no se guarda con el artículo
+    para que una ejecución posterior lo sustituya por el del backend principal.
+    """
+
+
+def is_fallback_summary(summary):
+    return isinstance(summary, FallbackSummary)
+
+
+def is_storable_summary(summary):
+    """
+    True si `summary` puede guardarse con el artículo: ni errores, ni resúmenes
+    de reserva, ni el aviso de texto insuficiente (el texto puede crecer después)
+    """
+    return not is_summary_error(summary) and not is_fallback_summary(summary) and summary != NOT_ENOUGH_TEXT
+
+
+class Summarizer:
+    """
+    Interfaz común de los backends de resumen. Las subclases implementan
+    summarize(); el resto tiene una versión por defecto basada en ella.
+    """
+    name = None
+    max_in_flight = MAX_IN_FLIGHT
+
+    def summarize(self, article_text):
+        """Resumen de 4-5 líneas del texto (nunca lanza: devuelve un mensaje de error)"""
+        raise NotImplementedError("Subclasses should implement this method")
+
+    def summarize_stream(self, article_text):
+        """Devuelve el resumen por fragmentos; por defecto, de una sola vez"""
+        yield self.summarize(article_text)
+
+    def summarize_many(self, texts, max_in_flight=None):
+        """
+        Resume varios textos en paralelo con como máximo `max_in_flight` en curso.
+        Devuelve los resúmenes en el mismo orden que `texts`.
+        """
+        texts = list(texts)
+        if not texts:
+            return []
+        workers = max(1, min(max_in_flight or self.max_in_flight, len(texts)))
+        if workers == 1:
+            return [self.summarize(text) for text in texts]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.summarize, texts))
@@ -0,0 +1,76 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+
+
+DEFAULT_DB_PATH = os.path.join('.cache', 'summaries.db')
+
+
+def summary_key(model, system_prompt, user_prompt):
+    """Hash del modelo y del prompt completo (que incluye el texto ya recortado)"""
+    digest = hashlib.sha256()
+    for part in (model, system_prompt, user_prompt):
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+class SummaryCache:
+    """Caché persistente de resúmenes (SQLite), compartida entre sesiones y reinicios"""
+
+    def __init__(self, db_path=DEFAULT_DB_PATH):
+        self.db_path = db_path
+        if os.path.dirname(db_path):
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self._local = threading.local()
+        conn = self._connection()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS summaries (
+                key TEXT PRIMARY KEY,
+                model TEXT,
+                summary TEXT NOT NULL,
+                created_at REAL NOT NULL
+            )
+        """)
+        conn.commit()
+
+    def _connection(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.execute('PRAGMA journal_mode=WAL')
+            self._local.conn = conn
+        return conn
+
+    def get(self, key):
+        row = self._connection().execute('SELECT summary FROM summaries WHERE key = ?', (key,)).fetchone()
+        return row[0] if row else None
+
+    def put(self, key, summary, model=None):
+        conn = self._connection()
+        conn.execute('INSERT OR REPLACE INTO summaries (key, model, summary, created_at) VALUES (?, ?, ?, ?)',
+                     (key, model, summary, time.time()))
+        conn.commit()
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_summary_cache():
+    """Caché compartida por todo el proceso"""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = SummaryCache()
+    return _cache
+
+
+def configure_summary_cache(db_path):
+    global _cache
+    with _cache_lock:
+        _cache = SummaryCache(db_path)
+    return _cache
@@ -0,0 +1,153 @@
+import re
+from collections import Counter
+from functools import lru_cache
+
+try:
+    import tiktoken
+except ImportError:  # tiktoken es opcional: sin él se usa una estimación por caracteres
+    tiktoken = None
+
+from src.summarizer.rate_scheduler import estimate_tokens
+
+
+# Tokens de artículo que se envían para un resumen de 4-5 líneas
+PROMPT_TOKEN_BUDGET = 1200
+# Las primeras frases de una nota suelen ser las más informativas
+LEAD_SENTENCES = 3
+MIN_SENTENCE_WORDS = 4
+
+# Fin de frase: puntuación tras minúscula/dígito y antes de mayúscula, con o sin
+# espacio (los textos extraídos sin separador quedan "...del proyecto.La empresa...").
+# Siglas como "S.A. de C.V." o "EE.UU." no cortan la frase.
+SENTENCE_SPLIT = re.compile(r'(?<=[a-záéíóúüñ0-9)"”»][.!?…])\s*(?=[A-ZÁÉÍÓÚÑ¿¡"“«])')
+WORD_PATTERN = re.compile(r'[a-záéíóúüñ0-9]+')
+
+# Restos de menús, botones para compartir, avisos y enlaces relacionados que se
+# cuelan en los selectores de contenido de los scrapers. Solo cuentan al inicio
+# de la frase, para no tirar frases reales como "...espera compartir los beneficios..."
+# - Encabezados que nunca empiezan una frase de la nota (cualquier longitud)
+BOILERPLATE_LEAD = re.compile(
+    r'[\W_]*(?:lee\s+tambi[eé]n|te\s+puede\s+interesar|tambi[eé]n\s+te\s+puede'
+    r'|art[ií]culos?\s+relacionados?|noticias\s+relacionadas|todos\s+los\s+derechos\s+reservados'
+    r'|©|copyright\b|etiquetas\s*:|tags\s*:|s[ií]guenos\b|suscr[ií]bete\b)',
+    re.IGNORECASE
+)
+# - Botones y avisos: solo en fragmentos cortos
+BOILERPLATE_FRAGMENT = re.compile(
+    r'[\W_]*(?:comparte?(?:lo)?\s+(?:en|esta|este)\b|compartir\b|newsletter\b|haz\s+clic|click\s+aqu[ií]'
+    r'|publicidad\b|facebook\s*twitter|whatsapp\s*(?:telegram|email|linkedin)'
+    r'|deja\s+(?:un|tu)\s+comentario|inicia\s+sesi[oó]n)',
+    re.IGNORECASE
+)
+BOILERPLATE_MAX_WORDS = 8
+
+STOPWORDS = frozenset("""
+a al algo algunas algunos ante antes aquí así aun aunque cada como con contra cual cuales cuando de
+del desde donde durante e el ella ellas ellos en entre era eran es esa esas ese eso esos esta estaba
+estas este esto estos está están fue fueron ha había han hasta hay la las le les lo los más me mi
+mientras muy ni no nos o otra otras otro otros para pero poco por porque que quien quienes qué se sea
+según ser si sido sin sobre son su sus también tan tanto te tiene tienen todo todos tras tu un una
+unas uno unos y ya
+""".split())
+
+
+@lru_cache(maxsize=8)
+def _encoding(model):
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except Exception:
+        # Modelo desconocido o sin acceso para descargar el vocabulario
+        try:
+            return tiktoken.get_encoding('cl100k_base')
+        except Exception:
+            return None
+
+
+def count_tokens(text, model='gpt-3.5-turbo'):
+    """Tokens de `text` con el tokenizador del modelo (estimación si no hay tiktoken)"""
+    encoding = _encoding(model)
+    if encoding is None:
+        return estimate_tokens(text)
+    return len(encoding.encode(text or '', disallowed_special=()))
+
+
+def split_sentences(text):
+    return [sentence.strip() for sentence in SENTENCE_SPLIT.split(text or '') if sentence.strip()]
+
+
+def sentence_words(sentence):
+    return [word for word in WORD_PATTERN.findall(sentence.lower()) if word not in STOPWORDS and len(word) > 2]
+
+
+def strip_boilerplate(sentences):
+    """Quita frases de navegación/avisos, fragmentos sueltos y frases repetidas"""
+    kept = []
+    seen = set()
+    for sentence in sentences:
+        words = len(sentence.split())
+        if words < MIN_SENTENCE_WORDS:
+            continue
+        if BOILERPLATE_LEAD.match(sentence):
+            continue
+        if words <= BOILERPLATE_MAX_WORDS and BOILERPLATE_FRAGMENT.match(sentence):
+            continue
+        key = sentence.lower()
+        if key in seen:
+            continue
+        seen.add(key)
+        kept.append(sentence)
+    return kept
+
+
+def rank_sentences(sentences):
+    """
+    Puntuación extractiva por frecuencia de palabras de contenido, normalizada por
+    longitud, con un bonus para las primeras frases (la entradilla de la nota).
+    """
+    words = [sentence_words(sentence) for sentence in sentences]
+    frequencies = Counter(word for sentence in words for word in sentence)
+    if not frequencies:
+        return [0.0] * len(sentences)
+    top = max(frequencies.values())
+    scores = []
+    for index, sentence in enumerate(words):
+        score = sum(frequencies[word] / top for word in sentence) / (len(sentence) ** 0.5 or 1)
+        if index < LEAD_SENTENCES:
+            score *= 1.5
+        scores.append(score)
+    return scores
+
+
+def compress_text(text, budget=PROMPT_TOKEN_BUDGET, model='gpt-3.5-turbo'):
+    """
+    Prepara el texto de un artículo para el prompt. Si ya cabe en `budget` tokens
+    se envía tal cual; si no, se quita el boilerplate y, si aún no cabe, se
+    conservan las frases mejor puntuadas que quepan, en su orden original.
+    Nunca corta una frase por la mitad.
+    """
+    text = (text or '').strip()
+    if count_tokens(text, model) <= budget:
+        return text
+
+    sentences = strip_boilerplate(split_sentences(text))
+    if not sentences:
+        return text
+    cleaned = ' '.join(sentences)
+    if count_tokens(cleaned, model) <= budget:
+        return cleaned
+
+    scores = rank_sentences(sentences)
+    selected = []
+    used = 0
+    for index in sorted(range(len(sentences)), key=lambda i: scores[i], reverse=True):
+        tokens = count_tokens(sentences[index], model) + 1
+        if used + tokens > budget:
+            continue
+        selected.append(index)
+        used += tokens
+    if not selected:
+        # Una sola frase enorme: mejor enviar su inicio que nada
+        return sentences[0][:budget * 4]
+    return ' '.join(sentences[index] for index in sorted(selected))
@@ -0,0 +1,240 @@
+import os
+import sqlite3
+import threading
+import time
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from src.summarizer.summarizer_base import NOT_ENOUGH_TEXT
+from src.utils.date_parser import parse_date
+from src.utils.keyword_matcher import get_matcher
+
+
+DEFAULT_DB_PATH = os.path.join('.cache', 'articles.db')
+
+# Versión del esquema (PRAGMA user_version); 1: published_ts con hora y zona horaria,
+# 2: sin el aviso de texto insuficiente guardado como resumen
+SCHEMA_VERSION = 2
+
+# Parámetros de seguimiento que no cambian el artículo
+TRACKING_PARAMS = ('utm_', 'fbclid', 'gclid', 'mc_cid', 'mc_eid')
+
+
+def canonical_url(url):
+    """Normaliza una URL para usarla como clave del artículo"""
+    parts = urlsplit(url.strip())
+    query = [
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith(TRACKING_PARAMS)
+    ]
+    path = parts.path.rstrip('/') or '/'
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, urlencode(sorted(query)), ''))
+
+
+class ArticleStore:
+    """
+    Almacén local (SQLite en modo WAL) de artículos ya descargados y
+    parseados, indexado por URL canónica
+    """
+
+    def __init__(self, db_path=DEFAULT_DB_PATH):
+        self.db_path = db_path
+        if os.path.dirname(db_path):
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self._local = threading.local()
+        self._create_schema()
+
+    def _connection(self):
+        # Una conexión por hilo: sqlite3 no permite compartirlas entre hilos
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    def _create_schema(self):
+        conn = self._connection()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS articles (
+                url TEXT PRIMARY KEY,
+                link TEXT NOT NULL,
+                title TEXT NOT NULL,
+                text TEXT,
+                image_url TEXT,
+                image_alt TEXT,
+                date_raw TEXT,
+                formatted_date TEXT,
+                source TEXT,
+                published_ts REAL,
+                fetched_at REAL NOT NULL,
+                seen_at REAL,
+                summary TEXT
+            )
+        """)
+        self._ensure_column(conn, 'seen_at', 'REAL')
+        self._ensure_column(conn, 'published_ts', 'REAL')
+        self._ensure_column(conn, 'summary', 'TEXT')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_articles_seen_at ON articles (seen_at)')
+        if conn.execute('PRAGMA user_version').fetchone()[0] < 1:
+            self._reparse_dates(conn)
+        if conn.execute('PRAGMA user_version').fetchone()[0] < 2:
+            conn.execute('UPDATE articles SET summary = NULL WHERE summary = ?', (NOT_ENOUGH_TEXT,))
+        conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+        conn.commit()
+
+    @staticmethod
+    def _reparse_dates(conn):
+        """Fechas ISO guardadas antes de conservar la hora: todas quedaban a medianoche"""
+        rows = conn.execute("SELECT url, date_raw FROM articles WHERE date_raw LIKE '%-%-%'").fetchall()
+        conn.executemany('UPDATE articles SET published_ts = ? WHERE url = ?', [
+            (parse_date(row['date_raw'])['timestamp'], row['url']) for row in rows
+        ])
+
+    @staticmethod
+    def _ensure_column(conn, name, column_type):
+        """Añade columnas nuevas a bases de datos creadas con versiones anteriores"""
+        columns = [row[1] for row in conn.execute('PRAGMA table_info(articles)')]
+        if name not in columns:
+            conn.execute(f'ALTER TABLE articles ADD COLUMN {name} {column_type}')
+
+    @staticmethod
+    def _row_to_article(row, with_source=False):
+        article = {
+            'title': row['title'],
+            'link': row['link'],
+            'text': row['text'] or "",
+            'image': {'url': row['image_url'], 'alt': row['image_alt'] or ""},
+            'date': row['date_raw'] or "",
+            'formatted_date': row['formatted_date'] or "",
+            'timestamp': row['published_ts'],
+            'summary': row['summary']
+        }
+        if with_source:
+            article['source'] = row['source']
+        return article
+
+    def get(self, url):
+        """Devuelve el artículo guardado para esa URL o None"""
+        row = self._connection().execute(
+            'SELECT * FROM articles WHERE url = ?', (canonical_url(url),)
+        ).fetchone()
+        return self._row_to_article(row) if row else None
+
+    def put(self, article, source=None):
+        image = article.get('image') or {}
+        now = time.time()
+        conn = self._connection()
+        # Si el artículo ya existía se actualiza; su resumen se conserva mientras el texto no cambie
+        conn.execute("""
+            INSERT INTO articles
+                (url, link, title, text, image_url, image_alt, date_raw, formatted_date, published_ts, source, fetched_at, seen_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(url) DO UPDATE SET
+                link = excluded.link, title = excluded.title, text = excluded.text,
+                image_url = excluded.image_url, image_alt = excluded.image_alt,
+                date_raw = excluded.date_raw, formatted_date = excluded.formatted_date,
+                published_ts = excluded.published_ts, source = excluded.source,
+                fetched_at = excluded.fetched_at, seen_at = excluded.seen_at,
+                summary = CASE WHEN articles.text IS excluded.text THEN articles.summary END
+        """, (
+            canonical_url(article['link']),
+            article['link'],
+            article['title'],
+            article.get('text', ""),
+            image.get('url'),
+            image.get('alt', ""),
+            article.get('date', ""),
+            article.get('formatted_date', ""),
+            article.get('timestamp'),
+            source,
+            now,
+            now
+        ))
+        conn.commit()
+
+    def set_summary(self, url, summary):
+        conn = self._connection()
+        conn.execute('UPDATE articles SET summary = ? WHERE url = ?', (summary, canonical_url(url)))
+        conn.commit()
+
+    def summaries(self, urls):
+        """Resúmenes ya generados para estas URLs, como {url: resumen}"""
+        keys = {canonical_url(url): url for url in urls}
+        found = {}
+        conn = self._connection()
+        items = list(keys.items())
+        # Por tandas para no pasar del límite de parámetros de SQLite
+        for start in range(0, len(items), 500):
+            batch = dict(items[start:start + 500])
+            rows = conn.execute(
+                f"SELECT url, summary FROM articles WHERE summary IS NOT NULL AND url IN ({', '.join('?' for _ in batch)})",
+                list(batch)
+            )
+            for row in rows:
+                found[batch[row['url']]] = row['summary']
+        return found
+
+    def mark_seen(self, urls):
+        """Registra que estos artículos siguen apareciendo en los listados"""
+        now = time.time()
+        conn = self._connection()
+        conn.executemany('UPDATE articles SET seen_at = ? WHERE url = ?',
+                         [(now, canonical_url(url)) for url in urls])
+        conn.commit()
+
+    def search(self, keywords, seen_since=None, sources=None, limit=None):
+        """
+        Filtra localmente los artículos guardados: devuelve los que contienen
+        alguna palabra clave en el título o en el texto, sin tocar la red.
+        `seen_since` limita la búsqueda a los artículos vistos en un listado
+        desde ese momento (timestamp)
+        """
+        matcher = get_matcher(keywords)
+
+        query = 'SELECT * FROM articles'
+        conditions, params = [], []
+        if seen_since is not None:
+            conditions.append('seen_at >= ?')
+            params.append(seen_since)
+        if sources:
+            conditions.append(f"source IN ({', '.join('?' for _ in sources)})")
+            params.extend(sources)
+        if conditions:
+            query += ' WHERE ' + ' AND '.join(conditions)
+        # Más recientes primero; los artículos sin fecha reconocida van al final
+        query += ' ORDER BY published_ts IS NULL, published_ts DESC, fetched_at DESC'
+
+        results = []
+        for row in self._connection().execute(query, params):
+            if not matcher.search(row['title']) and not matcher.search(row['text']):
+                continue
+            results.append(self._row_to_article(row, with_source=True))
+            if limit and len(results) >= limit:
+                break
+        return results
+
+    def count(self):
+        return self._connection().execute('SELECT COUNT(*) FROM articles').fetchone()[0]
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_article_store():
+    """Almacén compartido por todo el proceso"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = ArticleStore()
+    return _store
+
+
+def configure_article_store(db_path):
+    global _store
+    with _store_lock:
+        _store = ArticleStore(db_path)
+    return _store
@@ -0,0 +1,108 @@
+import re
+from datetime import datetime, timezone
+from functools import lru_cache
+
+
+MONTHS = {
+    'enero': 1, 'febrero': 2, 'marzo': 3, 'abril': 4, 'mayo': 5, 'junio': 6,
+    'julio': 7, 'agosto': 8, 'septiembre': 9, 'setiembre': 9, 'octubre': 10,
+    'noviembre': 11, 'diciembre': 12,
+    'ene': 1, 'feb': 2, 'mar': 3, 'abr': 4, 'may': 5, 'jun': 6, 'jul': 7,
+    'ago': 8, 'sep': 9, 'sept': 9, 'set': 9, 'oct': 10, 'nov': 11, 'dic': 12,
+    'january': 1, 'february': 2, 'march': 3, 'april': 4, 'june': 6, 'july': 7,
+    'august': 8, 'september': 9, 'october': 10, 'november': 11, 'december': 12,
+    'jan': 1, 'apr': 4, 'aug': 8, 'dec': 12
+}
+
+DISPLAY_FORMAT = "%d/%m/%Y"
+
+_MONTH = r'([a-záéíóúñ]+)\.?'
+
+# Formatos soportados, en orden de prioridad
+# Los patrones se aplican al texto en minúsculas: "T" y "Z" también se aceptan así
+ISO_PATTERN = re.compile(r'\b(\d{4})-(\d{1,2})-(\d{1,2})(?:[Tt ](\d{1,2}:\d{2}(?::\d{2}(?:\.\d+)?)?)([Zz]|[+-]\d{2}:?\d{2})?)?')
+DAY_MONTH_YEAR_PATTERN = re.compile(r'\b(\d{1,2})\s+(?:de\s+)?' + _MONTH + r'(?:\s+de)?,?\s+(\d{4})\b')
+MONTH_DAY_YEAR_PATTERN = re.compile(r'\b' + _MONTH + r'\s+(\d{1,2}),?\s+(\d{4})\b')
+NUMERIC_PATTERN = re.compile(r'\b(\d{1,2})[/.-](\d{1,2})[/.-](\d{4})\b')
+
+
+def _iso(match):
+    # Se conservan la hora y la zona horaria cuando las hay
+    year, month, day, clock, zone = match.groups()
+    date_obj = datetime(int(year), int(month), int(day))
+    if clock:
+        date_obj = datetime.fromisoformat(f"{date_obj:%Y-%m-%d}T{clock}")
+    if zone:
+        zone = zone.upper().replace('Z', '+00:00')
+        if ':' not in zone:
+            zone = zone[:3] + ':' + zone[3:]
+        date_obj = datetime.fromisoformat(f"{date_obj.isoformat()}{zone}")
+    return date_obj
+
+
+def _day_month_year(match):
+    day, month_name, year = match.groups()
+    return datetime(int(year), MONTHS[month_name], int(day))
+
+
+def _month_day_year(match):
+    month_name, day, year = match.groups()
+    return datetime(int(year), MONTHS[month_name], int(day))
+
+
+def _numeric(match):
+    day, month, year = match.groups()
+    return datetime(int(year), int(month), int(day))
+
+
+_PARSERS = (
+    (ISO_PATTERN, _iso),
+    (DAY_MONTH_YEAR_PATTERN, _day_month_year),
+    (MONTH_DAY_YEAR_PATTERN, _month_day_year),
+    (NUMERIC_PATTERN, _numeric),
+)
+
+
+def _to_datetime(text):
+    lowered = text.lower()
+    for pattern, build in _PARSERS:
+        for match in pattern.finditer(lowered):
+            try:
+                return match, build(match)
+            except (KeyError, ValueError):
+                # Nombre de mes desconocido o fecha imposible: probar la siguiente coincidencia
+                continue
+    return None, None
+
+
+@lru_cache(maxsize=4096)
+def _parse(raw):
+    _, date_obj = _to_datetime(raw)
+    if date_obj is None:
+        return raw, None
+    if date_obj.tzinfo is None:
+        date_obj = date_obj.replace(tzinfo=timezone.utc)
+    return date_obj.strftime(DISPLAY_FORMAT), date_obj.timestamp()
+
+
+def parse_date(raw):
+    """
+    Interpreta una fecha en texto ("2025-04-14T10:00:00Z", "14 de abril de 2025",
+    "abril 14, 2025", "14/04/2025"...) y devuelve:
+      - 'raw': el texto original
+      - 'formatted': dd/mm/yyyy para mostrar (el texto original si no se pudo interpretar)
+      - 'timestamp': segundos desde epoch para ordenar (None si no se pudo interpretar)
+    """
+    raw = (raw or "").strip()
+    if not raw:
+        return {'raw': "", 'formatted': "", 'timestamp': None}
+    formatted, timestamp = _parse(raw)
+    return {'raw': raw, 'formatted': formatted, 'timestamp': timestamp}
+
+
+def find_date(text):
+    """Primer fragmento de `text` que es una fecha reconocible ("" si no hay)"""
+    if not text:
+        return ""
+    match, _ = _to_datetime(text)
+    return text[match.start():match.end()] if match else ""
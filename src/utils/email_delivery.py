@@ -0,0 +1,231 @@
+import itertools
+import queue
+import smtplib
+import threading
+import time
+import uuid
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+
+
+BATCH_SIZE = 50          # Destinatarios por mensaje cuando se envía en tandas
+MAX_ATTEMPTS = 3         # Intentos por tanda antes de dar el trabajo por fallido
+RETRY_DELAY = 5.0        # Segundos antes del primer reintento (se duplica en cada uno)
+IDLE_TIMEOUT = 120.0     # Segundos sin uso tras los que se comprueba la conexión con NOOP
+SMTP_TIMEOUT = 30
+MAX_TRACKED_JOBS = 200   # Trabajos terminados cuyo estado se conserva
+
+
+class SmtpConnection:
+    """
+    Conexión SMTP autenticada que se reutiliza entre envíos: STARTTLS y login se
+    hacen una vez y se reconecta solo si el servidor cerró la sesión.
+    """
+
+    def __init__(self, server, port, sender, password=None, use_tls=True, timeout=SMTP_TIMEOUT):
+        self.server = server
+        self.port = port
+        self.sender = sender
+        self.password = password
+        self.use_tls = use_tls
+        self.timeout = timeout
+        self._smtp = None
+        self._last_used = 0.0
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        smtp = smtplib.SMTP(self.server, self.port, timeout=self.timeout)
+        try:
+            smtp.ehlo()
+            if self.use_tls:
+                # Sin STARTTLS no se continúa: la contraseña nunca viaja en claro.
+                # starttls() lanza SMTPNotSupportedError si el servidor no lo ofrece
+                smtp.starttls()  # Establecer conexión segura
+                smtp.ehlo()
+                if self.password:
+                    smtp.login(self.sender, self.password)
+        except Exception:
+            smtp.close()
+            raise
+        return smtp
+
+    def _alive(self):
+        if self._smtp is None:
+            return False
+        if time.monotonic() - self._last_used < IDLE_TIMEOUT:
+            return True
+        try:
+            return self._smtp.noop()[0] == 250
+        except smtplib.SMTPException:
+            return False
+        except OSError:
+            return False
+
+    def send(self, msg, to_addrs):
+        with self._lock:
+            for attempt in range(2):
+                if not self._alive():
+                    self._close()
+                    self._smtp = self._connect()
+                try:
+                    refused = self._smtp.send_message(msg, from_addr=self.sender, to_addrs=to_addrs)
+                    self._last_used = time.monotonic()
+                    return refused
+                except (smtplib.SMTPServerDisconnected, OSError):
+                    # La sesión caducó en el servidor: reconectar una vez
+                    self._close()
+                    if attempt:
+                        raise
+
+    def _close(self):
+        if self._smtp is not None:
+            try:
+                self._smtp.quit()
+            except Exception:
+                pass
+            self._smtp = None
+
+    def close(self):
+        with self._lock:
+            self._close()
+
+
+def build_message(sender, recipients, subject, html_content):
+    msg = MIMEMultipart('alternative')
+    msg['Subject'] = subject
+    msg['From'] = sender
+    msg['To'] = ", ".join(recipients)
+    # utf-8 (base64): líneas cortas aunque el HTML venga en una sola línea
+    msg.attach(MIMEText(html_content, 'html', 'utf-8'))
+    return msg
+
+
+class EmailJob:
+    """
+    Un envío encolado. `html_content` puede ser el HTML ya hecho o una función
+    que lo genera; en ese caso se llama desde el hilo del outbox (estado 'preparing').
+    """
+
+    def __init__(self, recipients, subject, html_content, per_recipient=False, batch_size=BATCH_SIZE):
+        self.id = uuid.uuid4().hex[:12]
+        self.subject = subject
+        self.html_content = html_content
+        self.recipients = list(recipients)
+        # Un mensaje por destinatario o tandas de `batch_size` destinatarios por mensaje
+        size = 1 if per_recipient else max(1, batch_size)
+        self.batches = [self.recipients[i:i + size] for i in range(0, len(self.recipients), size)]
+        self.status = 'queued'
+        self.sent = 0
+        self.attempts = 0
+        self.error = None
+        self.done = threading.Event()
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'status': self.status,
+            'recipients': len(self.recipients),
+            'sent': self.sent,
+            'attempts': self.attempts,
+            'error': self.error,
+        }
+
+
+class EmailOutbox:
+    """
+    Cola de envíos en segundo plano: enqueue() devuelve al momento un id de
+    trabajo y un hilo los entrega por una conexión SMTP persistente, por tandas
+    y con reintentos. El estado se consulta con status(job_id).
+    """
+
+    def __init__(self, connection):
+        self.connection = connection
+        self._queue = queue.PriorityQueue()
+        self._jobs = {}
+        self._order = itertools.count()
+        self._lock = threading.Lock()
+        self._worker = threading.Thread(target=self._run, name='email-outbox', daemon=True)
+        self._worker.start()
+
+    def enqueue(self, recipients, subject, html_content, per_recipient=False, batch_size=BATCH_SIZE):
+        job = EmailJob(recipients, subject, html_content, per_recipient, batch_size)
+        with self._lock:
+            self._forget_finished()
+            self._jobs[job.id] = job
+        self._queue.put((0.0, next(self._order), job))
+        return job.id
+
+    def _forget_finished(self):
+        finished = [job_id for job_id, job in self._jobs.items() if job.done.is_set()]
+        for job_id in finished[:max(0, len(finished) - MAX_TRACKED_JOBS)]:
+            del self._jobs[job_id]
+
+    def status(self, job_id):
+        with self._lock:
+            job = self._jobs.get(job_id)
+        return job.to_dict() if job else None
+
+    def wait(self, job_id, timeout=None):
+        """Espera a que el trabajo termine (enviado o fallido) y devuelve su estado"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is None:
+            return None
+        job.done.wait(timeout)
+        return job.to_dict()
+
+    def _run(self):
+        while True:
+            not_before, order, job = self._queue.get()
+            delay = not_before - time.monotonic()
+            if delay > 0:
+                # Aún no toca reintentar: devolverlo a la cola y esperar un poco
+                self._queue.put((not_before, order, job))
+                time.sleep(min(delay, 0.5))
+                continue
+            self._deliver(job)
+
+    def _deliver(self, job):
+        job.attempts += 1
+        try:
+            if callable(job.html_content):
+                # Informe aún por preparar (resúmenes, plantilla): se hace aquí y
+                # no en quien lo encoló
+                job.status = 'preparing'
+                job.html_content = job.html_content()
+            job.status = 'sending'
+            # Las tandas ya entregadas no se repiten en los reintentos
+            while job.batches:
+                batch = job.batches[0]
+                msg = build_message(self.connection.sender, batch, job.subject, job.html_content)
+                self.connection.send(msg, batch)
+                job.batches.pop(0)
+                job.sent += len(batch)
+        except Exception as e:
+            job.error = str(e)
+            print(f"Error al enviar correo (trabajo {job.id}, intento {job.attempts}): {job.error}")
+            if job.attempts < MAX_ATTEMPTS:
+                job.status = 'retrying'
+                retry_at = time.monotonic() + RETRY_DELAY * (2 ** (job.attempts - 1))
+                self._queue.put((retry_at, next(self._order), job))
+            else:
+                job.status = 'failed'
+                job.done.set()
+            return
+        job.status = 'sent'
+        job.error = None
+        job.done.set()
+
+
+_outboxes = {}
+_outboxes_lock = threading.Lock()
+
+
+def get_outbox(server, port, sender, password=None, use_tls=True):
+    """Outbox (y conexión SMTP) compartido por todo el proceso para esta cuenta"""
+    key = (server, port, sender, password, use_tls)
+    with _outboxes_lock:
+        outbox = _outboxes.get(key)
+        if outbox is None:
+            outbox = _outboxes[key] = EmailOutbox(SmtpConnection(server, port, sender, password, use_tls))
+        return outbox
@@ -1,24 +1,90 @@
-import smtplib
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
 from datetime import datetime
+import os
 import re
-import streamlit as st
-from src.summarizer.openai_summarizer import OpenAISummarizer
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+from src.summarizer.backends import create_summarizer
+from src.summarizer.summarizer_base import is_summary_error
+from src.utils.article_store import get_article_store
+from src.utils.email_delivery import get_outbox
+from src.utils.settings import get_setting
 
-def send_email_report(recipient_emails, articles, keywords_text):
+MAX_REPORT_ARTICLES = 20
+TEMPLATES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'templates')
+
+# La plantilla se compila una sola vez al importar el módulo
+_environment = Environment(
+    loader=FileSystemLoader(TEMPLATES_DIR),
+    autoescape=select_autoescape(['html']),
+    trim_blocks=True,
+    lstrip_blocks=True,
+)
+REPORT_TEMPLATE = _environment.get_template('email_report.html')
+
+# Outbox de cada trabajo encolado, para consultar su estado. Se olvidan los
+# trabajos que el propio outbox ya dejó de conservar
+_job_outboxes = {}
+
+
+def _forget_jobs():
+    for job_id, outbox in list(_job_outboxes.items()):
+        if outbox.status(job_id) is None:
+            del _job_outboxes[job_id]
+
+
+def report_summaries(articles, summaries=None):
+    """
+    Resumen de cada artículo del informe, reutilizando lo ya generado: primero
+    `summaries` ({link: resumen}, p. ej. los que ya mostró la interfaz), luego el
+    propio artículo y el almacén local. Solo se piden al summarizer los que falten,
+    y esos salen de su caché si ya se resumieron antes.
     """
-    Envía un informe por correo electrónico con los artículos encontrados
+    found = dict(summaries or {})
+    for article in articles:
+        if article.get('summary') and not found.get(article['link']):
+            found[article['link']] = article['summary']
+
+    missing = [article for article in articles if not found.get(article['link'])]
+    if missing:
+        try:
+            found.update(get_article_store().summaries([article['link'] for article in missing]))
+        except Exception as e:
+            print(f"Error reading summaries from store: {str(e)}")
+        missing = [article for article in articles if not found.get(article['link'])]
+
+    if missing:
+        generated = create_summarizer().summarize_many([article['text'] for article in missing])
+        for article, summary in zip(missing, generated):
+            found[article['link']] = summary
+
+    return [None if is_summary_error(found.get(article['link'])) else found[article['link']] for article in articles]
+
+
+def render_report(articles, summaries, today_date, total_articles=None):
+    """HTML del informe en una sola pasada con la plantilla precompilada"""
+    return REPORT_TEMPLATE.render(
+        articles=[{'article': article, 'summary': summary} for article, summary in zip(articles, summaries)],
+        today_date=today_date,
+        total_articles=len(articles) if total_articles is None else total_articles,
+    )
+
+
+def queue_email_report(recipient_emails, articles, keywords_text, summaries=None, per_recipient=False):
+    """
+    Deja el informe en la cola de envío en segundo plano y vuelve al momento:
+    los resúmenes que falten y el HTML se generan en el hilo del outbox.
+    Devuelve (éxito, mensaje, id del trabajo); el estado del envío se consulta
+    con email_job_status(). `summaries` ({link: resumen}) evita volver a
+    resumir lo que ya se mostró
     """
     try:
         # Configuración del servidor de correo
-        smtp_server = st.secrets.get("EMAIL_SERVER", "smtp.gmail.com")
-        smtp_port = int(st.secrets.get("EMAIL_PORT", 587))
-        sender_email = st.secrets.get("EMAIL_SENDER")
-        password = st.secrets.get("EMAIL_PASSWORD")
+        smtp_server = get_setting("EMAIL_SERVER", "smtp.gmail.com")
+        smtp_port = int(get_setting("EMAIL_PORT", 587))
+        sender_email = get_setting("EMAIL_SENDER")
+        password = get_setting("EMAIL_PASSWORD")
         
         if not sender_email or not password:
-            return False, "Falta configuración de correo electrónico en los secretos de la aplicación."
+            return False, "Falta configuración de correo electrónico en los secretos de la aplicación.", None
             
         # Validar direcciones de correo
         valid_emails = []
@@ -33,238 +99,55 @@ def send_email_report(recipient_emails, articles, keywords_text):
                 invalid_emails.append(email)
         
         if not valid_emails:
-            return False, "No se proporcionaron direcciones de correo válidas."
+            return False, "No se proporcionaron direcciones de correo válidas.", None
             
         # Fecha actual para el asunto
         today_date = datetime.now().strftime("%d/%m/%Y")
+        subject = f'Informe de Noticias Mineras México - {today_date}'
         
-        # Crear mensaje
-        msg = MIMEMultipart('alternative')
-        msg['Subject'] = f'Informe de Noticias Mineras México - {today_date}'
-        msg['From'] = sender_email
-        msg['To'] = ", ".join(valid_emails)
-        
-        # Crear versión HTML del correo
-        html_content = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <style>
-                body {{
-                    font-family: Arial, sans-serif;
-                    line-height: 1.6;
-                    color: #333;
-                }}
-                .header {{
-                    background-color: #fc6603;
-                    color: white;
-                    padding: 20px;
-                    text-align: center;
-                    border-radius: 5px 5px 0 0;
-                }}
-                .container {{
-                    max-width: 800px;
-                    margin: 0 auto;
-                    border: 1px solid #eee;
-                    border-radius: 5px;
-                }}
-                .content {{
-                    padding: 20px;
-                }}
-                .article {{
-                    margin-bottom: 30px;
-                    border-left: 4px solid #C99D45;
-                    padding-left: 15px;
-                }}
-                .article h3 {{
-                    margin: 0 0 10px 0;
-                    color: #303030;
-                }}
-                .article-link {{
-                    color: #fc6603;
-                    text-decoration: none;
-                }}
-                .article-link:hover {{
-                    text-decoration: underline;
-                }}
-                .summary {{
-                    background-color: #f9f9f9;
-                    padding: 15px;
-                    border-radius: 5px;
-                    margin-top: 10px;
-                }}
-                .footer {{
-                    background-color: #f5f5f5;
-                    padding: 15px;
-                    text-align: center;
-                    font-size: 12px;
-                    color: #666;
-                    border-radius: 0 0 5px 5px;
-                }}
-                .keywords {{
-                    background-color: #f5f5f5;
-                    padding: 10px 15px;
-                    margin-bottom: 20px;
-                    border-radius: 5px;
-                    font-style: italic;
-                    color: #666;
-                }}
-                .highlighted {{
-                    color: #C99D45;
-                    font-weight: bold;
-                }}
-                .article-image {{
-                    width: 100%;
-                    max-height: 250px;
-                    object-fit: cover;
-                    border-radius: 5px;
-                    margin: 10px 0;
-                }}
-                .image-container {{
-                    width: 100%;
-                    height: auto;
-                    max-height: 250px;
-                    overflow: hidden;
-                    border-radius: 5px;
-                    margin: 10px 0;
-                    text-align: center;
-                    background-color: #f8f8f8;
-                    position: relative;
-                }}
-                .no-image {{
-                    padding: 15px;
-                    background-color: #f8f8f8;
-                    text-align: center;
-                    color: #999;
-                    font-style: italic;
-                    border-radius: 5px;
-                    margin: 10px 0;
-                }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <div class="header">
-                    <h1>Noticias Mineras México</h1>
-                    <p>Informe generado el {today_date}</p>
-                </div>
-                <div class="content">
-                    <p>A continuación se presenta un resumen de las últimas noticias relevantes para el sector minero en México: </p>
-                    
-                    <h2>Artículos ({len(articles)})</h2>
-                    <p> Solo se mostrarán los primeros 20</p
-        """
-        
-        # Crear el objeto summarizer
-        summarizer = OpenAISummarizer()
-        
-        # Añadir artículos (máximo 10 para no hacer el correo demasiado grande)
-        for i, article in enumerate(articles[:20]):
-            try:
-                summary = summarizer.summarize(article['text'])
-                
-                # Iniciar el HTML del artículo
-                article_html = f"""
-                <div class="article">
-                    <h3>{i+1}. {article['title']}</h3>
-                """
-                
-                # Añadir imagen si está disponible
-                if article.get('image') and article['image'].get('url'):
-                    img_url = article['image']['url']
-                    img_alt = article['image'].get('alt', article['title'])
-                    
-                    # Verificar que la URL de la imagen sea válida
-                    if img_url and img_url.strip():
-                        article_html += f"""
-                        <div class="image-container">
-                            <img src="{img_url}" alt="{img_alt}" class="article-image">
-                        </div>
-                        """
-                
-                fecha_display = article.get('formatted_date', article.get('date', ''))
-                if fecha_display:
-                    article_html += f"""
-                    <h3>{i+1}. {article['title']}</h3>
-                    <p style="margin-top: -5px; font-size: 0.85em; color: #666;">
-                        <em>Publicado: {fecha_display}</em>
-                    </p>
-                    """
-                else:
-                    article_html += f"""
-                    <h3>{i+1}. {article['title']}</h3>
-                    """
-                
-                # Añadir enlace y resumen
-                article_html += f"""
-                    <p><a href="{article['link']}" class="article-link">Ver artículo original</a></p>
-                    <div class="summary">
-                        <p><span class="highlighted">Resumen:</span> {summary}</p>
-                    </div>
-                </div>
-                """
-                
-                # Añadir el artículo al contenido HTML
-                html_content += article_html
-                
-            except Exception as e:
-                print(f"Error al procesar artículo para correo: {str(e)}")
-                # Añadir el artículo sin resumen
-                html_content += f"""
-                <div class="article">
-                    <h3>{i+1}. {article['title']}</h3>
-                """
-                
-                # Añadir imagen si está disponible (incluso para artículos con error)
-                if article.get('image') and article['image'].get('url'):
-                    img_url = article['image']['url']
-                    img_alt = article['image'].get('alt', article['title'])
-                    
-                    # Verificar que la URL de la imagen sea válida
-                    if img_url and img_url.strip():
-                        html_content += f"""
-                        <div class="image-container">
-                            <img src="{img_url}" alt="{img_alt}" class="article-image">
-                        </div>
-                        """
-                
-                # Completar el HTML del artículo
-                html_content += f"""
-                    <p><a href="{article['link']}" class="article-link">Ver artículo original</a></p>
-                    <div class="summary">
-                        <p><span class="highlighted">Nota:</span> No se pudo generar un resumen para este artículo.</p>
-                    </div>
-                </div>
-                """
-        
-        # Añadir pie de correo
-        html_content += """
-                    <p>Para ver más detalles y acceder a todos los artículos, visite la plataforma completa.</p>
-                </div>
-                <div class="footer">
-                    <p>Este es un correo automatizado. Por favor, no responda a este mensaje.</p>
-                    <p>© 2025 Monitor de Noticias Mineras México</p>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
-        
-        # Adjuntar contenido HTML al mensaje
-        msg.attach(MIMEText(html_content, 'html'))
+        # Versión HTML del correo (máximo 20 artículos para no hacer el correo demasiado grande),
+        # generada ya en segundo plano
+        report_articles = list(articles[:MAX_REPORT_ARTICLES])
+        total_articles = len(articles)
+        summaries = dict(summaries or {})
+
+        def html_content():
+            return render_report(report_articles, report_summaries(report_articles, summaries),
+                                 today_date, total_articles=total_articles)
         
-        # Conectar al servidor SMTP y enviar el correo
-        with smtplib.SMTP(smtp_server, smtp_port) as server:
-            server.starttls()  # Establecer conexión segura
-            server.login(sender_email, password)
-            server.send_message(msg)
+        # Entregar en segundo plano por la conexión SMTP compartida
+        outbox = get_outbox(smtp_server, smtp_port, sender_email, password)
+        job_id = outbox.enqueue(valid_emails, subject, html_content, per_recipient=per_recipient)
+        _forget_jobs()
+        _job_outboxes[job_id] = outbox
         
-        # Mensaje de éxito
-        success_message = f"Informe enviado correctamente a {len(valid_emails)} destinatarios."
+        message = f"Informe en cola para {len(valid_emails)} destinatarios (trabajo {job_id})."
         if invalid_emails:
-            success_message += f" Se omitieron {len(invalid_emails)} direcciones inválidas: {', '.join(invalid_emails)}"
+            message += f" Se omitieron {len(invalid_emails)} direcciones inválidas: {', '.join(invalid_emails)}"
             
-        return True, success_message
+        return True, message, job_id
         
     except Exception as e:
-        return False, f"Error al enviar correo: {str(e)}"
\ No newline at end of file
+        return False, f"Error al enviar correo: {str(e)}", None
+
+
+def email_job_status(job_id):
+    """Estado de un envío: dict con 'status' ('queued', 'preparing', 'sending', 'retrying', 'sent', 'failed'), 'sent', 'error'..."""
+    outbox = _job_outboxes.get(job_id)
+    return outbox.status(job_id) if outbox else None
+
+
+def send_email_report(recipient_emails, articles, keywords_text, summaries=None, per_recipient=False, timeout=None):
+    """
+    Envía un informe por correo electrónico con los artículos encontrados y
+    espera a que se entregue (para usos sin interfaz)
+    """
+    success, message, job_id = queue_email_report(recipient_emails, articles, keywords_text, summaries, per_recipient)
+    if not success:
+        return False, message
+    status = _job_outboxes[job_id].wait(job_id, timeout)
+    if status['status'] == 'sent':
+        return True, f"Informe enviado correctamente a {status['sent']} destinatarios."
+    if status['status'] == 'failed':
+        return False, f"Error al enviar correo: {status['error']}"
+    return True, message
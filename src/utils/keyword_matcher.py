@@ -0,0 +1,99 @@
+from collections import deque
+from functools import lru_cache
+
+
+def normalize_keywords(keywords):
+    """Acepta 'oro, cobre' o ['oro', ' cobre'] y devuelve una tupla sin vacíos ni duplicados"""
+    if isinstance(keywords, str):
+        keywords = keywords.split(',')
+    normalized = []
+    for keyword in keywords or ():
+        keyword = keyword.lower().strip()
+        if keyword and keyword not in normalized:
+            normalized.append(keyword)
+    return tuple(normalized)
+
+
+class KeywordMatcher:
+    """
+    Autómata Aho-Corasick sobre las palabras clave: encuentra todas las que
+    aparecen en un texto recorriéndolo una sola vez, sin importar cuántas sean.
+    La comparación es por subcadena y sin distinguir mayúsculas, igual que
+    `keyword.lower() in text.lower()`.
+    """
+
+    def __init__(self, keywords):
+        self.keywords = normalize_keywords(keywords)
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [()]
+        self._build()
+
+    def _build(self):
+        # Trie con todas las palabras clave
+        for index, keyword in enumerate(self.keywords):
+            state = 0
+            for char in keyword:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append(())
+                state = next_state
+            self._output[state] += (index,)
+
+        # Enlaces de fallo en anchura; cada estado hereda las salidas de su enlace
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                self._output[next_state] += self._output[self._fail[next_state]]
+
+    def _states(self, text):
+        goto, fail = self._goto, self._fail
+        state = 0
+        for char in text.lower():
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            yield state
+
+    def search(self, text):
+        """True si el texto contiene alguna palabra clave (True si no hay palabras clave)"""
+        if not self.keywords:
+            return True
+        if not text:
+            return False
+        output = self._output
+        for state in self._states(text):
+            if output[state]:
+                return True
+        return False
+
+    def find(self, text):
+        """Palabras clave presentes en el texto, en el orden en que aparecen"""
+        if not text or not self.keywords:
+            return []
+        found = {}
+        output = self._output
+        for state in self._states(text):
+            for index in output[state]:
+                found.setdefault(index, None)
+        return [self.keywords[index] for index in found]
+
+
+@lru_cache(maxsize=32)
+def _compile(keywords):
+    return KeywordMatcher(keywords)
+
+
+def get_matcher(keywords):
+    """Matcher compilado para este conjunto de palabras clave (compartido entre scrapers)"""
+    return _compile(normalize_keywords(keywords))
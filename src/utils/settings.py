@@ -0,0 +1,32 @@
+import os
+
+try:
+    from dotenv import load_dotenv
+except ImportError:
+    load_dotenv = None
+
+# Variables de un .env en el directorio de trabajo, sin pisar las del entorno
+if load_dotenv is not None:
+    load_dotenv(override=False)
+
+
+def _secret(name):
+    """Valor de st.secrets, o None si no hay Streamlit o no hay secrets.toml"""
+    try:
+        import streamlit as st
+        return st.secrets.get(name)
+    except Exception:
+        return None
+
+
+def get_setting(name, default=None):
+    """
+    Configuración de la aplicación: primero variables de entorno (o .env) y
+    después los secretos de Streamlit, para que el código funcione igual dentro
+    y fuera de la app
+    """
+    value = os.environ.get(name)
+    if value not in (None, ''):
+        return value
+    value = _secret(name)
+    return default if value in (None, '') else value
@@ -11,4 +11,29 @@ def format_article(article):
 def extract_keywords(text, keywords):
     # Extract keywords from the text
     extracted_keywords = [word for word in keywords if word in text]
-    return extracted_keywords
\ No newline at end of file
+    return extracted_keywords
+
+def deduplicate_articles(articles_list):
+    """
+    Elimina artículos duplicados basados en el título
+    Preserva el primer artículo encontrado con cada título
+    """
+    unique_articles = []
+    seen_titles = set()
+    
+    # Itera por la lista de artículos
+    for article in articles_list:
+        # Normaliza el título (minúsculas, sin espacios extra)
+        title = article['title'].lower().strip()
+        
+        # Si este título no ha sido visto antes, agrégalo
+        if title not in seen_titles:
+            seen_titles.add(title)
+            unique_articles.append(article)
+            
+    # Reporta cuántos duplicados se eliminaron
+    duplicates_removed = len(articles_list) - len(unique_articles)
+    if duplicates_removed > 0:
+        print(f"Se eliminaron {duplicates_removed} artículos duplicados")
+        
+    return unique_articles
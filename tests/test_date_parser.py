@@ -0,0 +1,29 @@
+from datetime import datetime, timezone
+
+from src.utils.date_parser import find_date, parse_date
+
+
+def test_iso_timestamp_keeps_time_and_zone():
+    parsed = parse_date("2025-04-14T10:00:00Z")
+    assert parsed['formatted'] == "14/04/2025"
+    assert parsed['timestamp'] == datetime(2025, 4, 14, 10, tzinfo=timezone.utc).timestamp()
+
+
+def test_iso_timestamp_with_offset():
+    parsed = parse_date("2025-04-14T10:00:00-06:00")
+    assert parsed['timestamp'] == datetime(2025, 4, 14, 16, tzinfo=timezone.utc).timestamp()
+
+
+def test_same_day_articles_sort_by_time():
+    morning = parse_date("2025-04-14T08:15:00Z")['timestamp']
+    evening = parse_date("2025-04-14T19:40:00Z")['timestamp']
+    midnight = parse_date("2025-04-14")['timestamp']
+    assert midnight < morning < evening
+
+
+def test_find_date_returns_full_iso_fragment():
+    assert find_date("Publicado el 2025-04-14T10:00:00Z por Redacción") == "2025-04-14T10:00:00Z"
+
+
+def test_spanish_long_date():
+    assert parse_date("14 de abril de 2025")['formatted'] == "14/04/2025"
@@ -0,0 +1,103 @@
+import email
+import smtplib
+import socket
+
+import pytest
+
+pytest.importorskip("aiosmtpd")
+from aiosmtpd.controller import Controller
+
+from src.utils import email_delivery
+from src.utils.email_delivery import EmailOutbox, SmtpConnection
+
+SENDER = 'informes@example.com'
+
+
+class RecordingHandler:
+    def __init__(self, reject=False):
+        self.reject = reject
+        self.messages = []
+
+    async def handle_DATA(self, server, session, envelope):
+        if self.reject:
+            return '554 Mensaje rechazado'
+        self.messages.append(envelope)
+        return '250 OK'
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def smtp_server():
+    servers = []
+
+    def start(reject=False):
+        handler = RecordingHandler(reject)
+        controller = Controller(handler, hostname='127.0.0.1', port=free_port())
+        controller.start()
+        servers.append(controller)
+        return handler, controller.port
+
+    yield start
+    for controller in servers:
+        controller.stop()
+
+
+@pytest.fixture(autouse=True)
+def no_retry_delay(monkeypatch):
+    monkeypatch.setattr(email_delivery, 'RETRY_DELAY', 0.0)
+
+
+def test_job_goes_from_queued_to_sent(smtp_server):
+    handler, port = smtp_server()
+    outbox = EmailOutbox(SmtpConnection('127.0.0.1', port, SENDER, use_tls=False))
+    recipients = [f'usuario{i}@example.com' for i in range(5)]
+
+    job_id = outbox.enqueue(recipients, 'Informe', '<p>Hola</p>', batch_size=2)
+    assert outbox.status(job_id)['status'] in ('queued', 'sending', 'sent')
+
+    status = outbox.wait(job_id, timeout=10)
+    assert status['status'] == 'sent'
+    assert status['sent'] == 5
+    assert status['attempts'] == 1
+    assert status['error'] is None
+    assert [len(message.rcpt_tos) for message in handler.messages] == [2, 2, 1]
+
+
+def test_html_is_built_in_the_outbox(smtp_server):
+    handler, port = smtp_server()
+    outbox = EmailOutbox(SmtpConnection('127.0.0.1', port, SENDER, use_tls=False))
+
+    job_id = outbox.enqueue(['gerente@example.com'], 'Informe', lambda: '<p>Informe preparado</p>')
+
+    assert outbox.wait(job_id, timeout=10)['status'] == 'sent'
+    message = email.message_from_bytes(handler.messages[0].original_content)
+    html_part = next(part for part in message.walk() if part.get_content_type() == 'text/html')
+    assert 'Informe preparado' in html_part.get_payload(decode=True).decode('utf-8')
+
+
+def test_rejected_job_retries_then_fails(smtp_server):
+    handler, port = smtp_server(reject=True)
+    outbox = EmailOutbox(SmtpConnection('127.0.0.1', port, SENDER, use_tls=False))
+
+    job_id = outbox.enqueue(['gerente@example.com'], 'Informe', '<p>Hola</p>')
+
+    status = outbox.wait(job_id, timeout=10)
+    assert status['status'] == 'failed'
+    assert status['attempts'] == email_delivery.MAX_ATTEMPTS
+    assert status['sent'] == 0
+    assert '554' in status['error']
+
+
+def test_login_requires_starttls(smtp_server):
+    handler, port = smtp_server()
+    connection = SmtpConnection('127.0.0.1', port, SENDER, password='secreto', use_tls=True)
+
+    with pytest.raises(smtplib.SMTPNotSupportedError):
+        connection.send(email_delivery.build_message(SENDER, ['a@example.com'], 'Informe', '<p>Hola</p>'),
+                        ['a@example.com'])
+    assert handler.messages == []
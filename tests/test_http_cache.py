@@ -0,0 +1,31 @@
+import os
+import time
+
+from src.scrapers.http_cache import HttpCache
+
+
+def test_prune_removes_only_old_entries(tmp_path):
+    cache = HttpCache(str(tmp_path), max_age=0)
+    cache.put('https://ejemplo.mx/vieja', '<p>Vieja</p>')
+    cache.put('https://ejemplo.mx/nueva', '<p>Nueva</p>')
+    meta_path, body_path = cache._paths('https://ejemplo.mx/vieja')
+    old = time.time() - 3600
+    os.utime(meta_path, (old, old))
+
+    assert cache.prune(time.time() - 60) == 1
+    assert cache.get('https://ejemplo.mx/vieja') is None
+    assert not os.path.exists(body_path)
+    assert cache.get('https://ejemplo.mx/nueva')['body'] == '<p>Nueva</p>'
+
+
+def test_revalidated_entries_are_kept(tmp_path):
+    cache = HttpCache(str(tmp_path), max_age=0)
+    entry = cache.put('https://ejemplo.mx/listado', '<p>Listado</p>', etag='"v1"')
+    meta_path, _ = cache._paths('https://ejemplo.mx/listado')
+    old = time.time() - 3600
+    os.utime(meta_path, (old, old))
+
+    cache.touch('https://ejemplo.mx/listado', entry)
+
+    assert cache.prune(time.time() - 60) == 0
+    assert cache.get('https://ejemplo.mx/listado')['etag'] == '"v1"'
@@ -0,0 +1,9 @@
+from src.scrapers.parsers import fragment_text
+
+
+def test_inline_tags_do_not_split_words():
+    assert fragment_text('Mi<b>ne</b>ría en <a href="/sonora">Sonora</a>') == "Minería en Sonora"
+
+
+def test_block_tags_separate_words():
+    assert fragment_text('<p>Oro</p><p>Plata</p>Cobre<br/>Zinc &amp; plomo') == "Oro Plata Cobre Zinc & plomo"
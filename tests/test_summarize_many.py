@@ -0,0 +1,125 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+pytest.importorskip("openai")
+
+from src.summarizer.openai_summarizer import OpenAISummarizer
+from src.summarizer.rate_scheduler import RequestScheduler
+from src.summarizer.summarizer_base import ERROR_PREFIX
+
+LATENCY = 0.05
+
+
+class StubState:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.requests = 0
+        self.rate_limited = set()
+
+
+def make_handler(state):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_POST(self):
+            request = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+            # El "resumen" es la última línea del prompt: así se comprueba el orden
+            note = request['messages'][-1]['content'].splitlines()[-1]
+            with state.lock:
+                state.requests += 1
+                state.in_flight += 1
+                state.max_in_flight = max(state.max_in_flight, state.in_flight)
+            try:
+                time.sleep(LATENCY)
+            finally:
+                with state.lock:
+                    state.in_flight -= 1
+
+            if 'FALLA' in note:
+                self.reply(400, {'error': {'message': 'Petición inválida', 'type': 'invalid_request_error'}})
+            elif 'LIMITE' in note and note not in state.rate_limited:
+                state.rate_limited.add(note)
+                self.reply(429, {'error': {'message': 'Rate limit', 'type': 'rate_limit_error'}},
+                           {'retry-after-ms': '10'})
+            else:
+                self.reply(200, {
+                    'id': 'chatcmpl-stub',
+                    'object': 'chat.completion',
+                    'created': int(time.time()),
+                    'model': request['model'],
+                    'choices': [{
+                        'index': 0,
+                        'finish_reason': 'stop',
+                        'message': {'role': 'assistant', 'content': note},
+                    }],
+                    'usage': {'prompt_tokens': 0, 'completion_tokens': 0, 'total_tokens': 0},
+                })
+
+        def reply(self, status, payload, headers=None):
+            body = json.dumps(payload).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+@pytest.fixture
+def stub():
+    state = StubState()
+    server = ThreadingHTTPServer(('127.0.0.1', 0), make_handler(state))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield state, f"http://127.0.0.1:{server.server_address[1]}/v1"
+    server.shutdown()
+
+
+def make_summarizer(base_url, max_in_flight):
+    # Sin caché y con un scheduler propio: cada llamada llega al servidor
+    return OpenAISummarizer(use_cache=False, max_in_flight=max_in_flight, api_key='stub',
+                            base_url=base_url, scheduler=RequestScheduler())
+
+
+def article(note):
+    return f"La minera anunció una nueva inversión en su proyecto de oro.\n{note}"
+
+
+def test_results_keep_input_order(stub):
+    state, base_url = stub
+    notes = [f"Nota {i}" for i in range(12)]
+
+    summaries = make_summarizer(base_url, 4).summarize_many([article(note) for note in notes])
+
+    assert summaries == notes
+    assert state.requests == len(notes)
+
+
+def test_requests_in_flight_are_limited(stub):
+    state, base_url = stub
+
+    make_summarizer(base_url, 3).summarize_many([article(f"Nota {i}") for i in range(12)])
+
+    assert 1 < state.max_in_flight <= 3
+
+
+def test_one_failure_does_not_affect_the_rest(stub):
+    state, base_url = stub
+    notes = ["Nota 0", "Nota 1 FALLA", "Nota 2", "Nota 3 LIMITE", "Nota 4"]
+
+    summaries = make_summarizer(base_url, 4).summarize_many([article(note) for note in notes])
+
+    assert summaries[1].startswith(ERROR_PREFIX)
+    # El 429 se reintenta y acaba con el resumen correcto
+    assert [summaries[i] for i in (0, 2, 3, 4)] == ["Nota 0", "Nota 2", "Nota 3 LIMITE", "Nota 4"]